@@ -56,6 +56,10 @@ SW_PROF_PATH = '%s/src/profiles' % SW_FWK_PATH
 SW_TEST_PATH = '%s/src/tests' % SW_FWK_PATH
 SW_LOGS_PATH = '%s/output/logs' % SW_FWK_PATH
 SW_BACKUP_PATH = '%s/output/backups' % SW_FWK_PATH
+SW_CACHE_PATH = '%s/output/cache' % SW_FWK_PATH
+SW_PLAN_PATH = '%s/plans' % SW_CACHE_PATH
+SW_HASH_PATH = '%s/hashes' % SW_CACHE_PATH
+SW_RESULTS_DB = '%s/output/results.sqlite' % SW_FWK_PATH
 SW_TEMPLATES_PATH = '%s/templates' % SW_FWK_PATH
 SW_TEMP_PROF_PATH = '%s/profiles' % SW_TEMPLATES_PATH
 SW_TEMP_TEST_PATH = '%s/tests' % SW_TEMPLATES_PATH
@@ -67,8 +71,20 @@ SW_USERMODES_PATH = '%s/src/usermodes' % SW_FWK_PATH
 #Logging...
 #Log ID
 SW_TEST_ID_INIT = '000000'
+#Test ID folders in shards of logs path (e.g. logs/00/01/000123), 0 for flat
+SW_LOGS_SHARDED = 0
 #Log DEBUG msg activated
 SW_LOG_DEBUG = False
+#Log lines written by a background writer (0 to write each line at once)
+SW_LOG_BUFFER = 1
+#Lines of background writer written together at most
+SW_LOG_BUFFER_LINES = 1000
+#Seconds a line waits at most in background writer
+SW_LOG_BUFFER_SECS = 0.2
+#Log lines of background writers sent to a log collector hosted by executor
+SW_LOG_COLLECTOR = 1
+#Log files kept open by log collector
+SW_LOG_COLLECTOR_FILES = 256
 
 #==============================================================================
 
@@ -76,12 +92,88 @@ SW_LOG_DEBUG = False
 SW_TD_PROFILE = 'profile'
 SW_TD_TEST = 'test'
 SW_CUSTOM_TD = 'custom'
+SW_PLAN_TD = 'plan'
+#Test definition keys kept by tests of a profile (profile test can override them)
+SW_TD_TEST_POLICIES = ('timeout', 'fail_fast', 'max_failures')
 
 #==============================================================================
 
 #Test Cases Modes
 SW_TC_NORMAL = 'normal'
 SW_TC_CONC = 'concurrency'
+#Instances run as threads (asyncio tasks for coroutines) of one process
+SW_TC_INPROC = 'inprocess'
+
+#==============================================================================
+
+#Test Cases Launch modes
+SW_LAUNCH_POPEN = 'popen'
+SW_LAUNCH_POOL = 'pool'
+SW_LAUNCH_FORK = 'forkserver'
+
+#Pool launch mode workers (None = one per CPU)
+SW_POOL_WORKERS = None
+
+#Fixed seconds to wait after each instance launch (compatibility: 1)
+SW_LAUNCH_PACING = 0
+#Seconds to wait an instance notifies it started
+SW_READY_TIMEOUT = 10
+SW_READY_POLL_TIME = 0.05
+
+#Admission control: instances launch only if host can absorb them
+SW_ADMIT = 0
+#Max. instances running per CPU
+SW_ADMIT_INST_PER_CPU = 1
+#Max. load average per CPU not caused by running instances
+SW_ADMIT_LOAD_PER_CPU = 1.0
+#Min. memory available (kB)
+SW_ADMIT_MIN_MEM = 65536
+SW_ADMIT_POLL_TIME = 0.2
+
+#Test case instance timeout in seconds (test case 'timeout' or test
+#'timeout' override it), None for no timeout
+SW_TC_TIMEOUT = None
+#Extra seconds for protected test cases after timeout before kill them
+SW_TC_TIMEOUT_GRACE = 30
+
+#Incremental runs: test cases passed with same inputs are not run again
+SW_INCREMENTAL = 0
+#Device identity string part of test case inputs
+SW_DEVICE_ID = ''
+#Max. test cases passed kept in result cache
+SW_CACHE_MAX = 5000
+
+#Definitions are resolved from compiled index (no test module import)
+SW_DEF_INDEX = 1
+
+#Parallel runs launch test cases longest first by durations of past runs
+SW_LONGEST_FIRST = 1
+#Durations kept per test case (predicted duration is their mean)
+SW_HISTORY_SAMPLES = 10
+
+#Threads hashing files of a Test ID folder (0 for default of host)
+SW_HASH_WORKERS = 0
+#Files of Test ID folders not changed since last hash are not read again
+SW_HASH_CACHE = 1
+
+#Results of each run added to results index (SQLite) when it finishes
+SW_RESULTS_INDEX = 1
+
+#==============================================================================
+
+#Executor options (key=value list, e.g. 'launch=pool,workers=4')
+SW_OPT_LAUNCH = 'launch'
+SW_OPT_WORKERS = 'workers'
+SW_OPT_PACING = 'pacing'
+SW_OPT_JOBS = 'jobs'
+SW_OPT_CTESTS = 'ctests'
+SW_OPT_ADMIT = 'admit'
+SW_OPT_FAILFAST = 'failfast'
+SW_OPT_MAXFAIL = 'maxfail'
+SW_OPT_INCREMENTAL = 'incremental'
+SW_OPT_DEVICE = 'device'
+SW_OPT_LONGEST = 'longest'
+SW_OPT_DRYRUN = 'dryrun'
 
 #==============================================================================
 
@@ -115,12 +207,19 @@ def SW_EXECUTOR_USAGE():
     print ('\nUsage: \n \
             \n executor.py: \n \
             \n \
-            executor.py type name usermode runmode\n \
+            executor.py type name usermode runmode logdir testid options\n \
+            executor.py plan source\n \
             \n \
                         type : type of definition [ profile | test ]\n \
                         name : name of definition\n \
                         usermode : mode to run as User [ automation | interactive | gui ]\n \
                         runmode : mode to run testcases [ 0 (sequential) | 1 (parallel) ]\n \
+                        logdir : log path (optional)\n \
+                        testid : custom ID (optional)\n \
+                        options : execution options as key=value list (optional)\n \
+                                  launch=[ popen | pool | forkserver ],workers=N,pacing=secs,jobs=N,ctests=N,admit,\n \
+                                  failfast,maxfail=N,incremental,device=id,longest=[ 0 | 1 ],dryrun\n \
+                        source : execution plan JSON file, - (standard input) or content hash of plans cache\n \
             \n \
             Example: \n \
             \n \
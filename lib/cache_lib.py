@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : cache_lib.py
+#description     : Library to fingerprint test cases by their inputs and keep
+#                  a local cache of passed results (incremental runs).
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to fingerprint test cases by their inputs and keep a local cache
+of passed results (incremental runs).
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import json
+import time
+import hashlib
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+CACHE_FILE = 'results.json'
+CACHE_ENC_UTF8 = 'utf-8'
+
+#Test folders with test case inputs (besides test module)
+CACHE_TEST_DIRS = ('testlib', 'testconfig')
+
+#Test case definition fields with test case inputs
+CACHE_TC_FIELDS = ('name', 'mode', 'concurrency_inst', 'args')
+#Test case definition fields only in rerun of failed instances
+CACHE_TC_RERUN_FIELDS = ('instances', 'inst_args')
+
+#Test files hashed per test (test name: sha256)
+test_hashes = {}
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getTestHash(test_name):
+    """
+    Get hash of test module and files of its testlib and testconfig folders.
+
+    type: str
+    @param: test_name - test name
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    if test_name in test_hashes:
+        return test_hashes[test_name]
+
+    test_path = '%s/%s' % (CFG.SW_TEST_PATH, test_name)
+    files = ['%s.py' % test_name]
+    for folder in CACHE_TEST_DIRS:
+        for root, dirs, names in os.walk('%s/%s' % (test_path, folder)):
+            dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+            for name in names:
+                if not name.endswith('.pyc'):
+                    files.append(os.path.relpath(os.path.join(root, name), test_path))
+
+    sha = hashlib.sha256()
+    for name in sorted(files):
+        sha.update(name.encode(CACHE_ENC_UTF8) + b'\0')
+        try:
+            with open('%s/%s' % (test_path, name), 'rb') as f:
+                sha.update(f.read())
+        except OSError:
+            pass
+        sha.update(b'\0')
+    test_hashes[test_name] = sha.hexdigest()
+
+    return test_hashes[test_name]
+
+#==============================================================================
+
+def getFingerprint(test_name, tcase, device = ''):
+    """
+    Get fingerprint of a test case: test files, test case definition
+    (name, mode, instances, args) and device identity.
+
+    type: str
+    @param: test_name - test name
+
+    type: dictionary
+    @param: tcase - test case definition
+
+    type: str
+    @param: device - device identity string (optional)
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    test_case = dict((field, str(tcase.get(field, ''))) for field in CACHE_TC_FIELDS)
+    test_case.update((field, str(tcase[field])) for field in CACHE_TC_RERUN_FIELDS if field in tcase)
+    inputs = {
+        'test' : test_name,
+        'files' : getTestHash(test_name),
+        'test_case' : test_case,
+        'device' : device or '',
+        }
+
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode(CACHE_ENC_UTF8)).hexdigest()
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class ResultCache(object):
+    """
+    Cache of test cases passed by fingerprint. Entries keep Test ID that
+    passed test case and they are dropped oldest used first when cache is
+    bigger than size limit.
+    """
+
+    def __init__(self, cache_path = None, max_entries = None):
+        """
+        Constructor
+
+        type: str
+        @param: cache_path - cache folder (optional, CFG.SW_CACHE_PATH by default)
+
+        type: number
+        @param: max_entries - size limit (optional, CFG.SW_CACHE_MAX by default)
+        """
+
+        self.cache_path = cache_path or CFG.SW_CACHE_PATH
+        self.cache_file = '%s/%s' % (self.cache_path, CACHE_FILE)
+        self.max_entries = int(max_entries or CFG.SW_CACHE_MAX)
+        self.entries = {}
+        self.changed = {}
+        self.load()
+
+    #==========================================================================
+
+    def load(self):
+        """
+        Read cache file (empty cache if it does not exist or it is corrupted)
+        """
+
+        try:
+            with open(self.cache_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def get(self, fingerprint):
+        """
+        Get passed result of a test case fingerprint.
+
+        type: str
+        @param: fingerprint - test case fingerprint
+
+        rtype: dictionary
+        @return: cache entry (test_id, test, method, order, date), None if not cached
+        """
+
+        entry = self.entries.get(fingerprint)
+        if entry:
+            entry['used'] = time.time()
+            self.changed[fingerprint] = entry
+
+        return entry
+
+    #==========================================================================
+
+    def add(self, fingerprint, test_id, test_name, method, order, date):
+        """
+        Add a passed test case to cache.
+
+        type: str
+        @param: fingerprint - test case fingerprint
+
+        type: str
+        @param: test_id - Test ID where test case passed
+
+        type: str
+        @param: test_name - test name
+
+        type: str
+        @param: method - test case name
+
+        type: number
+        @param: order - test case order
+
+        type: str
+        @param: date - date of pass
+        """
+
+        entry = {'test_id' : test_id, 'test' : test_name, 'method' : method, 'order' : order, 'date' : date, 'used' : time.time()}
+        self.entries[fingerprint] = entry
+        self.changed[fingerprint] = entry
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def save(self):
+        """
+        Write cache file merging entries written by other runs meanwhile,
+        keeping size limit.
+        """
+
+        if not self.changed:
+            return SYS.RC_NO_ERROR
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        self.load()
+        self.entries.update(self.changed)
+        self.changed = {}
+        if len(self.entries) > self.max_entries:
+            keep = sorted(self.entries, key=lambda fp: self.entries[fp].get('used', 0), reverse=True)[:self.max_entries]
+            self.entries = dict((fp, self.entries[fp]) for fp in keep)
+
+        tmp_file = '%s.%d' % (self.cache_file, os.getpid())
+        with open(tmp_file, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def clear(self):
+        """
+        Invalidate all cache entries
+        """
+
+        self.entries = {}
+        self.changed = {}
+        try:
+            os.remove(self.cache_file)
+        except OSError:
+            pass
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def rebuild(self, log_path = None):
+        """
+        Rebuild cache from fingerprints and results in Test ID JSON reports.
+        A test case is cached if all its instances passed.
+
+        type: str
+        @param: log_path - logs path (optional, CFG.SW_LOGS_PATH by default)
+
+        rtype: number
+        @return: number of entries
+        """
+
+        log_path = log_path or CFG.SW_LOGS_PATH
+        self.clear()
+        for test_id in SYS.listTestIDs(log_path):
+            report = LOG.readJSON(log_path, test_id)
+            if not report:
+                continue
+            for test_name, fingerprints in report.get(LOG.JSON_FINGERPRINT, {}).items():
+                testcs = report.get(LOG.JSON_TEST_EXEC, {}).get(test_name, [])
+                for order, fingerprint in fingerprints.items():
+                    results = [testc for testc in testcs if str(testc['order_exec']) == str(order)]
+                    passed = [testc for testc in results if str(testc['exit_status']) == str(SYS.EXIT_NO_ERROR) and not testc.get('cached') and not testc.get('skipped')]
+                    if results and len(passed) == len(results):
+                        self.add(fingerprint, test_id, test_name, results[0]['method'], order, results[-1]['end_date'])
+        self.save()
+
+        return len(self.entries)
@@ -20,6 +20,7 @@ no overload functions inside framework.
 from lib import sys_lib as SYS
 from lib import proc_lib as PROCLIB
 from lib import log_lib as LOG
+from lib import defindex_lib as DEFIDX
 from config import config as CFG
 
 #==============================================================================
@@ -41,6 +42,10 @@ CMN_MOD_TEST = 'src.tests.%s.%s'
 CMN_TD_NOTVALID = 'Definition type is not valid'
 CMN_DEF_NOTFOUND = '[\'%s\'] %s not found'
 CMN_DEF_MODNOTFOUND = 'Module Not Found Error:'
+CMN_REPORT_NOTFOUND = 'JSON report of TEST ID [ %s ] not found in [ %s ]'
+CMN_RERUN_NOFAIL = 'TEST ID [ %s ] has no failed test cases to rerun'
+CMN_RERUN_NOTC = 'Test case [ %s ] order [ %s ] of test [ %s ] not found in definition, not rerun'
+CMN_RERUN_NOORDER = 'Test case [ %s ] of test [ %s ] has no order of execution in report, not rerun'
 
 #==============================================================================
 #================================ MAIN ========================================
@@ -97,6 +102,13 @@ def getDefinition(type_def, name):
 
     dft = []
 
+    #Compiled index: definition without import test or profile module
+    if CFG.SW_DEF_INDEX:
+        dft = DEFIDX.getIndexedDefinition(type_def, name)
+        if dft:
+            return dft
+        dft = []
+
     try:
         if type_def == CFG.SW_TD_PROFILE:
             profile_pkg = importlib.import_module(CMN_MOD_PROFILE % name)
@@ -148,6 +160,8 @@ def getMethodAttr(method, order, tdef):
                 user_args = v['args']
             else:
                 user_args = ''
+            #Executor can send arguments of its definition
+            user_args = SYS.getTestCaseArgs(user_args)
             break
 
     return ({
@@ -184,6 +198,202 @@ def isTestAbleToRun(tdef, usermode):
 
     return False
 
+#==============================================================================
+
+def getExecOptions(options):
+    """
+    Get dictionary of execution options from a key=value list string
+    (same format as test case arguments).
+
+    type: str
+    @param: options - options string (e.g. 'launch=pool,workers=4')
+
+    rtype: dictionary
+    @return: dictionary with options
+    """
+
+    opts = {}
+
+    if options:
+        for opt in options.split(','):
+            if '=' in opt:
+                key, value = opt.split('=', 1)
+            else: #Flag option without value
+                key, value = opt, '1'
+            opts[key.strip()] = value.strip()
+
+    return opts
+
+#==============================================================================
+
+def getTestReport(log_path, test_id):
+    """
+    Get JSON report of a Test ID.
+
+    type: str
+    @param: log_path - logs path
+
+    type: str
+    @param: test_id - Test ID
+
+    rtype: dictionary
+    @return: JSON report, None if it does not exist or it is not valid
+    """
+
+    return LOG.readJSON(log_path, test_id)
+
+#==============================================================================
+
+def getReportArgs(params):
+    """
+    Get test case arguments of an instance as recorded in JSON report
+
+    type: str
+    @param: params - recorded parameters (list if instance was interrupted
+                     by signal)
+
+    rtype: str
+    @return: arguments string
+    """
+
+    return ','.join(params) if isinstance(params, list) else (params or '')
+
+#==============================================================================
+
+def getInstanceNumber(tcase, conc_inst):
+    """
+    Get instance number of a test case instance: its number in rerun of
+    failed instances, index+1 otherwise.
+
+    type: dictionary
+    @param: tcase - test case definition
+
+    type: number
+    @param: conc_inst - instance index (from 0)
+
+    rtype: number
+    @return: instance number
+    """
+
+    if tcase.get('instances'):
+        return int(tcase['instances'][conc_inst])
+
+    return conc_inst+1
+
+#==============================================================================
+
+def getInstanceArgs(tcase, conc_inst):
+    """
+    Get arguments of a test case instance: its parameters in rerun of
+    failed instances, test case arguments otherwise.
+
+    type: dictionary
+    @param: tcase - test case definition
+
+    type: number
+    @param: conc_inst - instance index (from 0)
+
+    rtype: str
+    @return: arguments string
+    """
+
+    if tcase.get('inst_args'):
+        return tcase['inst_args'][conc_inst]
+
+    return tcase.get('args', '')
+
+#==============================================================================
+
+def getRerunDefinition(log_path, test_id):
+    """
+    Get definition (test or profile) to rerun failed test cases of a Test ID:
+    test cases with some instance failed, skipped, timed out or interrupted
+    by signal, with failed instances only (same numbers and parameters).
+
+    type: str
+    @param: log_path - logs path
+
+    type: str
+    @param: test_id - Test ID to rerun
+
+    rtype: dictionary
+    @return: definition, empty if nothing failed, None on error
+    """
+
+    report = getTestReport(log_path, test_id)
+    if not report:
+        print(CMN_REPORT_NOTFOUND % (test_id, log_path))
+        return None
+
+    #Failed instances by test and test case order
+    failed = {}
+    noorder = set()
+    for test_name, testcs in report.get(LOG.JSON_TEST_EXEC, {}).items():
+        for testc in testcs:
+            if str(testc.get('exit_status')) == str(SYS.EXIT_NO_ERROR):
+                continue
+            #Reports of older versions do not keep order of test cases
+            if testc.get('order_exec') is None:
+                if (test_name, testc.get('method')) not in noorder:
+                    noorder.add((test_name, testc.get('method')))
+                    print(CMN_RERUN_NOORDER % (testc.get('method'), test_name))
+                continue
+            failed.setdefault(test_name, {}).setdefault(int(testc['order_exec']), []).append(testc)
+    if not failed:
+        print(CMN_RERUN_NOFAIL % test_id)
+        return {}
+
+    tests = {}
+    for test_name, orders in failed.items():
+        tdef = getDefinition(CFG.SW_TD_TEST, test_name)
+        if not tdef:
+            return None
+        test_cases = {}
+        for order, testcs in sorted(orders.items()):
+            if order not in tdef['test_cases']:
+                print(CMN_RERUN_NOTC % (testcs[0]['method'], order, test_name))
+                continue
+            tcase = dict(tdef['test_cases'][order])
+            #Failed instances keep their number and parameters as recorded
+            insts = {}
+            for testc in testcs:
+                try:
+                    insts.setdefault(int(testc.get('concurrency_inst', 1)), testc)
+                except (TypeError, ValueError):
+                    continue
+            if not insts:
+                continue
+            tcase['instances'] = sorted(insts)
+            tcase['inst_args'] = [getReportArgs(insts[inst].get('parameters')) for inst in tcase['instances']]
+            tcase['args'] = tcase['inst_args'][0]
+            tcase['concurrency_inst'] = len(insts)
+            test_cases[order] = tcase
+        #Prerequisites passed in Test ID are not waited
+        for tcase in test_cases.values():
+            if tcase.get('depends_on'):
+                tcase['depends_on'] = [dep for dep in tcase['depends_on'] if dep in test_cases]
+        if test_cases:
+            tests[test_name] = dict(tdef, test_cases=test_cases)
+    if not tests:
+        print(CMN_RERUN_NOFAIL % test_id)
+        return {}
+
+    if LOG.JSON_PROFILE not in report:
+        rerun_def = dict(list(tests.values())[0])
+    else:
+        profile_def = getDefinition(CFG.SW_TD_PROFILE, report[LOG.JSON_PROFILE])
+        if not profile_def:
+            return None
+        #Profile with its tests that failed (nested as in automation user mode)
+        profile_tests = {}
+        for k, v in sorted(profile_def['tests'].items()):
+            if v['name'] in tests and v['name'] not in [t['name'] for t in profile_tests.values()]:
+                profile_tests[k] = dict(v, usermodes=tests[v['name']]['usermodes'], test_cases=tests[v['name']]['test_cases'])
+        rerun_def = dict(profile_def, tests=profile_tests)
+    rerun_def[LOG.JSON_RERUN] = test_id
+
+    return rerun_def
+
 #==============================================================================
 #================================ CLASSES =====================================
 #==============================================================================
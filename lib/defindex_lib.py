@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : defindex_lib.py
+#description     : Library to keep a compiled index of test and profile
+#                  definitions read from source files without import them.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to keep a compiled index of test and profile definitions read from
+source files without import them.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import ast
+import atexit
+import copy
+import pickle
+import hashlib
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+IDX_FILE = 'definitions.pickle'
+IDX_KEY = '%s:%s'
+IDX_MOD_FILE = '%s/%s.py'
+IDX_CHANGED = '%s changed in %s line %d'
+
+#Definition variable by definition type
+IDX_DEF_VARS = {CFG.SW_TD_TEST : 'test_def', CFG.SW_TD_PROFILE : 'profile_def'}
+
+#Index loaded in this process
+index = None
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getFileHash(pathfile):
+    """
+    Get hash of a file.
+
+    type: str
+    @param: pathfile - file path
+
+    rtype: str
+    @return: sha256 hex digest, None if file can not be read
+    """
+
+    try:
+        with open(pathfile, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+#==============================================================================
+
+def getDottedName(node):
+    """
+    Get name of a variable node (e.g. test_def or testLIB.test_def)
+
+    type: ast.AST
+    @param: node - syntax tree node
+
+    rtype: str
+    @return: dotted name, None if node is not a variable
+    """
+
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return '%s.%s' % (node.value.id, node.attr)
+
+    return None
+
+#==============================================================================
+
+def isChanged(node, names):
+    """
+    Check a statement run at import assigns to, subscripts or calls a method
+    of some variable (function bodies are not run at import).
+
+    type: ast.AST
+    @param: node - top level statement
+
+    type: set
+    @param: names - dotted names of variable
+
+    rtype: boolean
+    @return: True if statement can change variable
+    """
+
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+        return False
+    if isinstance(node, (ast.Subscript, ast.Attribute)) and getDottedName(node.value) in names:
+        return True
+    if isinstance(node, ast.Name) and node.id in names and isinstance(node.ctx, (ast.Store, ast.Del)):
+        return True
+    if isinstance(node, ast.Attribute) and getDottedName(node) in names and isinstance(node.ctx, (ast.Store, ast.Del)):
+        return True
+
+    return any(isChanged(child, names) for child in ast.iter_child_nodes(node))
+
+#==============================================================================
+
+def parseDefinition(pathfile, var, files = None):
+    """
+    Get definition assigned to a variable in a source file without import
+    it: literal value or variable of a framework module imported by it
+    (e.g. test_def = testLIB.test_def).
+
+    type: str
+    @param: pathfile - source file path
+
+    type: str
+    @param: var - variable name
+
+    type: list
+    @param: files - source files read (optional, files read are added)
+
+    rtype: dictionary
+    @return: definition
+
+    Raises ValueError if definition is not a literal or other statement of
+    module can change it (it needs import).
+    """
+
+    files = files if files is not None else []
+    files.append(pathfile)
+    try:
+        with open(pathfile, 'r') as f:
+            tree = ast.parse(f.read(), pathfile)
+    except (OSError, SyntaxError) as e:
+        raise ValueError(e)
+
+    aliases = {}
+    assign = None
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                aliases[alias.asname or alias.name] = '%s.%s' % (node.module, alias.name)
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+        elif isinstance(node, ast.Assign) and [t for t in node.targets if isinstance(t, ast.Name) and t.id == var] and assign is None:
+            assign = node
+
+    if assign is None:
+        raise ValueError(var)
+    value = assign.value
+    #Definition changed after it is assigned (or variable it comes from)
+    names = set([var])
+    if getDottedName(value) and '.' in getDottedName(value):
+        names.add(getDottedName(value))
+    for node in tree.body:
+        if node is not assign and isChanged(node, names):
+            raise ValueError(IDX_CHANGED % (var, pathfile, node.lineno))
+    #Variable of other framework module
+    if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name) and value.value.id in aliases:
+        module_file = IDX_MOD_FILE % (CFG.SW_FWK_PATH, aliases[value.value.id].replace('.', '/'))
+        return parseDefinition(module_file, value.attr, files)
+
+    try:
+        return ast.literal_eval(value)
+    except (TypeError, SyntaxError, RecursionError) as e:
+        raise ValueError(e)
+
+#==============================================================================
+
+def getIndexedDefinition(type_def, name):
+    """
+    Get definition from index of this process (loaded first time, entries
+    parsed meanwhile are written at exit).
+
+    type: str
+    @param: type_def - type of definition [ test | profile ]
+
+    type: str
+    @param: name - name of definition
+
+    rtype: dictionary
+    @return: definition, None if it is not in index (it needs import)
+    """
+
+    global index
+
+    if index is None:
+        index = DefinitionIndex()
+        atexit.register(index.save)
+
+    return index.get(type_def, name)
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class DefinitionIndex(object):
+    """
+    Index of definitions by type and name. Entries keep source files with
+    their mtime, size and hash. An entry is parsed again when it is requested
+    and some source file has other mtime or size and other hash.
+    """
+
+    def __init__(self, index_path = None):
+        """
+        Constructor
+
+        type: str
+        @param: index_path - index folder (optional, CFG.SW_CACHE_PATH by default)
+        """
+
+        self.index_path = index_path or CFG.SW_CACHE_PATH
+        self.index_file = '%s/%s' % (self.index_path, IDX_FILE)
+        self.entries = {}
+        self.changed = {}
+        self.load()
+
+    #==========================================================================
+
+    def load(self):
+        """
+        Read index file (empty index if it does not exist or it is corrupted)
+        """
+
+        try:
+            with open(self.index_file, 'rb') as f:
+                self.entries = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            self.entries = {}
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def get(self, type_def, name):
+        """
+        Get definition, parse it if it is not in index or it changed.
+
+        type: str
+        @param: type_def - type of definition [ test | profile ]
+
+        type: str
+        @param: name - name of definition
+
+        rtype: dictionary
+        @return: definition (a copy), None if it needs import
+        """
+
+        if type_def not in IDX_DEF_VARS:
+            return None
+
+        key = IDX_KEY % (type_def, name)
+        entry = self.entries.get(key)
+        if not entry or not self.__isValid(key, entry):
+            entry = self.__parse(type_def, name)
+            if not entry:
+                return None
+            self.entries[key] = entry
+            self.changed[key] = entry
+
+        return copy.deepcopy(entry['def'])
+
+    #==========================================================================
+
+    def save(self):
+        """
+        Write index file merging entries written by other processes meanwhile
+        """
+
+        if not self.changed:
+            return SYS.RC_NO_ERROR
+
+        try:
+            os.makedirs(self.index_path, exist_ok=True)
+            self.load()
+            self.entries.update(self.changed)
+            self.changed = {}
+            tmp_file = '%s.%d' % (self.index_file, os.getpid())
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.entries, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.index_file)
+        except OSError: #Read only framework path, index only in memory
+            self.changed = {}
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def clear(self):
+        """
+        Invalidate all index entries
+        """
+
+        self.entries = {}
+        self.changed = {}
+        try:
+            os.remove(self.index_file)
+        except OSError:
+            pass
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def rebuild(self):
+        """
+        Parse again all tests and profiles in framework path
+
+        rtype: number
+        @return: number of entries
+        """
+
+        self.clear()
+        names = [(CFG.SW_TD_TEST, name) for name in sorted(os.listdir(CFG.SW_TEST_PATH))
+                 if os.path.isfile('%s/%s/%s.py' % (CFG.SW_TEST_PATH, name, name))]
+        names += [(CFG.SW_TD_PROFILE, name[:-3]) for name in sorted(os.listdir(CFG.SW_PROF_PATH))
+                  if name.endswith('.py') and not name.startswith('__')]
+        for type_def, name in names:
+            self.get(type_def, name)
+        self.save()
+
+        return len(self.entries)
+
+    #==========================================================================
+
+    def __isValid(self, key, entry):
+        """
+        Check source files of an entry did not change
+
+        rtype: boolean
+        @return: True if entry is valid
+        """
+
+        for pathfile, (mtime, size, sha) in list(entry['files'].items()):
+            try:
+                st = os.stat(pathfile)
+            except OSError:
+                return False
+            if (st.st_mtime_ns, st.st_size) == (mtime, size):
+                continue
+            #File touched but same content
+            if getFileHash(pathfile) != sha:
+                return False
+            entry['files'][pathfile] = (st.st_mtime_ns, st.st_size, sha)
+            self.changed[key] = entry
+
+        return True
+
+    #==========================================================================
+
+    def __parse(self, type_def, name):
+        """
+        Parse definition from source files
+
+        rtype: dictionary
+        @return: index entry (definition None if it needs import), None if
+                 source file does not exist
+        """
+
+        if type_def == CFG.SW_TD_PROFILE:
+            pathfile = '%s/%s.py' % (CFG.SW_PROF_PATH, name)
+        else:
+            pathfile = '%s/%s/%s.py' % (CFG.SW_TEST_PATH, name, name)
+        if not os.path.exists(pathfile):
+            return None
+
+        files = []
+        try:
+            dft = parseDefinition(pathfile, IDX_DEF_VARS[type_def], files)
+        except ValueError:
+            dft = None
+
+        entry = {'files' : {}, 'def' : dft}
+        for source in files:
+            try:
+                st = os.stat(source)
+            except OSError:
+                continue
+            entry['files'][source] = (st.st_mtime_ns, st.st_size, getFileHash(source))
+
+        return entry
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : forksrv_lib.py
+#description     : Library to launch test case instances as isolated processes
+#                  forked from a template process (fork server) with framework
+#                  and test modules already imported.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to launch test case instances as isolated processes forked from a
+template process (fork server) with framework and test modules already imported.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import proc_lib as PROCLIB
+from lib import pool_lib as POOL
+from lib import log_lib as LOG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import json
+import signal
+import selectors
+import traceback
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+FSRV_NO_START = 'Fork server for [ %s ] can not start'
+FSRV_NOT_RUN = 'Fork server for [ %s ] is not running'
+FSRV_ENC_UTF8 = 'utf-8'
+
+#Fork server messages
+FSRV_MSG_STARTED = 'started'
+FSRV_MSG_EXIT = 'exit'
+
+#Seconds between checks of instances state
+FSRV_POLL_TIME = 0.05
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class ForkJob(object):
+    """
+    Handle of a test case instance forked by fork server.
+    It exposes same attributes than Popen used by PROCLIB (pid, returncode,
+    poll and wait) and a fileno to wait exits by selectors.
+    """
+
+    def __init__(self, server, command, pid):
+        """
+        Constructor
+
+        type: ForkServer
+        @param: server - fork server that launched the instance
+
+        type: list
+        @param: command - test case arguments (same as script argv)
+
+        type: number
+        @param: pid - instance process id
+        """
+
+        self.server = server
+        self.args = command
+        self.pid = pid
+        self.returncode = None
+        self.rusage = None
+
+    #==========================================================================
+
+    def poll(self):
+        """
+        Check if instance finished.
+
+        rtype: number
+        @return: exit code, None if still running
+        """
+
+        if self.returncode is None:
+            self.server.pump(0)
+
+        return self.returncode
+
+    #==========================================================================
+
+    def fileno(self):
+        """
+        Descriptor readable when fork server reports an exit (to wait by selectors).
+
+        rtype: number
+        @return: file descriptor, None if fork server is closed
+        """
+
+        return self.server.resp_fd
+
+    #==========================================================================
+
+    def wait(self):
+        """
+        Wait instance to finish.
+
+        rtype: number
+        @return: exit code
+        """
+
+        while self.returncode is None:
+            self.server.pump(None)
+
+        return self.returncode
+
+#==============================================================================
+
+class ForkServer(object):
+    """
+    Template process to fork test case instances of a test.
+    """
+
+    def __init__(self, test_name):
+        """
+        Constructor
+
+        type: str
+        @param: test_name - test name
+        """
+
+        self.test_name = test_name
+        self.pid = None
+        self.req_fd = None
+        self.resp_fd = None
+        self.resp_buf = b''
+        self.jobs = {}
+        self.selector = None
+
+    #==========================================================================
+
+    def start(self):
+        """
+        Fork template process and import test module into it.
+        """
+
+        req_r, req_w = os.pipe()
+        resp_r, resp_w = os.pipe()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid == 0: #Template process
+            os.close(req_w)
+            os.close(resp_r)
+            self.__serverLoop(req_r, resp_w)
+
+        os.close(req_r)
+        os.close(resp_w)
+        self.pid = pid
+        self.req_fd = req_w
+        self.resp_fd = resp_r
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.resp_fd, selectors.EVENT_READ)
+
+        #Template is ready when it answers first message
+        msg = self.__readMsg()
+        if not msg or msg[0] != FSRV_MSG_STARTED:
+            print(FSRV_NO_START % self.test_name)
+            self.close()
+            return SYS.RC_ERROR
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def spawn(self, command, env = None):
+        """
+        Fork a test case instance from template process.
+
+        type: list
+        @param: command - test case arguments (same as script argv)
+
+        type: dictionary
+        @param: env - environment variables for test case (optional)
+
+        rtype: ForkJob
+        @return: instance handle
+        """
+
+        os.write(self.req_fd, ('%s\n' % json.dumps([command, env or {}])).encode(FSRV_ENC_UTF8))
+
+        #Wait pid of new instance, exits of other instances can come first
+        while True:
+            msg = self.__readMsg()
+            if not msg:
+                raise ChildProcessError(FSRV_NOT_RUN % self.test_name)
+            if msg[0] == FSRV_MSG_STARTED:
+                job = ForkJob(self, command, msg[1])
+                self.jobs[job.pid] = job
+                return job
+            self.__processMsg(msg)
+
+    #==========================================================================
+
+    def pump(self, timeout):
+        """
+        Process instance exits reported by template process.
+
+        type: number
+        @param: timeout - seconds to wait for messages (None blocks)
+        """
+
+        if self.resp_fd is None:
+            return
+
+        #Messages can be already buffered while waiting a spawn answer
+        if b'\n' not in self.resp_buf:
+            if not self.selector.select(timeout):
+                return
+            data = os.read(self.resp_fd, 4096)
+            if not data: #Template process exited
+                self.__lostServer()
+                return
+            self.resp_buf += data
+
+        while b'\n' in self.resp_buf:
+            self.__processMsg(self.__readMsg())
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Stop template process. Running instances are not affected.
+        """
+
+        if self.req_fd is not None:
+            os.close(self.req_fd)
+            self.req_fd = None
+
+        #Collect remaining exit codes before template exits
+        while self.resp_fd is not None and [job for job in self.jobs.values() if job.returncode is None]:
+            self.pump(None)
+
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+        if self.resp_fd is not None:
+            os.close(self.resp_fd)
+            self.resp_fd = None
+        if self.pid:
+            try:
+                os.waitpid(self.pid, 0)
+            except ChildProcessError:
+                pass
+            self.pid = None
+
+    #==========================================================================
+
+    def __readMsg(self):
+        """
+        Read a message line from template process.
+
+        rtype: list
+        @return: message, None if template process exited
+        """
+
+        while b'\n' not in self.resp_buf:
+            data = os.read(self.resp_fd, 4096)
+            if not data:
+                return None
+            self.resp_buf += data
+
+        line, self.resp_buf = self.resp_buf.split(b'\n', 1)
+
+        return json.loads(line.decode(FSRV_ENC_UTF8))
+
+    #==========================================================================
+
+    def __processMsg(self, msg):
+        """
+        Set exit code and resource usage to instance handle.
+        """
+
+        if msg[0] == FSRV_MSG_EXIT and msg[1] in self.jobs:
+            job = self.jobs.pop(msg[1])
+            job.rusage = msg[3]
+            job.returncode = msg[2]
+
+    #==========================================================================
+
+    def __lostServer(self):
+        """
+        Template process exited: instances without exit code are set as error.
+        """
+
+        for job in self.jobs.values():
+            if job.returncode is None:
+                job.returncode = SYS.EXIT_ERROR
+        self.jobs = {}
+        self.selector.unregister(self.resp_fd)
+        os.close(self.resp_fd)
+        self.resp_fd = None
+
+    #==========================================================================
+
+    def __sendMsg(self, resp_w, msg):
+        """
+        Send a message from template process to caller.
+        """
+
+        try:
+            os.write(resp_w, ('%s\n' % json.dumps(msg)).encode(FSRV_ENC_UTF8))
+        except OSError: #Caller exited, keep reaping instances
+            pass
+
+    #==========================================================================
+
+    def __serverLoop(self, req_r, resp_w):
+        """
+        Template process main loop: fork an instance per request and report
+        its exit code and resource usage. It never returns to caller.
+        """
+
+        code = SYS.EXIT_NO_ERROR
+        try:
+            #Signals are handled by executor and instances
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            module, controller = POOL.importTest(self.test_name)
+            if not controller:
+                SYS.exitTC(SYS.EXIT_ERROR)
+            self.__sendMsg(resp_w, [FSRV_MSG_STARTED, os.getpid()])
+
+            selector = selectors.DefaultSelector()
+            selector.register(req_r, selectors.EVENT_READ)
+            req_buf = b''
+            children = 0
+            req_open = True
+            while req_open or children:
+                if req_open and selector.select(FSRV_POLL_TIME):
+                    data = os.read(req_r, 4096)
+                    if not data: #Caller closed, wait running instances
+                        req_open = False
+                        selector.unregister(req_r)
+                    req_buf += data
+                    while b'\n' in req_buf:
+                        line, req_buf = req_buf.split(b'\n', 1)
+                        sys.stdout.flush()
+                        sys.stderr.flush()
+                        pid = os.fork()
+                        if pid == 0: #Instance process
+                            args, env = json.loads(line.decode(FSRV_ENC_UTF8))
+                            self.__runInstance(module, controller, args, env, req_r, resp_w)
+                        children += 1
+                        self.__sendMsg(resp_w, [FSRV_MSG_STARTED, pid])
+                elif not req_open:
+                    pid, status, ru = os.wait4(-1, 0)
+                    children -= 1
+                    self.__sendMsg(resp_w, [FSRV_MSG_EXIT, pid, PROCLIB.getStatusCode(status), PROCLIB.getRusage(ru)])
+                    continue
+                #Reap finished instances
+                while children:
+                    pid, status, ru = os.wait4(-1, os.WNOHANG)
+                    if not pid:
+                        break
+                    children -= 1
+                    self.__sendMsg(resp_w, [FSRV_MSG_EXIT, pid, PROCLIB.getStatusCode(status), PROCLIB.getRusage(ru)])
+        except SystemExit as e:
+            code = POOL.getExitCode(e.code)
+        except BaseException:
+            traceback.print_exc()
+            code = SYS.EXIT_ERROR
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    #==========================================================================
+
+    def __runInstance(self, module, controller, args, env, req_r, resp_w):
+        """
+        Instance process: run test case and exit with its code.
+        It never returns to caller.
+        """
+
+        rc = SYS.EXIT_ERROR
+        try:
+            os.close(req_r)
+            os.close(resp_w)
+            #Own process group, it can be killed with its children
+            os.setpgrp()
+            signal.signal(signal.SIGINT, controller.stopTestBySignal)
+            signal.signal(signal.SIGTERM, controller.stopTestBySignal)
+            rc = POOL.runTestCase(module, controller, args, env)
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            LOG.flushLogs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(rc & 0xff)
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : hash_lib.py
+#description     : Library to hash Test ID folders in process (files hashed
+#                  in parallel), with same aggregate digest than
+#                  find -exec shasum -a 256 | shasum -a 256.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to hash Test ID folders in process (files hashed in parallel), with
+same aggregate digest than find -exec shasum -a 256 | shasum -a 256.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+HASH_LINE = '%s  %s\n'
+HASH_ENC_UTF8 = 'utf-8'
+HASH_CACHE_FILE = '%s/%s.json'
+
+#Bytes read from a file at once
+HASH_CHUNK_SIZE = 1048576
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getFileSHA256(pathfile):
+    """
+    Get SHA 256 of a file read in chunks.
+
+    type: str
+    @param: pathfile - file path
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    sha = hashlib.sha256()
+    with open(pathfile, 'rb') as f:
+        chunk = f.read(HASH_CHUNK_SIZE)
+        while chunk:
+            sha.update(chunk)
+            chunk = f.read(HASH_CHUNK_SIZE)
+
+    return sha.hexdigest()
+
+#==============================================================================
+
+def listFiles(folder, excludes = ()):
+    """
+    List regular files of a folder and its subfolders in same order than
+    find (directory order, subfolders when they are found).
+
+    type: str
+    @param: folder - folder path (listed paths start with it)
+
+    type: tuple
+    @param: excludes - file names not listed
+
+    rtype: list
+    @return: file paths
+    """
+
+    files = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                files.extend(listFiles(entry.path, excludes))
+            elif entry.is_file(follow_symlinks=False) and entry.name not in excludes:
+                files.append(entry.path)
+
+    return files
+
+#==============================================================================
+
+def getFolderManifest(folder, excludes = (), cache = None, workers = None):
+    """
+    Get size and SHA 256 of each file of a folder. Files are hashed in
+    parallel, files with same size, mtime, ctime and inode than cache entry
+    are not read.
+
+    type: str
+    @param: folder - folder path
+
+    type: tuple
+    @param: excludes - file names not hashed
+
+    type: HashCache
+    @param: cache - hashes of last time (optional, all files are read by default)
+
+    type: number
+    @param: workers - hashing threads (optional, CFG.SW_HASH_WORKERS by default)
+
+    rtype: list
+    @return: (path, size, sha256) of each file in find order
+    """
+
+    files = []
+    stats = []
+    for pathfile in listFiles(folder, excludes):
+        try:
+            st = os.stat(pathfile)
+        except FileNotFoundError: #Removed meanwhile
+            continue
+        files.append(pathfile)
+        stats.append((st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino))
+
+    shas = [cache.get(pathfile, stat) if cache else None for pathfile, stat in zip(files, stats)]
+    pending = [i for i, sha in enumerate(shas) if sha is None]
+    if pending:
+        with ThreadPoolExecutor(max_workers=workers or CFG.SW_HASH_WORKERS or None) as pool:
+            for i, sha in zip(pending, pool.map(getFileSHA256, [files[i] for i in pending])):
+                shas[i] = sha
+                if cache:
+                    cache.put(files[i], stats[i], sha)
+    if cache:
+        cache.keep(files)
+
+    return [(pathfile, stat[0], sha) for pathfile, stat, sha in zip(files, stats, shas)]
+
+#==============================================================================
+
+def getManifestSHA256(manifest):
+    """
+    Get aggregate SHA 256 of a folder manifest: SHA 256 of shasum output
+    lines of its files.
+
+    type: list
+    @param: manifest - (path, size, sha256) of each file in find order
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    sha = hashlib.sha256()
+    for pathfile, size, file_sha in manifest:
+        sha.update((HASH_LINE % (file_sha, pathfile)).encode(HASH_ENC_UTF8, 'surrogateescape'))
+
+    return sha.hexdigest()
+
+#==============================================================================
+
+def getFolderSHA256(folder, excludes = (), cache = None, workers = None):
+    """
+    Get aggregate SHA 256 of a folder, same digest than
+    find folder -type f ! -name exclude -exec shasum -a 256 {} \; | shasum -a 256
+
+    type: str
+    @param: folder - folder path (digest depends on it as it is written)
+
+    type: tuple
+    @param: excludes - file names not hashed
+
+    type: HashCache
+    @param: cache - hashes of last time (optional)
+
+    type: number
+    @param: workers - hashing threads (optional)
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    return getManifestSHA256(getFolderManifest(folder, excludes, cache, workers))
+
+#==============================================================================
+
+def writeManifest(pathfile, folder, manifest, sha):
+    """
+    Write folder manifest as JSON file (atomically): folder as hashed,
+    aggregate SHA 256 and path (relative to folder), size and SHA 256 of
+    each file in find order.
+
+    type: str
+    @param: pathfile - manifest file path
+
+    type: str
+    @param: folder - folder path
+
+    type: list
+    @param: manifest - (path, size, sha256) of each file in find order
+
+    type: str
+    @param: sha - aggregate sha256 hex digest
+    """
+
+    data = {
+        'folder' : folder,
+        'sha256sum' : sha,
+        'files' : [{'path' : os.path.relpath(path, folder), 'size' : size, 'sha256' : file_sha} for path, size, file_sha in manifest],
+        }
+    tmp_file = '%s.%d' % (pathfile, os.getpid())
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, pathfile)
+
+    return SYS.RC_NO_ERROR
+
+#==============================================================================
+
+def checkManifest(folder, data, excludes = (), failfast = False, workers = None):
+    """
+    Check files of a folder against its manifest: files are read again
+    (no cache) and hashed in parallel.
+
+    type: str
+    @param: folder - folder path
+
+    type: dictionary
+    @param: data - manifest read from JSON file
+
+    type: tuple
+    @param: excludes - file names not in manifest
+
+    type: boolean
+    @param: failfast - stop on first file not valid (optional)
+
+    type: number
+    @param: workers - hashing threads (optional, CFG.SW_HASH_WORKERS by default)
+
+    rtype: tuple
+    @return: lists of paths (relative to folder) tampered, missing and not in manifest
+    """
+
+    current = set(os.path.relpath(path, folder) for path in listFiles(folder, excludes))
+    expected = dict((entry['path'], entry) for entry in data['files'])
+    missing = sorted(path for path in expected if path not in current)
+    unexpected = sorted(path for path in current if path not in expected)
+    tampered = []
+    if failfast and (missing or unexpected):
+        return tampered, missing, unexpected
+
+    pool = ThreadPoolExecutor(max_workers=workers or CFG.SW_HASH_WORKERS or None)
+    try:
+        jobs = dict((pool.submit(getFileSHA256, os.path.join(folder, path)), path) for path in expected if path in current)
+        for job in as_completed(jobs):
+            entry = expected[jobs[job]]
+            try:
+                valid = job.result() == entry['sha256'] and os.path.getsize(os.path.join(folder, entry['path'])) == entry['size']
+            except OSError:
+                valid = False
+            if not valid:
+                tampered.append(entry['path'])
+                if failfast:
+                    break
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+    return sorted(tampered), missing, unexpected
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class HashCache(object):
+    """
+    Hashes of files of a folder from last time it was hashed, by path with
+    size, mtime, ctime and inode of file then.
+    """
+
+    def __init__(self, folder, cache_path = None):
+        """
+        Constructor
+
+        type: str
+        @param: folder - folder hashed
+
+        type: str
+        @param: cache_path - cache folder (optional, CFG.SW_HASH_PATH by default)
+        """
+
+        self.cache_path = cache_path or CFG.SW_HASH_PATH
+        key = hashlib.sha256(os.path.realpath(folder).encode(HASH_ENC_UTF8, 'surrogateescape')).hexdigest()
+        self.cache_file = HASH_CACHE_FILE % (self.cache_path, key)
+        self.entries = {}
+        self.changed = False
+        self.load()
+
+    #==========================================================================
+
+    def load(self):
+        """
+        Read cache file (empty cache if it does not exist or it is corrupted)
+        """
+
+        try:
+            with open(self.cache_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def get(self, pathfile, stat):
+        """
+        Get hash of a file if it did not change.
+
+        type: str
+        @param: pathfile - file path
+
+        type: tuple
+        @param: stat - size, mtime, ctime and inode of file
+
+        rtype: str
+        @return: sha256 hex digest, None if file changed or it is not cached
+        """
+
+        entry = self.entries.get(pathfile)
+        if entry and tuple(entry[0]) == tuple(stat):
+            return entry[1]
+
+        return None
+
+    #==========================================================================
+
+    def put(self, pathfile, stat, sha):
+        """
+        Keep hash of a file.
+
+        type: str
+        @param: pathfile - file path
+
+        type: tuple
+        @param: stat - size, mtime, ctime and inode of file
+
+        type: str
+        @param: sha - sha256 hex digest
+        """
+
+        self.entries[pathfile] = [list(stat), sha]
+        self.changed = True
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def keep(self, files):
+        """
+        Drop hashes of files not in a list (removed files).
+
+        type: list
+        @param: files - file paths
+        """
+
+        files = set(files)
+        for pathfile in [pathfile for pathfile in self.entries if pathfile not in files]:
+            del self.entries[pathfile]
+            self.changed = True
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def save(self):
+        """
+        Write cache file
+        """
+
+        if not self.changed:
+            return SYS.RC_NO_ERROR
+
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+            tmp_file = '%s.%d' % (self.cache_file, os.getpid())
+            with open(tmp_file, 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_file, self.cache_file)
+            self.changed = False
+        except OSError: #Read only framework path, cache only in memory
+            pass
+
+        return SYS.RC_NO_ERROR
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : history_lib.py
+#description     : Library to keep durations of test cases taken from Test ID
+#                  JSON reports, to predict durations of next runs.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to keep durations of test cases taken from Test ID JSON reports,
+to predict durations of next runs.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import json
+import datetime
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+HIST_FILE = 'durations.json'
+HIST_KEY = '%s/%s/%s'
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getReportDurations(report):
+    """
+    Get duration of each test case in a JSON report: its longest instance
+    (instances of a test case run at same time). Instances not run
+    (skipped or cached) are not taken.
+
+    type: dictionary
+    @param: report - Test ID JSON report
+
+    rtype: dictionary
+    @return: (test name, order, method) and seconds
+    """
+
+    durations = {}
+    for test_name, testcs in report.get(LOG.JSON_TEST_EXEC, {}).items():
+        for testc in testcs:
+            if not testc.get('start_date') or not testc.get('end_date'):
+                continue
+            #Reports of older versions do not keep order of test cases
+            if testc.get('order_exec') is None or not testc.get('method'):
+                continue
+            try:
+                start = datetime.datetime.fromisoformat(testc['start_date'])
+                end = datetime.datetime.fromisoformat(testc['end_date'])
+            except ValueError:
+                continue
+            key = (test_name, '%s' % testc['order_exec'], testc['method'])
+            durations[key] = max(durations.get(key, 0), (end - start).total_seconds())
+
+    return durations
+
+#==============================================================================
+
+def getHistoryFile(history_path = None):
+    """
+    Get history file path
+
+    type: str
+    @param: history_path - history folder (optional, CFG.SW_CACHE_PATH by default)
+
+    rtype: str
+    @return: history file path
+    """
+
+    return '%s/%s' % (history_path or CFG.SW_CACHE_PATH, HIST_FILE)
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class DurationHistory(object):
+    """
+    Durations of test cases by test, order and method. Last durations are
+    kept and predicted duration is their mean. History is built from Test ID
+    JSON reports in logs path the first time.
+    """
+
+    def __init__(self, log_path = None, history_path = None, max_samples = None):
+        """
+        Constructor
+
+        type: str
+        @param: log_path - logs path to build history (optional, CFG.SW_LOGS_PATH by default)
+
+        type: str
+        @param: history_path - history folder (optional, CFG.SW_CACHE_PATH by default)
+
+        type: number
+        @param: max_samples - durations kept per test case (optional, CFG.SW_HISTORY_SAMPLES by default)
+        """
+
+        self.log_path = log_path or CFG.SW_LOGS_PATH
+        self.history_path = history_path or CFG.SW_CACHE_PATH
+        self.history_file = getHistoryFile(self.history_path)
+        self.max_samples = int(max_samples or CFG.SW_HISTORY_SAMPLES)
+        self.entries = {}
+        self.changed = {}
+        if not os.path.exists(self.history_file):
+            self.rebuild()
+        else:
+            self.load()
+
+    #==========================================================================
+
+    def load(self):
+        """
+        Read history file (empty history if it does not exist or it is corrupted)
+        """
+
+        try:
+            with open(self.history_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def get(self, test_name, order, method):
+        """
+        Get predicted duration of a test case.
+
+        type: str
+        @param: test_name - test name
+
+        type: number
+        @param: order - test case order
+
+        type: str
+        @param: method - test case name
+
+        rtype: number
+        @return: seconds, None if test case has no history
+        """
+
+        entry = self.entries.get(HIST_KEY % (test_name, order, method))
+        if not entry or not entry['samples']:
+            return None
+
+        return sum(entry['samples']) / len(entry['samples'])
+
+    #==========================================================================
+
+    def addReport(self, report, test_id):
+        """
+        Add durations of test cases in a Test ID JSON report.
+
+        type: dictionary
+        @param: report - Test ID JSON report
+
+        type: str
+        @param: test_id - Test ID of report
+        """
+
+        for (test_name, order, method), seconds in getReportDurations(report).items():
+            key = HIST_KEY % (test_name, order, method)
+            entry = self.changed.get(key) or self.entries.get(key) or {'samples' : [], 'test_id' : None}
+            #Same report is not added twice
+            if entry['test_id'] == test_id:
+                continue
+            entry = {'samples' : (entry['samples'] + [round(seconds, 6)])[-self.max_samples:], 'test_id' : test_id}
+            self.entries[key] = entry
+            self.changed[key] = entry
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def save(self):
+        """
+        Write history file merging entries written by other runs meanwhile
+        """
+
+        if not self.changed and os.path.exists(self.history_file):
+            return SYS.RC_NO_ERROR
+
+        os.makedirs(self.history_path, exist_ok=True)
+        self.load()
+        self.entries.update(self.changed)
+        self.changed = {}
+
+        tmp_file = '%s.%d' % (self.history_file, os.getpid())
+        with open(tmp_file, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_file, self.history_file)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def rebuild(self):
+        """
+        Build history from Test ID JSON reports in logs path (oldest first)
+
+        rtype: number
+        @return: number of entries
+        """
+
+        self.entries = {}
+        self.changed = {}
+        for test_id in SYS.listTestIDs(self.log_path):
+            report = LOG.readJSON(self.log_path, test_id)
+            if not report:
+                continue
+            self.addReport(report, test_id)
+        self.save()
+
+        return len(self.entries)
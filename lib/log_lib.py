@@ -17,6 +17,9 @@ Library to cover logging functions.
 
 from lib import common_lib as LIB
 from lib import sys_lib as SYS
+from lib import proc_lib as PROCLIB
+from lib import logsrv_lib as LOGSRV
+from lib import hash_lib as HASH
 from config import config as CFG
 
 
@@ -26,7 +29,14 @@ from config import config as CFG
 
 import datetime
 import os
+import sys
 import re
+import contextvars
+import fcntl
+import time
+import queue
+import atexit
+import threading
 from subprocess import *
 from pathlib import Path
 import json
@@ -49,8 +59,22 @@ PASSED = "PASSED"
 FAILED = "FAILED"
 WRN = "WRN"
 
-#Commands
-CMD_SHA256_TESTID_DIR = 'find %s/%s -type f ! -name "%s.json" -exec shasum -a 256 {} \; | shasum -a 256'
+#Background log writer of this process and fork hooks registered
+writer = None
+fork_hooks = False
+
+#Test ID counter (next numeric Test ID) in logs path
+ID_COUNTER_FILE = '%s/.test_id'
+ID_COUNTER_SIZE = 32
+ID_FORMAT = '%06d'
+ID_REGEX = '^[0-9]{6,}$'
+
+#JSON report and its journal (one event per line: [element, value])
+JSON_REPORT_FILE = '%s/%s.json'
+JSON_JOURNAL_FILE = '%s/%s.jsonl'
+JSON_MANIFEST_FILE = '%s/%s.manifest.json'
+JSON_ENC_UTF8 = 'utf-8'
+
 
 #Json ids
 JSON_INIT = 'init'
@@ -65,6 +89,14 @@ JSON_SHA256 = 'sha256sum'
 JSON_TEST_EXEC = 'test_execution'
 JSON_TEST_NAME = 'test_name'
 JSON_TESTC = 'testc_exec'
+JSON_TESTC_SKIP = 'testc_skip'
+JSON_TESTC_RUSAGE = 'testc_rusage'
+JSON_TESTC_CACHED = 'testc_cached'
+JSON_FINGERPRINT = 'fingerprints'
+JSON_RUSAGE = 'rusage'
+JSON_RERUN = 'rerun_of'
+JSON_MERGED = 'merged'
+JSON_PLAN = 'plan'
 JSON_EXIT_ST = 'exit_status'
 JSON_EXIT_MSG = 'exit_msg'
 JSON_CHKSUM = 'checksum'
@@ -73,7 +105,249 @@ JSON_CHKSUM = 'checksum'
 #================================ FUNCTIONS ===================================
 #==============================================================================
 
-#...
+def getTestCaseResults(testcs, test_id):
+    """
+    Get result of each test case (order) in a JSON test execution list:
+    failed if some instance did not pass.
+
+    type: list
+    @param: testcs - test case instances records of a test
+
+    type: str
+    @param: test_id - Test ID of records
+
+    rtype: dictionary
+    @return: order and its result (method, exit_status, test_id)
+    """
+
+    results = {}
+    for testc in testcs:
+        order = '%s' % testc['order_exec']
+        result = results.setdefault(order, {'method' : testc['method'], 'exit_status' : SYS.EXIT_NO_ERROR, 'test_id' : test_id})
+        if str(testc['exit_status']) != str(SYS.EXIT_NO_ERROR) and str(result['exit_status']) == str(SYS.EXIT_NO_ERROR):
+            result['exit_status'] = int(testc['exit_status'])
+
+    return results
+
+
+#==============================================================================
+
+def applyJSON(report, element, value, test_id):
+    """
+    Apply an element written to a JSON report (journal event).
+
+    type: dictionary
+    @param: report - JSON report updated
+
+    type: str
+    @param: element - element name
+
+    type: list
+    @param: value - list with nested values for element
+
+    type: str
+    @param: test_id - Test ID of report
+
+    rtype: dictionary
+    @return: JSON report
+    """
+
+    if element == JSON_START_DATE:
+        report[JSON_START_DATE] = value[0]
+    if element == JSON_END_DATE:
+        report[JSON_END_DATE] = value[0]
+    if element == JSON_PROFILE:
+        report[JSON_PROFILE] =  value[0]
+    if element == JSON_MODE:
+        report[JSON_MODE] = value[0]
+    if element == JSON_SHA256:
+        report[JSON_SHA256_HASH] = value[0]
+    if element == JSON_TEST_EXEC:
+        report[JSON_TEST_EXEC] = {}
+    if element == JSON_TEST_NAME:
+        report[JSON_TEST_EXEC][value[0]] = []
+    if element == JSON_TESTC:
+        report[JSON_TEST_EXEC][value[0]].append({'order_exec':value[9], 'method':value[1], 'parameters':value[8], 'start_date':value[2], 'end_date':value[3], 'method_mode':value[4], 'concurrency_inst':value[5], 'exit_status':value[6], 'exit_msg':value[7]})
+        if len(value) > 10: #Seconds waiting admission before launch
+            report[JSON_TEST_EXEC][value[0]][-1]['queue_wait'] = value[10]
+    if element == JSON_TESTC_SKIP: #Test case instance not run (or torn down)
+        report[JSON_TEST_EXEC][value[0]].append({'order_exec':value[7], 'method':value[1], 'parameters':value[6], 'start_date':None, 'end_date':None, 'method_mode':value[2], 'concurrency_inst':value[3], 'exit_status':value[4], 'exit_msg':value[5], 'skipped':value[8]})
+    if element == JSON_TESTC_CACHED: #Test case instance passed in a previous run with same inputs
+        report[JSON_TEST_EXEC][value[0]].append({'order_exec':value[5], 'method':value[1], 'parameters':value[4], 'start_date':None, 'end_date':None, 'method_mode':value[2], 'concurrency_inst':value[3], 'exit_status':SYS.EXIT_NO_ERROR, 'exit_msg':SYS.getExitMsg(SYS.EXIT_NO_ERROR), 'cached':value[6]})
+    if element == JSON_FINGERPRINT: #Test case inputs fingerprint (incremental runs)
+        report.setdefault(JSON_FINGERPRINT, {}).setdefault(value[0], {})['%s' % value[1]] = value[2]
+    if element == JSON_TESTC_RUSAGE: #Resource usage of a finished instance
+        for testc in reversed(report[JSON_TEST_EXEC][value[0]]):
+            if testc['method'] == value[1] and str(testc['concurrency_inst']) == str(value[2]) and str(testc['order_exec']) == str(value[3]) and JSON_RUSAGE not in testc:
+                testc[JSON_RUSAGE] = value[4]
+                break
+    if element == JSON_RUSAGE: #Resource usage rollups per test and run
+        tests = {}
+        total = {}
+        for test_name, testcs in report.get(JSON_TEST_EXEC, {}).items():
+            tests[test_name] = {}
+            for testc in testcs:
+                if testc.get(JSON_RUSAGE):
+                    PROCLIB.addRusage(tests[test_name], testc[JSON_RUSAGE])
+                    PROCLIB.addRusage(total, testc[JSON_RUSAGE])
+        report[JSON_RUSAGE] = {'tests' : tests, 'run' : total}
+    if element == JSON_RERUN: #Test ID with failed test cases rerun here
+        report[JSON_RERUN] = value[0]
+    if element == JSON_PLAN: #Content hash of execution plan run
+        report[JSON_PLAN] = value[0]
+    if element == JSON_MERGED: #Results of rerun Test ID updated with results here
+        source = value[0] or {}
+        if JSON_MERGED in source: #Rerun of a rerun
+            tests = source[JSON_MERGED]['tests']
+        else:
+            tests = dict((test_name, getTestCaseResults(testcs, value[1])) for test_name, testcs in source.get(JSON_TEST_EXEC, {}).items())
+        for test_name, testcs in report.get(JSON_TEST_EXEC, {}).items():
+            tests.setdefault(test_name, {}).update(getTestCaseResults(testcs, test_id))
+        failed = [result for results in tests.values() for result in results.values() if str(result['exit_status']) != str(SYS.EXIT_NO_ERROR)]
+        report[JSON_MERGED] = {'exit_status' : SYS.EXIT_ERROR if failed else SYS.EXIT_NO_ERROR, 'tests' : tests}
+    if element == JSON_EXIT_ST:
+        report[JSON_EXIT_ST] = value[0]
+    if element == JSON_EXIT_MSG:
+        report[JSON_EXIT_MSG] = value[0]
+    if element == JSON_CHKSUM:
+        report[JSON_SHA256] = value[0]
+
+
+    return report
+
+#==============================================================================
+
+def getReportFiles(test_id):
+    """
+    Get names of report files of a Test ID folder, they are not part of its
+    checksum (JSON report, its journal and manifest of files).
+
+    type: str
+    @param: test_id - Test ID
+
+    rtype: tuple
+    @return: file names
+    """
+
+    return tuple(os.path.basename(name % ('', test_id)) for name in (JSON_REPORT_FILE, JSON_JOURNAL_FILE, JSON_MANIFEST_FILE))
+
+#==============================================================================
+
+def getLogWriter():
+    """
+    Get background log writer of this process (started first time, lines
+    are flushed at exit).
+
+    rtype: LogWriter
+    @return: log writer
+    """
+
+    global writer, fork_hooks
+
+    if writer is None:
+        writer = LogWriter(CFG.SW_LOG_BUFFER_LINES, CFG.SW_LOG_BUFFER_SECS)
+        atexit.register(writer.flush)
+    #Forked children (kept by their children too) get no lines of parent
+    if not fork_hooks:
+        os.register_at_fork(before=flushLogs, after_in_child=resetLogs)
+        fork_hooks = True
+
+    return writer
+
+#==============================================================================
+
+def flushLogs():
+    """
+    Write lines waiting in background log writer of this process. It must be
+    called before a process exits without exit handlers (os._exit) and
+    before log files are read.
+    """
+
+    if writer is not None:
+        writer.flush()
+
+    return SYS.RC_NO_ERROR
+
+#==============================================================================
+
+def resetLogs():
+    """
+    Drop background log writer in a forked child: its thread is not running
+    there (lines were flushed before fork).
+    """
+
+    global writer
+
+    writer = None
+
+    return SYS.RC_NO_ERROR
+
+#==============================================================================
+
+def readJSON(log_path, test_id):
+    """
+    Read JSON report of a Test ID. Report of a finished Test ID (it has its
+    checksum) is read as written, report of a running one is built from its
+    journal, so a partial report is got (line being appended is not taken).
+
+    type: str
+    @param: log_path - logs path
+
+    type: str
+    @param: test_id - Test ID
+
+    rtype: dictionary
+    @return: JSON report, None if it does not exist or it is not valid
+    """
+
+    test_folder = SYS.getTestIDPath(log_path, test_id)
+    try:
+        with open(JSON_REPORT_FILE % (test_folder, test_id), 'r') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        report = None
+    if isinstance(report, dict) and JSON_SHA256 in report:
+        return report
+
+    journal = readJournal(log_path, test_id)
+
+    return report if journal is None else journal
+
+#==============================================================================
+
+def readJournal(log_path, test_id):
+    """
+    Build JSON report of a Test ID from its journal
+
+    type: str
+    @param: log_path - logs path
+
+    type: str
+    @param: test_id - Test ID
+
+    rtype: dictionary
+    @return: JSON report, None if journal does not exist
+    """
+
+    test_folder = SYS.getTestIDPath(log_path, test_id)
+    try:
+        with open(JSON_JOURNAL_FILE % (test_folder, test_id), 'r') as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+
+    report = {}
+    for line in lines:
+        try:
+            element, value = json.loads(line)
+        except ValueError:
+            continue
+        try:
+            applyJSON(report, element, value, test_id)
+        except (KeyError, IndexError, TypeError):
+            continue
+
+    return report
 
 #==============================================================================
 #================================= CLASSES ====================================
@@ -95,22 +369,72 @@ class Logging(object):
 
     def getNewIDTest(self):
         """
-        Get New ID Test to start a set of tests.
+        Get New ID Test to start a set of tests. Next ID is kept in a counter
+        file (locked meanwhile) and its folder is created here, so two
+        executors never get same ID. Counter is rebuilt from Test ID folders
+        if it is lost.
 
         rtype: str
         @return: Test ID string
         """
 
-        folders = []
-        for folder in os.listdir(self.log_path):
-            if re.search('[0-9]{6}', folder):
-                folders.append(folder)
-        if folders:
-            ids = sorted(folders, reverse=True)
-            id_test = '%06d' % (int(ids[0]) + 1)
-            return id_test
-        else:
-            return CFG.SW_TEST_ID_INIT
+        os.makedirs(self.log_path, exist_ok=True)
+        fd = os.open(ID_COUNTER_FILE % self.log_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                next_id = int(os.read(fd, ID_COUNTER_SIZE).decode(JSON_ENC_UTF8))
+            except ValueError: #New or lost counter
+                next_id = self.__getLastIDTest() + 1
+            #Folders of custom IDs (or created without counter) are skipped
+            while not self.reserveIDTest(ID_FORMAT % next_id):
+                next_id += 1
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, ('%d' % (next_id + 1)).encode(JSON_ENC_UTF8))
+        finally:
+            os.close(fd)
+
+        return ID_FORMAT % next_id
+
+    #==========================================================================
+
+    def reserveIDTest(self, test_id):
+        """
+        Create Test ID folder if it does not exist in any layout (atomically).
+
+        type: str
+        @param: test_id - Test ID string
+
+        rtype: boolean
+        @return: True if folder was created
+        """
+
+        test_folder = SYS.getTestIDPath(self.log_path, test_id)
+        try:
+            os.makedirs(os.path.dirname(test_folder), exist_ok=True)
+            os.mkdir(test_folder)
+        except FileExistsError:
+            return False
+
+        return True
+
+    #==========================================================================
+
+    def __getLastIDTest(self):
+        """
+        Get last numeric Test ID from Test ID folders
+
+        rtype: number
+        @return: last Test ID, one less than first Test ID if there is none
+        """
+
+        last_id = int(CFG.SW_TEST_ID_INIT) - 1
+        for test_id in SYS.listTestIDs(self.log_path):
+            if re.match(ID_REGEX, test_id):
+                last_id = max(last_id, int(test_id))
+
+        return last_id
 
     #==========================================================================
 
@@ -128,14 +452,25 @@ class Logging(object):
 
     def getTestIDSHA256(self, test_id):
         """
-        Get test id folder SHA 256 sum.
+        Get test id folder SHA 256 sum (JSON report, its journal and manifest
+        are not part of it) and write manifest of files hashed. Files not
+        changed since last sum are not read again.
 
         rtype: str
         @return: Test ID string
         """
-        rout = SYS.execPlainCommand(CMD_SHA256_TESTID_DIR % ( self.log_path, test_id, test_id))
-
-        return rout.split()[0]
+        #Log lines of this process are part of checksum
+        flushLogs()
+        test_folder = SYS.getTestIDPath(self.log_path, test_id)
+        cache = HASH.HashCache(test_folder) if CFG.SW_HASH_CACHE else None
+        manifest = HASH.getFolderManifest(test_folder, getReportFiles(test_id), cache)
+        sha = HASH.getManifestSHA256(manifest)
+        if cache:
+            cache.save()
+        #Files hashed to validate them one by one
+        HASH.writeManifest(JSON_MANIFEST_FILE % (test_folder, test_id), test_folder, manifest, sha)
+
+        return sha
 
     #==========================================================================
 
@@ -186,10 +521,11 @@ class Logging(object):
         self.test_id = test_id
 
         #Create folder
-        test_log_path = '%s/%s' % (self.log_path, test_id)
+        test_log_path = SYS.getTestIDPath(self.log_path, test_id)
         rc, rout = SYS.execCommand(['mkdir','-p',test_log_path], None, 1)
         if not rc:
-            self.test_json = '%s/%s.json' % ( test_log_path, test_id )
+            self.test_json = JSON_REPORT_FILE % ( test_log_path, test_id )
+            self.test_journal = JSON_JOURNAL_FILE % ( test_log_path, test_id )
             rc, rout = SYS.execCommand(['touch',self.test_json], None, 1)
 
         #Create log file
@@ -232,9 +568,12 @@ class Logging(object):
         else:
             log_line = '[ %s ] [ %s ] %s\n' % (date_time, tag, msg)
 
-        log_file = open(self.test_log_file,'a')
-        log_file.write(log_line)
-        log_file.close()
+        if CFG.SW_LOG_BUFFER:
+            getLogWriter().write(self.test_log_file, log_line)
+        else:
+            log_file = open(self.test_log_file,'a')
+            log_file.write(log_line)
+            log_file.close()
 
     #==========================================================================
 
@@ -271,7 +610,11 @@ class Logging(object):
         else:
             log_line = '[ %s ] [ %s ] - %s' % (date_time, tag, msg)
 
-        print(log_line)
+        #Console echo in order with log lines by log collector
+        if CFG.SW_LOG_BUFFER and SYS.getLogCollector():
+            getLogWriter().write(LOGSRV.LOGSRV_CONSOLE, log_line + '\n')
+        else:
+            print(log_line)
 
     #==========================================================================
 
@@ -296,7 +639,8 @@ class Logging(object):
 
     def writeJSON(self, element, value = None):
         """
-        Write msg in log file.
+        Write an element of JSON report as an event in its journal. Report
+        is built from journal when checksum (last element) is written.
 
         type: str
         @param: element - element name
@@ -305,57 +649,235 @@ class Logging(object):
         @param: value - list with nested values for element
         """
 
-        lock_pathfile = '%s/%s/%s.json.lock' % (self.log_path, self.test_id, self.test_id)
-        while(not Path(lock_pathfile).exists()):
-            lock_file = open(lock_pathfile,'w')
-            lock_file.close()
-
-            json_file = open(self.test_json,'r')
-            json_line = json.load(json_file)
-
-            if element == JSON_START_DATE:
-                json_line[JSON_START_DATE] = value[0]
-            if element == JSON_END_DATE:
-                json_line[JSON_END_DATE] = value[0]
-            if element == JSON_PROFILE:
-                json_line[JSON_PROFILE] =  value[0]
-            if element == JSON_MODE:
-                json_line[JSON_MODE] = value[0]
-            if element == JSON_SHA256:
-                json_line[JSON_SHA256_HASH] = value[0]
-            if element == JSON_TEST_EXEC:
-                json_line[JSON_TEST_EXEC] = {}
-            if element == JSON_TEST_NAME:
-                json_line[JSON_TEST_EXEC][value[0]] = []
-            if element == JSON_TESTC:
-                json_line[JSON_TEST_EXEC][value[0]].append({'order_exec':value[9], 'method':value[1], 'parameters':value[8], 'start_date':value[2], 'end_date':value[3], 'method_mode':value[4], 'concurrency_inst':value[5], 'exit_status':value[6], 'exit_msg':value[7]})
-            if element == JSON_EXIT_ST:
-                json_line[JSON_EXIT_ST] = value[0]
-            if element == JSON_EXIT_MSG:
-                json_line[JSON_EXIT_MSG] = value[0]
-            if element == JSON_CHKSUM:
-                json_line[JSON_SHA256] = value[0]
-
-            json_file.close()
-
-            with open(self.test_json, 'w') as json_file:
-                json.dump(json_line, json_file, indent =2)
-
-        os.remove(lock_pathfile)
+        #One line per event appended in a single write, lock held by
+        #writer is released by kernel even if it is killed
+        line = (json.dumps([element, value]) + '\n').encode(JSON_ENC_UTF8)
+        fd = os.open(self.test_journal, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            written = 0
+            while written < len(line):
+                written += os.write(fd, line[written:])
+        finally:
+            os.close(fd)
+
+        #Checksum is last element written, report is built from journal
+        if element == JSON_CHKSUM:
+            self.finalizeJSON()
 
+    #==========================================================================
 
-    def initJSON(self):
+    def finalizeJSON(self):
+        """
+        Build JSON report from journal and write it (atomically). Journal is
+        locked meanwhile, so no event is appended after it is read. Journal
+        is kept, so report is built again if more events are written later.
         """
-        Write msg in log file.
 
-        type: str
-        @param: element - element name
+        fd = os.open(self.test_journal, os.O_RDONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            report = readJournal(self.log_path, self.test_id) or {}
+            tmp_file = '%s.%d' % (self.test_json, os.getpid())
+            with open(tmp_file, 'w') as json_file:
+                json.dump(report, json_file, indent =2)
+            os.replace(tmp_file, self.test_json)
+        finally:
+            os.close(fd)
 
-        type: list
-        @param: value - list with nested values for element
+    #==========================================================================
+
+    def initJSON(self):
+        """
+        Create empty JSON report and its journal.
         """
 
         json_file = open(self.test_json,'a')
         json_file.write('{')
         json_file.write('}')
         json_file.close()
+        open(self.test_journal,'a').close()
+
+#==============================================================================
+
+class LogWriter(object):
+    """
+    Background writer of log lines. Lines are queued by callers and a thread
+    writes them in batches (each log file opened once per batch) when batch
+    is full or its first line waited time limit. Queue put is reentrant, so
+    lines can be written by signal handlers. Batches are sent to log
+    collector of executor when there is one (written here if it is not
+    reachable).
+    """
+
+    def __init__(self, max_lines, max_secs):
+        """
+        Constructor
+
+        type: number
+        @param: max_lines - lines written together at most
+
+        type: number
+        @param: max_secs - seconds a line waits at most
+        """
+
+        self.max_lines = int(max_lines)
+        self.max_secs = float(max_secs)
+        self.lines = queue.SimpleQueue()
+        self.client = None
+        self.thread = threading.Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+    #==========================================================================
+
+    def write(self, log_file, line):
+        """
+        Queue a line to be written.
+
+        type: str
+        @param: log_file - log file path
+
+        type: str
+        @param: line - line with end of line
+        """
+
+        self.lines.put((log_file, line))
+
+    #==========================================================================
+
+    def flush(self):
+        """
+        Wait lines queued before to be written
+        """
+
+        if not self.thread.is_alive():
+            return SYS.RC_NO_ERROR
+
+        done = threading.Event()
+        self.lines.put((None, done))
+        done.wait()
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __run(self):
+        """
+        Writer thread loop
+        """
+
+        while True:
+            batch = [self.lines.get()]
+            deadline = time.monotonic() + self.max_secs
+            while len(batch) < self.max_lines and batch[-1][0] is not None:
+                try:
+                    batch.append(self.lines.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            self.__writeBatch(batch)
+
+    #==========================================================================
+
+    def __writeBatch(self, batch):
+        """
+        Write lines of a batch by log file (lines of a file in same order)
+        and release flush requests in it.
+        """
+
+        if self.__sendBatch(batch):
+            return
+
+        files = {}
+        flushes = []
+        for log_file, line in batch:
+            if log_file is None:
+                flushes.append(line)
+            elif log_file == LOGSRV.LOGSRV_CONSOLE:
+                sys.stdout.write(line)
+            else:
+                files.setdefault(log_file, []).append(line)
+
+        for log_file, lines in files.items():
+            try:
+                with open(log_file, 'a') as f:
+                    f.write(''.join(lines))
+            except OSError as e:
+                sys.stderr.write('%s: %s\n' % (log_file, e))
+
+        sys.stdout.flush()
+        for done in flushes:
+            done.set()
+
+    #==========================================================================
+
+    def __sendBatch(self, batch):
+        """
+        Send a batch to log collector (connected first time) and release
+        flush requests in it once collector wrote lines before them.
+
+        rtype: boolean
+        @return: True if batch was sent
+        """
+
+        sock_path = SYS.getLogCollector()
+        if not CFG.SW_LOG_COLLECTOR or not sock_path:
+            return False
+
+        try:
+            if self.client is None or self.client.sock_path != sock_path:
+                if self.client is not None:
+                    self.client.close()
+                self.client = LOGSRV.LogClient(sock_path)
+            self.client.send(batch)
+        except OSError:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+            return False
+
+        for log_file, line in batch:
+            if log_file is None:
+                line.set()
+
+        return True
+
+#==============================================================================
+
+class InstanceLogging(object):
+    """
+    Log object shared by test case instances running in the same process
+    (threads or asyncio tasks). Calls go to log object of instance running
+    in current context, or to default log outside of instances.
+    """
+
+    def __init__(self, log):
+        """
+        Constructor
+
+        type: Logging
+        @param: log - default log object
+        """
+
+        self.default = log
+        self.current = contextvars.ContextVar('instance_log', default=log)
+
+    #==========================================================================
+
+    def bind(self, log):
+        """
+        Set log object of instance running in current context.
+
+        type: Logging
+        @param: log - instance log object
+        """
+
+        self.current.set(log)
+
+    #==========================================================================
+
+    def __getattr__(self, name):
+        """
+        Get attribute from log object of current context.
+        """
+
+        return getattr(self.current.get(), name)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : logsrv_lib.py
+#description     : Library to collect log lines of all processes of a run
+#                  (executor and test case instances) in one process over a
+#                  Unix socket, which does all log file writes and console
+#                  echo in a global order.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to collect log lines of all processes of a run (executor and test
+case instances) in one process over a Unix socket, which does all log file
+writes and console echo in a global order.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import json
+import socket
+import tempfile
+import threading
+import selectors
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+LOGSRV_SOCK_FILE = '%s/ptfwk_log_%d.sock'
+LOGSRV_ENC_UTF8 = 'utf-8'
+LOGSRV_ACK = b'\n'
+
+#Record target of console echo
+LOGSRV_CONSOLE = ''
+
+#Bytes read from a connection at once
+LOGSRV_READ_SIZE = 65536
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class LogClient(object):
+    """
+    Connection of a process to log collector. Records are sent as JSON lines
+    [pid, seq, target, line]: target is log file path or console (''),
+    record without target is a flush request acknowledged by collector once
+    records before it were written.
+    """
+
+    def __init__(self, sock_path):
+        """
+        Constructor
+
+        type: str
+        @param: sock_path - Unix socket path of log collector
+
+        Raises OSError if collector is not reachable.
+        """
+
+        self.sock_path = sock_path
+        self.seq = 0
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self.sock.connect(sock_path)
+        except OSError:
+            self.sock.close()
+            raise
+
+    #==========================================================================
+
+    def send(self, records):
+        """
+        Send records and wait acknowledge of flush requests in them.
+
+        type: list
+        @param: records - (target, line), target None for flush request
+
+        Raises OSError if collector is not reachable.
+        """
+
+        data = []
+        flushes = 0
+        for target, line in records:
+            self.seq += 1
+            if target is None:
+                flushes += 1
+                line = None
+            data.append(json.dumps([os.getpid(), self.seq, target, line]))
+        self.sock.sendall(('%s\n' % '\n'.join(data)).encode(LOGSRV_ENC_UTF8))
+
+        while flushes:
+            ack = self.sock.recv(flushes)
+            if not ack:
+                raise ConnectionResetError(self.sock_path)
+            flushes -= len(ack)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Close connection
+        """
+
+        self.sock.close()
+
+        return SYS.RC_NO_ERROR
+
+#==============================================================================
+
+class LogCollector(object):
+    """
+    Log collector hosted by executor. A thread receives records of all
+    connected processes, numbers them in arrival order (global sequence),
+    checks sequence of each process and writes them to their log files
+    (kept open) or console.
+    """
+
+    def __init__(self, max_files = None):
+        """
+        Constructor
+
+        type: number
+        @param: max_files - log files kept open at most (optional, CFG.SW_LOG_COLLECTOR_FILES by default)
+        """
+
+        self.pid = os.getpid()
+        self.sock_path = LOGSRV_SOCK_FILE % (tempfile.gettempdir(), self.pid)
+        self.max_files = int(max_files or CFG.SW_LOG_COLLECTOR_FILES)
+        self.files = {}
+        self.seq = 0
+        self.lost = 0
+        self.senders = set()
+        self.thread = None
+
+    #==========================================================================
+
+    def start(self):
+        """
+        Listen on Unix socket and start collector thread
+        """
+
+        try:
+            os.remove(self.sock_path)
+        except OSError:
+            pass
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(self.sock_path)
+        self.server.listen(socket.SOMAXCONN)
+        self.wake_r, self.wake_w = os.pipe()
+        self.thread = threading.Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Stop collector thread, close log files and remove Unix socket (only
+        in process that started it).
+
+        rtype: tuple
+        @return: records written, processes connected and records lost
+        """
+
+        if self.thread is None or os.getpid() != self.pid:
+            return self.seq, len(self.senders), self.lost
+
+        os.write(self.wake_w, LOGSRV_ACK)
+        self.thread.join()
+        self.thread = None
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+        self.server.close()
+        os.close(self.wake_r)
+        os.close(self.wake_w)
+        try:
+            os.remove(self.sock_path)
+        except OSError:
+            pass
+
+        return self.seq, len(self.senders), self.lost
+
+    #==========================================================================
+
+    def __run(self):
+        """
+        Collector thread loop: accept connections and read their records
+        until it is woken up to stop.
+        """
+
+        selector = selectors.DefaultSelector()
+        selector.register(self.server, selectors.EVENT_READ)
+        selector.register(self.wake_r, selectors.EVENT_READ)
+        conns = {}
+        running = True
+        while running:
+            for key, events in selector.select():
+                if key.fileobj is self.server:
+                    conn, addr = self.server.accept()
+                    conns[conn] = [b'', 0]
+                    selector.register(conn, selectors.EVENT_READ)
+                elif key.fileobj == self.wake_r:
+                    running = False
+                else:
+                    conn = key.fileobj
+                    try:
+                        data = conn.recv(LOGSRV_READ_SIZE)
+                    except OSError:
+                        data = b''
+                    if not data:
+                        selector.unregister(conn)
+                        conn.close()
+                        del conns[conn]
+                        continue
+                    self.__read(conn, conns[conn], data)
+
+        #Records sent before stop
+        for conn, state in conns.items():
+            conn.setblocking(False)
+            try:
+                while True:
+                    data = conn.recv(LOGSRV_READ_SIZE)
+                    if not data:
+                        break
+                    self.__read(conn, state, data)
+            except OSError:
+                pass
+            conn.close()
+        selector.close()
+
+    #==========================================================================
+
+    def __read(self, conn, state, data):
+        """
+        Write complete records received from a connection, then acknowledge
+        its flush requests.
+
+        type: list
+        @param: state - bytes of incomplete record and last sequence number
+        """
+
+        lines = (state[0] + data).split(b'\n')
+        state[0] = lines.pop()
+        flushes = 0
+        touched = set()
+        for line in lines:
+            try:
+                pid, seq, target, text = json.loads(line.decode(LOGSRV_ENC_UTF8))
+            except ValueError:
+                continue
+            self.senders.add(pid)
+            self.lost += max(seq - state[1] - 1, 0)
+            state[1] = seq
+            if target is None:
+                flushes += 1
+                continue
+            self.seq += 1
+            touched.add(target)
+            self.__write(target, text)
+
+        for target in touched:
+            if target == LOGSRV_CONSOLE:
+                sys.stdout.flush()
+            elif target in self.files:
+                self.files[target].flush()
+        if flushes:
+            try:
+                conn.sendall(LOGSRV_ACK * flushes)
+            except OSError:
+                pass
+
+    #==========================================================================
+
+    def __write(self, target, text):
+        """
+        Write a record to its log file or console
+        """
+
+        if target == LOGSRV_CONSOLE:
+            sys.stdout.write(text)
+            return
+
+        f = self.files.pop(target, None)
+        if f is None:
+            #Least recently written file is closed
+            if len(self.files) >= self.max_files:
+                oldest = next(iter(self.files))
+                self.files.pop(oldest).close()
+            try:
+                f = open(target, 'a')
+            except OSError as e:
+                sys.stderr.write('%s: %s\n' % (target, e))
+                return
+        self.files[target] = f
+        f.write(text)
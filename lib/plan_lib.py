@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : plan_lib.py
+#description     : Library to serialize custom definitions as execution plans
+#                  (JSON with schema version, test case order and arguments
+#                  resolved and content hash).
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to serialize custom definitions as execution plans (JSON with schema
+version, test case order and arguments resolved and content hash).
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import re
+import sys
+import json
+import hashlib
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+PLAN_FORMAT = 'ptest_fwk_plan'
+PLAN_VERSION = 1
+PLAN_STDIN = '-'
+PLAN_FILE = '%s/%s.json'
+PLAN_ENC_UTF8 = 'utf-8'
+PLAN_HASH_RE = r'^[0-9a-f]{64}$'
+PLAN_NOT_VALID = 'Execution plan not valid: %s'
+PLAN_NOT_FOUND = 'Execution plan [ %s ] not found'
+PLAN_BAD_FORMAT = 'format is not %s' % PLAN_FORMAT
+PLAN_BAD_VERSION = 'schema version (%s) not supported (%d)'
+PLAN_BAD_HASH = 'content hash does not match'
+PLAN_BAD_DEF = 'definition type is not valid'
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getPlanHash(plan):
+    """
+    Get content hash of an execution plan: definition and run values.
+
+    type: dictionary
+    @param: plan - execution plan
+
+    rtype: str
+    @return: sha256 hex digest
+    """
+
+    content = {'version' : plan['version'], 'run' : plan['run'], 'definition' : plan['definition']}
+
+    return hashlib.sha256(json.dumps(content, sort_keys=True, separators=(',', ':')).encode(PLAN_ENC_UTF8)).hexdigest()
+
+#==============================================================================
+
+def getPlanTestCases(test_cases):
+    """
+    Get test cases of a definition as list sorted by order with arguments
+    resolved.
+
+    type: dictionary
+    @param: test_cases - test cases by order
+
+    rtype: list
+    @return: test cases with order
+    """
+
+    plan_cases = []
+    for k, v in sorted(test_cases.items(), key=lambda item: int(item[0])):
+        tcase = dict(v, order=int(k))
+        tcase['args'] = '%s' % v.get('args', '')
+        plan_cases.append(tcase)
+
+    return plan_cases
+
+#==============================================================================
+
+def getDefTestCases(plan_cases):
+    """
+    Get test cases of an execution plan as definition dictionary.
+
+    type: list
+    @param: plan_cases - test cases with order
+
+    rtype: dictionary
+    @return: test cases by order
+    """
+
+    test_cases = {}
+    for tcase in plan_cases:
+        tcase = dict(tcase)
+        test_cases[int(tcase.pop('order'))] = tcase
+
+    return test_cases
+
+#==============================================================================
+
+def makePlan(test_def, runmode = '0', test_id = '', log_path = '', options = ''):
+    """
+    Make execution plan of a definition (test or profile).
+
+    type: dictionary
+    @param: test_def - test or profile definition (profile tests with test cases)
+
+    type: str
+    @param: runmode - run mode [ 0 (sequential) | 1 (parallel) ]
+
+    type: str
+    @param: test_id - custom Test ID (optional)
+
+    type: str
+    @param: log_path - log path (optional)
+
+    type: str
+    @param: options - executor options as key=value list (optional)
+
+    rtype: dictionary
+    @return: execution plan
+    """
+
+    definition = dict(test_def)
+    if definition['type'] == CFG.SW_TD_PROFILE:
+        definition['tests'] = []
+        for k, v in sorted(test_def['tests'].items(), key=lambda item: int(item[0])):
+            test = dict(v, key=int(k))
+            test['test_cases'] = getPlanTestCases(v.get('test_cases', {}))
+            definition['tests'].append(test)
+    else:
+        definition['test_cases'] = getPlanTestCases(test_def['test_cases'])
+
+    plan = {
+        'format' : PLAN_FORMAT,
+        'version' : PLAN_VERSION,
+        'run' : {'runmode' : '%s' % runmode, 'test_id' : test_id or '', 'log_path' : log_path or '', 'options' : options or ''},
+        'definition' : definition,
+        }
+    plan['hash'] = getPlanHash(plan)
+
+    return plan
+
+#==============================================================================
+
+def getPlanDefinition(plan):
+    """
+    Get definition (test or profile) of an execution plan.
+
+    type: dictionary
+    @param: plan - execution plan
+
+    rtype: dictionary
+    @return: definition with test cases by order
+    """
+
+    test_def = dict(plan['definition'])
+    if test_def['type'] == CFG.SW_TD_PROFILE:
+        test_def['tests'] = {}
+        for test in plan['definition']['tests']:
+            test = dict(test)
+            test['test_cases'] = getDefTestCases(test['test_cases'])
+            test_def['tests'][int(test.pop('key'))] = test
+    else:
+        test_def['test_cases'] = getDefTestCases(plan['definition']['test_cases'])
+
+    return test_def
+
+#==============================================================================
+
+def checkPlan(plan):
+    """
+    Check format, schema version and content hash of an execution plan.
+
+    type: dictionary
+    @param: plan - execution plan
+
+    Raises ValueError if execution plan is not valid.
+    """
+
+    if not isinstance(plan, dict) or plan.get('format') != PLAN_FORMAT:
+        raise ValueError(PLAN_NOT_VALID % PLAN_BAD_FORMAT)
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(PLAN_NOT_VALID % (PLAN_BAD_VERSION % (plan.get('version'), PLAN_VERSION)))
+    try:
+        if plan['hash'] != getPlanHash(plan):
+            raise ValueError(PLAN_NOT_VALID % PLAN_BAD_HASH)
+        if plan['definition']['type'] not in (CFG.SW_TD_TEST, CFG.SW_TD_PROFILE):
+            raise ValueError(PLAN_NOT_VALID % PLAN_BAD_DEF)
+    except (KeyError, TypeError) as e:
+        raise ValueError(PLAN_NOT_VALID % e)
+
+    return SYS.RC_NO_ERROR
+
+#==============================================================================
+
+def loadPlan(source):
+    """
+    Load execution plan from a JSON file, standard input ('-') or plans cache
+    (content hash).
+
+    type: str
+    @param: source - file path, '-' or content hash
+
+    rtype: dictionary
+    @return: execution plan
+
+    Raises ValueError if execution plan is not found or it is not valid.
+    """
+
+    if source == PLAN_STDIN:
+        data = sys.stdin.read()
+    else:
+        pathfile = source
+        if re.match(PLAN_HASH_RE, source) and not os.path.exists(source):
+            pathfile = PLAN_FILE % (CFG.SW_PLAN_PATH, source)
+        try:
+            with open(pathfile, 'r') as f:
+                data = f.read()
+        except OSError:
+            raise ValueError(PLAN_NOT_FOUND % source)
+
+    try:
+        plan = json.loads(data)
+    except ValueError as e:
+        raise ValueError(PLAN_NOT_VALID % e)
+    checkPlan(plan)
+
+    return plan
+
+#==============================================================================
+
+def dumpPlan(plan, pathfile = None):
+    """
+    Write execution plan as JSON file. Without file, plan is kept in plans
+    cache by its content hash (written once).
+
+    type: dictionary
+    @param: plan - execution plan
+
+    type: str
+    @param: pathfile - file path, '-' for standard output (optional)
+
+    rtype: str
+    @return: file path
+    """
+
+    if pathfile == PLAN_STDIN:
+        json.dump(plan, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return pathfile
+
+    if not pathfile:
+        pathfile = PLAN_FILE % (CFG.SW_PLAN_PATH, plan['hash'])
+        if os.path.exists(pathfile):
+            return pathfile
+        os.makedirs(CFG.SW_PLAN_PATH, exist_ok=True)
+
+    tmp_file = '%s.%d' % (pathfile, os.getpid())
+    with open(tmp_file, 'w') as f:
+        json.dump(plan, f, indent=2)
+    os.replace(tmp_file, pathfile)
+
+    return pathfile
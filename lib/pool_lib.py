@@ -0,0 +1,530 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : pool_lib.py
+#description     : Library to run test case instances into a pool of
+#                  pre-forked workers with the test module already imported.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to run test case instances into a pool of pre-forked workers
+with the test module already imported.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import common_lib as LIB
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from lib import proc_lib as PROCLIB
+from lib import testctrl_lib as CTRL
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import json
+import signal
+import resource
+import selectors
+import importlib
+import traceback
+from collections import deque
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Strings
+POOL_NO_CTRL = 'Test [ %s ] has no TestController instance'
+POOL_WORKER_DEAD = 'Pool worker [ %d ] exited with code [ %s ]'
+POOL_ENC_UTF8 = 'utf-8'
+
+#Seconds between checks of workers state while waiting a job
+POOL_POLL_TIME = 0.5
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getController(module):
+    """
+    Get TestController instance declared in a test module.
+
+    type: module
+    @param: module - test module
+
+    rtype: TestController
+    @return: controller object, None if not found
+    """
+
+    for value in vars(module).values():
+        if isinstance(value, CTRL.TestController):
+            return value
+
+    return None
+
+#==============================================================================
+
+def importTest(test_name):
+    """
+    Import a test module keeping caller signal traps (TestController sets
+    its own traps when test is imported).
+
+    type: str
+    @param: test_name - test name
+
+    rtype: list of module and TestController
+    @return: test module and its controller (None if not found)
+    """
+
+    sigint = signal.getsignal(signal.SIGINT)
+    sigterm = signal.getsignal(signal.SIGTERM)
+    module = importlib.import_module(LIB.CMN_MOD_TEST % (test_name, test_name))
+    signal.signal(signal.SIGINT, sigint)
+    signal.signal(signal.SIGTERM, sigterm)
+
+    return module, getController(module)
+
+#==============================================================================
+
+def runTestCase(module, controller, args, env = None):
+    """
+    Run a test case instance through TestController as a test script does.
+
+    type: module
+    @param: module - test module
+
+    type: TestController
+    @param: controller - test controller object
+
+    type: list
+    @param: args - test case arguments (same as script argv)
+
+    type: dictionary
+    @param: env - environment variables for test case (optional)
+
+    rtype: number
+    @return: test case exit code
+    """
+
+    #Environment for this test case only
+    env_prev = {}
+    for key, value in (env or {}).items():
+        env_prev[key] = os.environ.get(key)
+        os.environ[key] = value
+
+    #Reset test case properties from previous run
+    controller.testrunning = None
+    controller.log = None
+    controller.prot_signal_emit = False
+    controller.hosted = {}
+
+    #Test cases use module global 'log' as set in test script main
+    log = LOG.Logging(args[5])
+    module.log = log
+    try:
+        controller.main(args, vars(module), log)
+        rc = SYS.EXIT_NO_ERROR
+    except SystemExit as e:
+        rc = getExitCode(e.code)
+    except Exception:
+        traceback.print_exc()
+        rc = SYS.EXIT_ERROR
+
+    controller.testrunning = None
+    controller.log = None
+
+    for key, value in env_prev.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+    return rc
+
+#==============================================================================
+
+def getExitCode(code):
+    """
+    Get numeric exit code from a SystemExit code (same as interpreter exit).
+
+    type: object
+    @param: code - SystemExit code
+
+    rtype: number
+    @return: exit code
+    """
+
+    if code is None:
+        return SYS.EXIT_NO_ERROR
+    if isinstance(code, int):
+        return code
+
+    return SYS.EXIT_ERROR
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class PoolJob(object):
+    """
+    Handle of a test case instance dispatched to a pool worker.
+    It exposes same attributes than Popen used by PROCLIB (pid, returncode,
+    poll and wait) and a fileno to wait exits by selectors.
+    """
+
+    def __init__(self, pool, command, env = None):
+        """
+        Constructor
+
+        type: WorkerPool
+        @param: pool - pool running the job
+
+        type: list
+        @param: command - test case arguments (same as script argv)
+
+        type: dictionary
+        @param: env - environment variables for test case (optional)
+        """
+
+        self.pool = pool
+        self.args = command
+        self.env = env or {}
+        self.pid = None
+        self.returncode = None
+        self.rusage = None
+
+    #==========================================================================
+
+    def poll(self):
+        """
+        Check if job finished.
+
+        rtype: number
+        @return: exit code, None if still running
+        """
+
+        if self.returncode is None:
+            self.pool.pump(0)
+
+        return self.returncode
+
+    #==========================================================================
+
+    def cancel(self):
+        """
+        Remove job from pool queue if it was not dispatched to a worker yet.
+
+        rtype: boolean
+        @return: True if job was cancelled (exit code EXIT_SKIPPED)
+        """
+
+        if self.pid is None and self in self.pool.queue:
+            self.pool.queue.remove(self)
+            self.returncode = SYS.EXIT_SKIPPED
+            return True
+
+        return False
+
+    #==========================================================================
+
+    def fileno(self):
+        """
+        Descriptor readable when pool reports an exit (to wait by selectors).
+
+        rtype: number
+        @return: file descriptor, None if pool is closed
+        """
+
+        return self.pool.result_fd
+
+    #==========================================================================
+
+    def wait(self):
+        """
+        Wait job to finish.
+
+        rtype: number
+        @return: exit code
+        """
+
+        while self.returncode is None:
+            self.pool.pump(POOL_POLL_TIME)
+
+        return self.returncode
+
+#==============================================================================
+
+class WorkerPool(object):
+    """
+    Pool of pre-forked workers to run test cases of a test.
+    """
+
+    def __init__(self, test_name, workers = None):
+        """
+        Constructor
+
+        type: str
+        @param: test_name - test name
+
+        type: number
+        @param: workers - number of workers (optional, CPU count by default)
+        """
+
+        self.test_name = test_name
+        if not workers:
+            workers = CFG.SW_POOL_WORKERS or os.cpu_count() or 1
+        self.num_workers = int(workers)
+        self.workers = {}
+        self.queue = deque()
+        self.result_fd = None
+        self.result_w = None
+        self.result_buf = b''
+        self.selector = None
+        self.module = None
+        self.controller = None
+        self.closing = False
+
+    #==========================================================================
+
+    def start(self):
+        """
+        Import test module and fork workers.
+        """
+
+        self.module, self.controller = importTest(self.test_name)
+        if not self.controller:
+            print(POOL_NO_CTRL % self.test_name)
+            return SYS.RC_ERROR
+
+        #Result pipe kept open to replace killed workers
+        self.result_fd, self.result_w = os.pipe()
+        for i in range(self.num_workers):
+            self.__forkWorker()
+
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.result_fd, selectors.EVENT_READ)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def spawn(self, command, env = None):
+        """
+        Submit a test case instance to run in pool.
+
+        type: list
+        @param: command - test case arguments (same as script argv)
+
+        type: dictionary
+        @param: env - environment variables for test case (optional)
+
+        rtype: PoolJob
+        @return: job handle
+        """
+
+        job = PoolJob(self, command, env)
+        self.queue.append(job)
+        self.__dispatch()
+
+        return job
+
+    #==========================================================================
+
+    def pump(self, timeout):
+        """
+        Process worker results and dispatch queued jobs.
+
+        type: number
+        @param: timeout - seconds to wait for results (0 doesn't block)
+        """
+
+        if self.selector.select(timeout):
+            data = os.read(self.result_fd, 4096)
+            self.result_buf += data
+            while b'\n' in self.result_buf:
+                line, self.result_buf = self.result_buf.split(b'\n', 1)
+                pid, rc, usage = json.loads(line.decode(POOL_ENC_UTF8))
+                self.__finishJob(pid, rc, usage)
+            if not data: #All workers exited
+                self.selector.unregister(self.result_fd)
+                for pid in list(self.workers):
+                    self.__reapWorker(pid)
+
+        #Workers killed while running a job don't send result
+        for pid in list(self.workers):
+            self.__reapWorker(pid, os.WNOHANG)
+
+        #No workers alive to run queued jobs
+        if not self.workers:
+            while self.queue:
+                self.queue.popleft().returncode = SYS.EXIT_ERROR
+
+        self.__dispatch()
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Stop workers after finish their current job.
+        """
+
+        self.closing = True
+        for pid in list(self.workers):
+            os.close(self.workers[pid]['fd'])
+            self.__reapWorker(pid)
+
+        if self.result_w is not None:
+            os.close(self.result_w)
+            self.result_w = None
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+        if self.result_fd is not None:
+            os.close(self.result_fd)
+            self.result_fd = None
+
+    #==========================================================================
+
+    def __dispatch(self):
+        """
+        Send queued jobs to idle workers.
+        """
+
+        for pid, worker in self.workers.items():
+            if not self.queue:
+                break
+            if worker['job'] is None:
+                job = self.queue.popleft()
+                job.pid = pid
+                worker['job'] = job
+                os.write(worker['fd'], ('%s\n' % json.dumps([job.args, job.env])).encode(POOL_ENC_UTF8))
+
+    #==========================================================================
+
+    def __finishJob(self, pid, rc, usage):
+        """
+        Set exit code and resource usage to job and release worker.
+        """
+
+        worker = self.workers.get(pid)
+        if worker and worker['job']:
+            worker['job'].rusage = usage
+            worker['job'].returncode = rc
+            worker['job'] = None
+            #Worker usage already reported by jobs
+            PROCLIB.addRusage(worker['used'], usage)
+
+    #==========================================================================
+
+    def __reapWorker(self, pid, flags = 0):
+        """
+        Collect exit status of a worker. A job interrupted by worker exit gets
+        the same return code than Popen (-signal or exit code) and worker
+        resource usage not reported by previous jobs.
+        """
+
+        try:
+            wpid, status, ru = os.wait4(pid, flags)
+            rc = PROCLIB.getStatusCode(status)
+        except ChildProcessError: #Reaped elsewhere, exit status is lost
+            wpid, rc, ru = pid, SYS.EXIT_ERROR, None
+        if not wpid:
+            return
+
+        worker = self.workers.pop(pid)
+        try:
+            os.close(worker['fd'])
+        except OSError:
+            pass
+        if worker['job']:
+            if ru:
+                worker['job'].rusage = PROCLIB.addRusage(PROCLIB.getRusage(ru), worker['used'], -1)
+            worker['job'].returncode = rc
+            print(POOL_WORKER_DEAD % (pid, worker['job'].returncode))
+            #Worker killed with its job (e.g. timeout), keep pool size
+            if not self.closing:
+                self.__forkWorker()
+
+    #==========================================================================
+
+    def __forkWorker(self):
+        """
+        Fork a worker in its own process group (it can be killed with
+        children of its job).
+        """
+
+        #Flush before fork to avoid duplicate buffered output
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        job_r, job_w = os.pipe()
+        pid = os.fork()
+        if pid == 0: #Worker
+            os.close(job_w)
+            os.close(self.result_fd)
+            for worker in self.workers.values():
+                os.close(worker['fd'])
+            os.setpgrp()
+            self.__workerLoop(self.module, self.controller, job_r, self.result_w)
+        os.close(job_r)
+        self.workers[pid] = {'fd' : job_w, 'job' : None, 'used' : {}}
+
+        return pid
+
+    #==========================================================================
+
+    def __workerLoop(self, module, controller, job_r, result_w):
+        """
+        Worker main loop: run jobs received until pipe is closed, each job
+        result has its exit code and resource usage (worker and children
+        of job). It never returns to caller.
+        """
+
+        code = SYS.EXIT_NO_ERROR
+        try:
+            signal.signal(signal.SIGINT, controller.stopTestBySignal)
+            signal.signal(signal.SIGTERM, controller.stopTestBySignal)
+            jobs = os.fdopen(job_r, 'r', encoding=POOL_ENC_UTF8)
+            for line in jobs:
+                args, env = json.loads(line)
+                usage = self.__getUsage()
+                rc = runTestCase(module, controller, args, env)
+                #Logs of job written before its result
+                LOG.flushLogs()
+                sys.stdout.flush()
+                usage = PROCLIB.addRusage(self.__getUsage(), usage, -1)
+                #Same exit code than a process exit
+                os.write(result_w, ('%s\n' % json.dumps([os.getpid(), rc & 0xff, usage])).encode(POOL_ENC_UTF8))
+        except SystemExit as e:
+            code = getExitCode(e.code)
+        except BaseException:
+            traceback.print_exc()
+            code = SYS.EXIT_ERROR
+        finally:
+            LOG.flushLogs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    #==========================================================================
+
+    def __getUsage(self):
+        """
+        Worker resource usage including its finished children.
+
+        rtype: dictionary
+        @return: resource usage record (max RSS is the highest of both)
+        """
+
+        usage = PROCLIB.getRusage(resource.getrusage(resource.RUSAGE_SELF))
+
+        return PROCLIB.addRusage(usage, PROCLIB.getRusage(resource.getrusage(resource.RUSAGE_CHILDREN)))
@@ -15,14 +15,16 @@ Library file to cover execution of subprocesses.
 #============================= FWK IMPORTS ====================================
 #==============================================================================
 
-#...
+from lib import sys_lib as SYS
 
 #==============================================================================
 #============================= OTHER IMPORTS ==================================
 #==============================================================================
 
 import os
+import time
 import signal
+import selectors
 from subprocess import *
 
 #==============================================================================
@@ -35,6 +37,15 @@ PROC_NOT_RUN = 'Not Running'
 PROC_NO_PROC = 'No such process [ %d ]'
 PROC_CMD_DCD_UTF8 = 'utf-8'
 
+#Seconds between checks of processes without exit notification (no pidfd
+#support or launcher handles)
+PROC_POLL_TIME = 0.5
+
+#Resource usage fields (os.wait4 rusage) recorded per test case instance
+PROC_RU_TIMES = ('utime', 'stime')
+PROC_RU_COUNTS = ('nvcsw', 'nivcsw', 'inblock', 'oublock')
+PROC_RU_MAXRSS = 'maxrss'
+
 #Commands
 PROC_CMD_INST_TC = 'ps aux | grep "%s.py %s" | grep -v $$ | grep -v -c "grep" ; sleep 1'
 PROC_CMD_INST_TEST = 'ps aux | grep "%s.py" | grep -v $$ | grep -v -c "grep"'
@@ -43,7 +54,7 @@ PROC_CMD_INST_TEST = 'ps aux | grep "%s.py" | grep -v $$ | grep -v -c "grep"'
 #================================ FUNCTIONS ===================================
 #==============================================================================
 
-def execProcDetch(command, proc_flag = False):
+def execProcDetch(command, proc_flag = False, launcher = None, pass_fds = (), env = None, new_group = False):
     """
     Execute a subprocess in detached mode
 
@@ -54,13 +65,30 @@ def execProcDetch(command, proc_flag = False):
     @param: proc_flag - False (run command showing output) | True (run command
                              without showing output) (optional)
 
+    @type: WorkerPool | ForkServer
+    @param: launcher - launcher with test module pre-imported, instead of a
+                       new interpreter (optional)
+
+    @type: list
+    @param: pass_fds - file descriptors to keep open in process (optional)
+
+    @type: dictionary
+    @param: env - environment variables to add for process (optional)
+
+    @type: boolean
+    @param: new_group - run process in its own session and process group (optional)
+
     @rtype: subprocess
-    @return: process object
+    @return: process object (or handle with same pid, returncode and wait())
     """
+    if launcher: #Pre-imported test module
+        return launcher.spawn(command, env)
+
+    proc_env = dict(os.environ, **env) if env else None
     if proc_flag: #Hidde output
-        process = Popen(command, stdin=PIPE, stdout=PIPE, stderr=PIPE)
+        process = Popen(command, stdin=PIPE, stdout=PIPE, stderr=PIPE, pass_fds=pass_fds, env=proc_env, start_new_session=new_group)
     else: #Show output
-        process = Popen(command)
+        process = Popen(command, pass_fds=pass_fds, env=proc_env, start_new_session=new_group)
 
     return process
 
@@ -104,23 +132,24 @@ def listPids(procs, signal_prot):
     @type: list
     @param: signal_prot - list of protected attributes against sys signals
 
-    @rtype: list [pid, no. instance, 'Status', Exit code]
+    @rtype: list [pid, no. instance, 'Status', Exit code, protected, rusage]
     @return: list of protected attribute
     """
     pids = []
     for i in range(len(procs)):
         pid = procs[i].pid
-        pids.append([pid, (i+1), PROC_RUN, None, signal_prot[i]])
+        pids.append([pid, (i+1), PROC_RUN, None, signal_prot[i], None])
 
     return pids
 
 #==============================================================================
 
-def waitPids(procs, pids):
+def waitPids(procs, pids, callback = None):
     """
     Put to wait a list of detached subprocesses and
     return array with status and exit code when
-    all of them finished.
+    all of them finished. Each exit is recorded into pids list
+    as soon as it happens (no matter list order).
 
     @type: list (Popen)
     @param: procs - list of subprocess objects
@@ -128,19 +157,90 @@ def waitPids(procs, pids):
     @type: list
     @param: pids - list of pids info
 
+    @type: function
+    @param: callback - function called with pid info of each process
+                       when it finishes (optional)
+
     @rtype: list [pid, no. instance, 'Status', "Exit: code"]
     @return: pid list with exit codes
     """
+    waiter = ProcWaiter(callback)
     for i in range(len(procs)):
-        procs[i].wait()
-        pids[i][2] = PROC_NOT_RUN
-        pids[i][3] = procs[i].returncode
-        pids[i][4] = 0
+        waiter.add(procs[i], pids[i])
+    while waiter.pending():
+        waiter.waitNext()
+    waiter.close()
 
     return pids
 
 #==============================================================================
 
+def getStatusCode(status):
+    """
+    Get return code from a wait status, same as Popen returncode.
+
+    @type: number
+    @param: status - status from os.wait functions
+
+    @rtype: number
+    @return: exit code or -signal if process was killed
+    """
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+
+    return os.WEXITSTATUS(status)
+
+#==============================================================================
+
+def getRusage(ru):
+    """
+    Get resource usage record from a rusage structure.
+
+    @type: resource.struct_rusage
+    @param: ru - rusage from os.wait4 or resource.getrusage
+
+    @rtype: dictionary
+    @return: CPU seconds (utime, stime), max RSS in kB (maxrss),
+             context switches (nvcsw, nivcsw) and block I/O (inblock, oublock)
+    """
+    usage = {}
+    for field in PROC_RU_TIMES:
+        usage[field] = round(getattr(ru, 'ru_%s' % field), 6)
+    usage[PROC_RU_MAXRSS] = ru.ru_maxrss
+    for field in PROC_RU_COUNTS:
+        usage[field] = getattr(ru, 'ru_%s' % field)
+
+    return usage
+
+#==============================================================================
+
+def addRusage(total, usage, sign = 1):
+    """
+    Add (or subtract) a resource usage record to a total.
+    Max RSS keeps the highest value.
+
+    @type: dictionary
+    @param: total - resource usage total (updated)
+
+    @type: dictionary
+    @param: usage - resource usage record
+
+    @type: number
+    @param: sign - 1 to add, -1 to subtract (optional)
+
+    @rtype: dictionary
+    @return: total
+    """
+    for field in PROC_RU_TIMES:
+        total[field] = round(total.get(field, 0) + sign * usage.get(field, 0), 6)
+    for field in PROC_RU_COUNTS:
+        total[field] = total.get(field, 0) + sign * usage.get(field, 0)
+    total[PROC_RU_MAXRSS] = max(total.get(PROC_RU_MAXRSS, 0), usage.get(PROC_RU_MAXRSS, 0))
+
+    return total
+
+#==============================================================================
+
 def sendSignalPID(pid, signal):
     """
     send a sys signal to a process.
@@ -158,6 +258,27 @@ def sendSignalPID(pid, signal):
 
 #==============================================================================
 
+def sendSignalGroup(pid, signal):
+    """
+    send a sys signal to process group of a process (process and its
+    children), or to process only if it is not a group leader.
+
+    @type: number
+    @param: pid - process id (group leader)
+
+    @type: sys signal
+    @param: signal - sys signal to send
+    """
+    try:
+        if os.getpgid(pid) == pid:
+            os.killpg(pid, signal)
+        else:
+            os.kill(pid, signal)
+    except OSError:
+        print(PROC_NO_PROC % pid)
+
+#==============================================================================
+
 def getInstances(testname, method = None):
     """
     Get instances running for a test and method
@@ -180,3 +301,206 @@ def getInstances(testname, method = None):
     proc_inst = int(result.stdout.decode(PROC_CMD_DCD_UTF8))
     #print ('Instances already running:', 0 if (proc_inst - 1) < 0 else (proc_inst - 1))
     return proc_inst
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class ProcWaiter(object):
+    """
+    Event driven waiter of detached subprocesses (or launcher handles).
+    Process exits are notified by pidfd (Linux) and launcher pipes, exit
+    status is recorded in pid info as soon as each process finishes.
+    """
+
+    def __init__(self, callback = None):
+        """
+        Constructor
+
+        @type: function
+        @param: callback - function called with pid info of each process
+                           when it finishes (optional)
+        """
+        self.callback = callback
+        self.selector = selectors.DefaultSelector()
+        self.procs = {}
+        self.polled = []
+        self.launchers = {}
+
+    #==========================================================================
+
+    def add(self, proc, pid_info):
+        """
+        Add a process to wait
+
+        @type: subprocess
+        @param: proc - process object (or launcher handle)
+
+        @type: list
+        @param: pid_info - pid info to update [pid, no. instance, 'Status',
+                           Exit code, protected, rusage]
+        """
+        #[process, pid info, pidfd, launcher pipe]
+        entry = [proc, pid_info, None, None]
+        self.procs[id(proc)] = entry
+
+        if hasattr(proc, 'fileno'): #Launcher handle, exits come by launcher pipe
+            entry[3] = proc.fileno()
+            if entry[3] is not None:
+                if entry[3] not in self.launchers:
+                    self.launchers[entry[3]] = 0
+                    self.selector.register(entry[3], selectors.EVENT_READ)
+                self.launchers[entry[3]] += 1
+            self.polled.append(entry)
+            return
+
+        try:
+            entry[2] = os.pidfd_open(proc.pid)
+            self.selector.register(entry[2], selectors.EVENT_READ, entry)
+        except (AttributeError, OSError): #No pidfd support or process reaped
+            entry[2] = None
+            self.polled.append(entry)
+
+    #==========================================================================
+
+    def watch(self, fd, callback):
+        """
+        Call a function each time a descriptor is readable while processes
+        are waited (e.g. to drain a pipe written by them)
+
+        @type: number
+        @param: fd - file descriptor
+
+        @type: function
+        @param: callback - function called without arguments
+        """
+        self.selector.register(fd, selectors.EVENT_READ, callback)
+
+    #==========================================================================
+
+    def pending(self):
+        """
+        Number of processes still running
+
+        @rtype: number
+        @return: processes not finished
+        """
+        return len(self.procs)
+
+    #==========================================================================
+
+    def waitNext(self, timeout = None):
+        """
+        Wait until at least one process finishes (or timeout)
+
+        @type: number
+        @param: timeout - seconds to wait (optional, None blocks)
+
+        @rtype: list
+        @return: pid info of processes finished
+        """
+        finished = self.__checkPolled()
+        if finished or not self.procs:
+            return finished
+
+        deadline = None if timeout is None else time.time() + timeout
+        while not finished and self.procs:
+            wait = PROC_POLL_TIME if self.polled else None
+            if deadline is not None:
+                remain = max(deadline - time.time(), 0)
+                wait = remain if wait is None else min(wait, remain)
+            for key, mask in self.selector.select(wait):
+                if callable(key.data): #Descriptor watched
+                    key.data()
+                elif key.data: #pidfd readable, process exited
+                    if self.__reap(key.data[0]) is not None:
+                        finished.append(self.__finish(key.data))
+            #Launcher handles are checked on pipe events and poll time
+            finished += self.__checkPolled()
+            if deadline is not None and time.time() >= deadline:
+                break
+
+        return finished
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Release notification descriptors
+        """
+        for entry in list(self.procs.values()):
+            if entry[2] is not None:
+                os.close(entry[2])
+                entry[2] = None
+        self.selector.close()
+        self.procs = {}
+        self.polled = []
+        self.launchers = {}
+
+    #==========================================================================
+
+    def __checkPolled(self):
+        """
+        Check processes without pidfd notification and launcher handles
+        """
+        finished = []
+        for entry in list(self.polled):
+            if hasattr(entry[0], 'fileno'): #Launcher handle
+                returncode = entry[0].poll()
+            else:
+                returncode = self.__reap(entry[0])
+            if returncode is not None:
+                self.polled.remove(entry)
+                finished.append(self.__finish(entry))
+            else: #Pool jobs get pid when they are dispatched to a worker
+                entry[1][0] = entry[0].pid
+
+        return finished
+
+    #==========================================================================
+
+    def __reap(self, proc):
+        """
+        Reap a subprocess with its resource usage (kept in proc.rusage)
+
+        @rtype: number
+        @return: exit code, None if still running
+        """
+        if proc.returncode is None:
+            try:
+                pid, status, ru = os.wait4(proc.pid, os.WNOHANG)
+                if pid:
+                    proc.returncode = getStatusCode(status)
+                    proc.rusage = getRusage(ru)
+            except ChildProcessError: #Reaped elsewhere, exit status is lost
+                proc.returncode = SYS.EXIT_ERROR
+
+        return proc.returncode
+
+    #==========================================================================
+
+    def __finish(self, entry):
+        """
+        Record process exit into its pid info and notify it
+        """
+        proc, pid_info, pidfd, launcher_fd = entry
+        if pidfd is not None:
+            self.selector.unregister(pidfd)
+            os.close(pidfd)
+            entry[2] = None
+        if launcher_fd is not None:
+            self.launchers[launcher_fd] -= 1
+            if not self.launchers[launcher_fd]:
+                del self.launchers[launcher_fd]
+                self.selector.unregister(launcher_fd)
+        self.procs.pop(id(proc), None)
+
+        pid_info[0] = proc.pid
+        pid_info[2] = PROC_NOT_RUN
+        pid_info[3] = proc.returncode
+        pid_info[4] = 0
+        pid_info[5:] = [getattr(proc, 'rusage', None)]
+        if self.callback:
+            self.callback(pid_info)
+
+        return pid_info
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : resindex_lib.py
+#description     : Library to keep results of all Test IDs (runs, tests, test
+#                  cases and instances) in a SQLite index to query them
+#                  without read Test ID JSON reports.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Library to keep results of all Test IDs (runs, tests, test cases and
+instances) in a SQLite index to query them without read Test ID JSON
+reports.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from config import config as CFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import json
+import sqlite3
+import datetime
+
+#==============================================================================
+#=================================== VARS =====================================
+#==============================================================================
+
+#Index schema (user_version), index is dropped if it has other version
+RIDX_VERSION = 1
+RIDX_TIMEOUT = 30
+RIDX_TABLES = ('instances', 'test_cases', 'tests', 'runs')
+
+RIDX_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    log_path TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    profile TEXT,
+    mode TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    duration REAL,
+    exit_status INTEGER,
+    exit_msg TEXT,
+    rerun_of TEXT,
+    plan TEXT,
+    sha256sum TEXT,
+    UNIQUE (log_path, test_id)
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_name TEXT NOT NULL,
+    start_date TEXT,
+    end_date TEXT,
+    duration REAL,
+    test_cases INTEGER,
+    instances INTEGER,
+    passed INTEGER,
+    failed INTEGER,
+    PRIMARY KEY (run_id, test_name)
+);
+CREATE TABLE IF NOT EXISTS test_cases (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_name TEXT NOT NULL,
+    order_exec INTEGER NOT NULL,
+    method TEXT NOT NULL,
+    method_mode TEXT,
+    parameters TEXT,
+    duration REAL,
+    exit_status INTEGER,
+    instances INTEGER,
+    passed INTEGER,
+    failed INTEGER,
+    skipped INTEGER,
+    cached INTEGER,
+    PRIMARY KEY (run_id, test_name, order_exec)
+);
+CREATE TABLE IF NOT EXISTS instances (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_name TEXT NOT NULL,
+    order_exec INTEGER NOT NULL,
+    inst INTEGER,
+    method TEXT NOT NULL,
+    parameters TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    duration REAL,
+    queue_wait REAL,
+    exit_status INTEGER,
+    exit_msg TEXT,
+    skipped TEXT,
+    cached TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_start ON runs (start_date);
+CREATE INDEX IF NOT EXISTS test_cases_method ON test_cases (method, test_name);
+CREATE INDEX IF NOT EXISTS instances_test_case ON instances (run_id, test_name, order_exec);
+'''
+
+#Last runs of a query
+RIDX_RECENT = 'SELECT run_id, test_id, start_date FROM runs ORDER BY start_date DESC LIMIT ?'
+
+#Test case durations run by run (oldest first)
+RIDX_TREND = '''
+SELECT r.test_id, r.start_date, c.test_name, c.order_exec, c.duration, c.exit_status, c.instances, c.failed
+FROM test_cases c JOIN (%s) r USING (run_id)
+WHERE c.method = ? AND (? IS NULL OR c.test_name = ?)
+ORDER BY r.start_date
+''' % RIDX_RECENT
+
+#Test cases passed in some runs and failed in others, flips are outcome
+#changes from one run to next one
+RIDX_FLAKY = '''
+WITH outcomes AS (
+    SELECT c.test_name, c.order_exec, c.method, c.failed > 0 AS failed,
+           LAG(c.failed > 0) OVER (PARTITION BY c.test_name, c.order_exec, c.method ORDER BY r.start_date) AS previous,
+           r.test_id
+    FROM test_cases c JOIN (%s) r USING (run_id)
+    WHERE c.passed + c.failed > 0
+)
+SELECT test_name, order_exec, method, COUNT(*) AS runs, SUM(failed) AS failures,
+       SUM(failed != previous) AS flips, MAX(CASE WHEN failed THEN test_id END) AS last_failed
+FROM outcomes
+GROUP BY test_name, order_exec, method
+HAVING failures > 0 AND failures < runs
+ORDER BY flips DESC, failures DESC, test_name, order_exec
+''' % RIDX_RECENT
+
+#Test cases by mean duration
+RIDX_SLOWEST = '''
+SELECT c.test_name, c.order_exec, c.method, COUNT(*) AS runs, AVG(c.duration) AS mean, MAX(c.duration) AS longest
+FROM test_cases c JOIN (%s) r USING (run_id)
+WHERE c.duration IS NOT NULL
+GROUP BY c.test_name, c.order_exec, c.method
+ORDER BY mean DESC
+LIMIT ?
+''' % RIDX_RECENT
+
+RIDX_COUNT = 'SELECT COUNT(*) FROM %s'
+
+#==============================================================================
+#================================ FUNCTIONS ===================================
+#==============================================================================
+
+def getDuration(start_date, end_date):
+    """
+    Get seconds between two dates of a JSON report.
+
+    type: str
+    @param: start_date - start date (ISO format)
+
+    type: str
+    @param: end_date - end date (ISO format)
+
+    rtype: number
+    @return: seconds, None if some date is not set or it is not valid
+    """
+
+    if not start_date or not end_date:
+        return None
+    try:
+        start = datetime.datetime.fromisoformat(start_date)
+        end = datetime.datetime.fromisoformat(end_date)
+    except (TypeError, ValueError):
+        return None
+
+    return (end - start).total_seconds()
+
+#==============================================================================
+
+def getExitStatus(value):
+    """
+    Get exit status of a JSON report as number (written as number or string).
+
+    rtype: number
+    @return: exit status, None if it is not set
+    """
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+#==============================================================================
+
+def getParameters(value):
+    """
+    Get parameters of a test case instance as text (JSON if not a string).
+
+    rtype: str
+    @return: parameters, None if they are not set
+    """
+
+    if value is None or isinstance(value, str):
+        return value
+
+    return json.dumps(value)
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class ResultsIndex(object):
+    """
+    Results of runs by log path and Test ID in a SQLite database: one row per
+    run, test, test case (longest instance as its duration) and instance.
+    Runs are indexed again when their report is added again.
+    """
+
+    def __init__(self, index_file = None):
+        """
+        Constructor
+
+        type: str
+        @param: index_file - SQLite database file (optional, CFG.SW_RESULTS_DB by default)
+
+        Raises sqlite3.Error if database can not be opened.
+        """
+
+        self.index_file = index_file or CFG.SW_RESULTS_DB
+        os.makedirs(os.path.dirname(os.path.abspath(self.index_file)), exist_ok=True)
+        self.conn = sqlite3.connect(self.index_file, timeout=RIDX_TIMEOUT)
+        #Executors finalizing at same time do not block readers
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA foreign_keys=ON')
+        self.__setupSchema()
+
+    #==========================================================================
+
+    def close(self):
+        """
+        Close database
+        """
+
+        self.conn.close()
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def addReport(self, log_path, test_id, report):
+        """
+        Add results of a Test ID JSON report (replacing the ones indexed
+        before for it).
+
+        type: str
+        @param: log_path - logs path of Test ID
+
+        type: str
+        @param: test_id - Test ID of report
+
+        type: dictionary
+        @param: report - Test ID JSON report
+        """
+
+        with self.conn:
+            self.__addReport(os.path.abspath(log_path), test_id, report)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def rebuild(self, log_path = None):
+        """
+        Index again Test ID JSON reports in a logs path (one transaction). A
+        report that can not be indexed is skipped, not the whole rebuild.
+
+        type: str
+        @param: log_path - logs path (optional, CFG.SW_LOGS_PATH by default)
+
+        rtype: tuple
+        @return: number of runs indexed, Test IDs skipped with their error
+        """
+
+        log_path = os.path.abspath(log_path or CFG.SW_LOGS_PATH)
+        runs = 0
+        skipped = []
+        with self.conn:
+            self.conn.execute('DELETE FROM runs WHERE log_path = ?', (log_path,))
+            for test_id in SYS.listTestIDs(log_path):
+                report = LOG.readJSON(log_path, test_id)
+                if not report:
+                    continue
+                self.conn.execute('SAVEPOINT report')
+                try:
+                    self.__addReport(log_path, test_id, report)
+                    runs += 1
+                except (sqlite3.Error, ValueError, TypeError, AttributeError) as e:
+                    self.conn.execute('ROLLBACK TO report')
+                    skipped.append((test_id, e))
+                self.conn.execute('RELEASE report')
+
+        return runs, skipped
+
+    #==========================================================================
+
+    def getCounts(self):
+        """
+        Get number of rows of each table
+
+        rtype: list
+        @return: (table, rows) runs first
+        """
+
+        return [(table, self.conn.execute(RIDX_COUNT % table).fetchone()[0]) for table in reversed(RIDX_TABLES)]
+
+    #==========================================================================
+
+    def getTrend(self, method, test_name = None, last = 500):
+        """
+        Get duration and result of a test case in last runs.
+
+        type: str
+        @param: method - test case name
+
+        type: str
+        @param: test_name - test name (optional, all tests by default)
+
+        type: number
+        @param: last - last runs taken
+
+        rtype: list
+        @return: (test_id, start_date, test_name, order, duration, exit_status, instances, failed) oldest first
+        """
+
+        return self.conn.execute(RIDX_TREND, (last, method, test_name, test_name)).fetchall()
+
+    #==========================================================================
+
+    def getFlaky(self, last = 500):
+        """
+        Get test cases passed in some of last runs and failed in others.
+
+        type: number
+        @param: last - last runs taken
+
+        rtype: list
+        @return: (test_name, order, method, runs, failures, flips, last Test ID failed) most flips first
+        """
+
+        return self.conn.execute(RIDX_FLAKY, (last,)).fetchall()
+
+    #==========================================================================
+
+    def getSlowest(self, number = 10, last = 500):
+        """
+        Get slowest test cases by mean duration in last runs.
+
+        type: number
+        @param: number - test cases got
+
+        type: number
+        @param: last - last runs taken
+
+        rtype: list
+        @return: (test_name, order, method, runs, mean, longest) slowest first
+        """
+
+        return self.conn.execute(RIDX_SLOWEST, (last, number)).fetchall()
+
+    #==========================================================================
+
+    def __setupSchema(self):
+        """
+        Create tables (dropped first if index has other schema version)
+        """
+
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        with self.conn:
+            if version and version != RIDX_VERSION:
+                for table in RIDX_TABLES:
+                    self.conn.execute('DROP TABLE IF EXISTS %s' % table)
+        self.conn.executescript(RIDX_SCHEMA)
+        self.conn.execute('PRAGMA user_version=%d' % RIDX_VERSION)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __addReport(self, log_path, test_id, report):
+        """
+        Insert rows of a report (in transaction of caller). Instances without
+        order or test case name (reports of older versions) are not indexed.
+        """
+
+        self.conn.execute('DELETE FROM runs WHERE log_path = ? AND test_id = ?', (log_path, test_id))
+        cursor = self.conn.execute('INSERT INTO runs (log_path, test_id, profile, mode, start_date, end_date, duration, exit_status, exit_msg, rerun_of, plan, sha256sum) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                                   (log_path, test_id, report.get(LOG.JSON_PROFILE), report.get(LOG.JSON_MODE),
+                                    report.get(LOG.JSON_START_DATE), report.get(LOG.JSON_END_DATE),
+                                    getDuration(report.get(LOG.JSON_START_DATE), report.get(LOG.JSON_END_DATE)),
+                                    getExitStatus(report.get(LOG.JSON_EXIT_ST)), report.get(LOG.JSON_EXIT_MSG),
+                                    report.get(LOG.JSON_RERUN), report.get(LOG.JSON_PLAN), report.get(LOG.JSON_SHA256)))
+        run_id = cursor.lastrowid
+
+        tests = []
+        test_cases = []
+        instances = []
+        for test_name, testcs in report.get(LOG.JSON_TEST_EXEC, {}).items():
+            orders = {}
+            testcs = [testc for testc in testcs if testc.get('order_exec') is not None and testc.get('method')]
+            if not testcs:
+                continue
+            for testc in testcs:
+                order = getExitStatus(testc.get('order_exec'))
+                exit_status = getExitStatus(testc.get('exit_status'))
+                instances.append((run_id, test_name, order, getExitStatus(testc.get('concurrency_inst')), testc.get('method'),
+                                  getParameters(testc.get('parameters')), testc.get('start_date'), testc.get('end_date'),
+                                  getDuration(testc.get('start_date'), testc.get('end_date')), testc.get('queue_wait'),
+                                  exit_status, testc.get('exit_msg'),
+                                  None if testc.get('skipped') is None else '%s' % testc['skipped'],
+                                  None if testc.get('cached') is None else '%s' % testc['cached']))
+                orders.setdefault(order, []).append((testc, exit_status, instances[-1][8]))
+
+            test_passed = 0
+            test_failed = 0
+            for order, results in sorted(orders.items(), key=lambda item: (item[0] is None, item[0] or 0)):
+                skipped = len([testc for testc, exit_status, duration in results if testc.get('skipped')])
+                cached = len([testc for testc, exit_status, duration in results if testc.get('cached')])
+                passed = len([testc for testc, exit_status, duration in results if exit_status == SYS.EXIT_NO_ERROR and not testc.get('cached')])
+                failed = len(results) - passed - skipped - cached
+                durations = [duration for testc, exit_status, duration in results if duration is not None]
+                failures = [exit_status for testc, exit_status, duration in results if exit_status != SYS.EXIT_NO_ERROR]
+                test_cases.append((run_id, test_name, order, results[0][0].get('method'), results[0][0].get('method_mode'),
+                                   getParameters(results[0][0].get('parameters')), max(durations) if durations else None,
+                                   failures[0] if failures else SYS.EXIT_NO_ERROR, len(results), passed, failed, skipped, cached))
+                test_passed += passed
+                test_failed += failed
+
+            starts = [testc['start_date'] for testc in testcs if testc.get('start_date') and testc.get('end_date')]
+            ends = [testc['end_date'] for testc in testcs if testc.get('start_date') and testc.get('end_date')]
+            start_date = min(starts) if starts else None
+            end_date = max(ends) if ends else None
+            tests.append((run_id, test_name, start_date, end_date, getDuration(start_date, end_date),
+                          len(orders), len(testcs), test_passed, test_failed))
+
+        self.conn.executemany('INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', tests)
+        self.conn.executemany('INSERT INTO test_cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', test_cases)
+        self.conn.executemany('INSERT INTO instances VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', instances)
+
+        return SYS.RC_NO_ERROR
@@ -35,6 +35,7 @@ EXIT_TIMEOUT = -1
 EXIT_NO_ERROR = 0
 EXIT_ERROR = 1
 EXIT_BY_SIGNAL = 2
+EXIT_SKIPPED = 3
 
 #Return codes
 RC_NO_ERROR = 0
@@ -45,6 +46,7 @@ EXIT_TIMEOUT_MSG = 'Timeout exit (%d)' % EXIT_TIMEOUT
 EXIT_NO_ERROR_MSG = 'Exit without error (%d)' % EXIT_NO_ERROR
 EXIT_ERROR_MSG = 'Exit with error (%d)' % EXIT_ERROR
 EXIT_BY_SIGNAL_MSG = 'System signal (%d), exit.' % EXIT_BY_SIGNAL
+EXIT_SKIPPED_MSG = 'Skipped, not run (%d)' % EXIT_SKIPPED
 EXIT_UNKNOW_MSG = 'Unknow reason exit'
 
 #Strings
@@ -55,11 +57,29 @@ SYS_CONC_INIT_VAL = '0'
 SYS_LCK_WAIT = 'Waiting lock to released'
 SYS_NO_LCK_File = 'No Lock file'
 
+#Environment
+SYS_ENV_READY_FD = 'PTFWK_READY_FD'
+SYS_ENV_QUEUE_WAIT = 'PTFWK_QUEUE_WAIT'
+SYS_ENV_TC_ARGS = 'PTFWK_TC_ARGS'
+SYS_ENV_TC_INSTANCES = 'PTFWK_TC_INSTANCES'
+SYS_ENV_LOG_SOCK = 'PTFWK_LOG_SOCK'
+
+#Host resources
+SYS_MEMINFO_FILE = '/proc/meminfo'
+SYS_MEMINFO_AVAIL = 'MemAvailable:'
+
 #Files
 SYS_CONC_CNT_FILE = 'exit_conc'
 SYS_CONC_LCK_FILE = 'exit_conc.lock'
 SYS_CONC_PARLCK_FILE = 'exit_conc_par.lock'
 
+#Test ID folders (sharded layout: logs/00/01/000123)
+SYS_TESTID_DIR = '%s/%s'
+SYS_TESTID_SHARD_DIR = '%s/%s/%s/%s'
+SYS_TESTID_FILES = ('%s.json', '%s.log')
+SYS_SHARD_LEN = 2
+SYS_SHARD_PAD = '_'
+
 #==============================================================================
 #================================ FUNCTIONS ===================================
 #==============================================================================
@@ -172,6 +192,120 @@ def exitTC(exit_code):
 
 #==============================================================================
 
+def notifyReady():
+    """
+    Notify executor that test case instance started (readiness handshake).
+    It does nothing if process was not launched by executor.
+    """
+
+    ready_fd = os.environ.get(SYS_ENV_READY_FD)
+    if ready_fd:
+        try:
+            os.write(int(ready_fd), ('%d\n' % os.getpid()).encode(SYS_CMD_DCD_ASCII))
+        except (OSError, ValueError):
+            pass
+
+#==============================================================================
+
+def getQueueWait():
+    """
+    Get seconds test case instance waited in executor queue before launch.
+
+    rtype: number
+    @return: seconds, 0 if process was not launched by executor
+    """
+
+    try:
+        return float(os.environ.get(SYS_ENV_QUEUE_WAIT, 0))
+    except ValueError:
+        return 0
+
+#==============================================================================
+
+def getTestCaseArgs(default):
+    """
+    Get test case arguments sent by executor (they can differ from test
+    module definition, e.g. rerun of failed test cases).
+
+    type: str
+    @param: default - arguments in test module definition
+
+    rtype: str
+    @return: arguments string
+    """
+
+    return os.environ.get(SYS_ENV_TC_ARGS, default)
+
+#==============================================================================
+
+def getTestCaseInstances(number):
+    """
+    Get instance numbers of an inprocess test case sent by executor (they
+    are not 1 to number in rerun of failed instances).
+
+    type: number
+    @param: number - number of instances
+
+    rtype: list
+    @return: instance numbers
+    """
+
+    try:
+        insts = [int(inst) for inst in os.environ[SYS_ENV_TC_INSTANCES].split(',')]
+    except (KeyError, ValueError):
+        insts = []
+
+    return insts if len(insts) == number else list(range(1, number+1))
+
+#==============================================================================
+
+def getLogCollector():
+    """
+    Get Unix socket of log collector hosted by executor.
+
+    rtype: str
+    @return: socket path, None if there is no log collector
+    """
+
+    return os.environ.get(SYS_ENV_LOG_SOCK)
+
+#==============================================================================
+
+def getLoadAvg():
+    """
+    Get host load average of last minute.
+
+    rtype: number
+    @return: load average, 0 if not available
+    """
+
+    try:
+        return os.getloadavg()[0]
+    except OSError:
+        return 0
+
+#==============================================================================
+
+def getMemAvailable():
+    """
+    Get host memory available for new processes (/proc/meminfo).
+
+    rtype: number
+    @return: memory in kB, None if not available
+    """
+
+    try:
+        with open(SYS_MEMINFO_FILE, 'r') as meminfo:
+            for line in meminfo:
+                if line.startswith(SYS_MEMINFO_AVAIL):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return None
+
+#==============================================================================
+
 def getExitMsg(exit_code):
     """
     Get a message from code number.
@@ -191,9 +325,114 @@ def getExitMsg(exit_code):
         return EXIT_ERROR_MSG
     elif exit_code == EXIT_BY_SIGNAL:
         return EXIT_BY_SIGNAL_MSG
+    elif exit_code == EXIT_SKIPPED:
+        return EXIT_SKIPPED_MSG
     else:
         return EXIT_UNKNOW_MSG
 
+#==============================================================================
+#==================== FUNCTIONS to resolve Test ID folders ====================
+#==============================================================================
+
+def getTestIDShard(test_id):
+    """
+    Get shard folders of a Test ID in sharded layout: its first two pairs of
+    characters (e.g. 00 and 01 for 000123), padded with '_' if it is short.
+
+    type: string
+    @param: test_id - Test ID string
+
+    rtype: tuple
+    @return: first and second level shard folder names
+    """
+
+    padded = test_id.ljust(2 * SYS_SHARD_LEN, SYS_SHARD_PAD)
+
+    return padded[:SYS_SHARD_LEN], padded[SYS_SHARD_LEN:2 * SYS_SHARD_LEN]
+
+#==============================================================================
+
+def getTestIDPath(log_path, test_id, sharded = None):
+    """
+    Get folder of a Test ID in logs path. Layout set (CFG.SW_LOGS_SHARDED) is
+    taken, but a Test ID only in the other layout (store not migrated yet)
+    is found there.
+
+    type: string
+    @param: log_path - logs path
+
+    type: string
+    @param: test_id - Test ID string
+
+    type: boolean
+    @param: sharded - layout of folder, no other layout is looked up (optional)
+
+    rtype: str
+    @return: Test ID folder path
+    """
+
+    flat = SYS_TESTID_DIR % (log_path, test_id)
+    shard = SYS_TESTID_SHARD_DIR % ((log_path,) + getTestIDShard(test_id) + (test_id,))
+    if sharded is not None:
+        return shard if sharded else flat
+
+    path, other = (shard, flat) if CFG.SW_LOGS_SHARDED else (flat, shard)
+    if not os.path.isdir(path) and os.path.isdir(other):
+        return other
+
+    return path
+
+#==============================================================================
+
+def isTestIDFolder(path, test_id):
+    """
+    Get boolean if a folder is a Test ID folder (it has JSON report or log of
+    Test ID).
+
+    type: string
+    @param: path - folder path
+
+    type: string
+    @param: test_id - folder name
+
+    rtype: boolean
+    @return: True if it is a Test ID folder, false otherwise
+    """
+
+    return any(os.path.exists(SYS_TESTID_DIR % (path, name % test_id)) for name in SYS_TESTID_FILES)
+
+#==============================================================================
+
+def listTestIDs(log_path):
+    """
+    Get Test IDs in logs path, flat and sharded layouts (a store is read
+    while it is migrated).
+
+    type: string
+    @param: log_path - logs path
+
+    rtype: list
+    @return: sorted Test ID strings, empty if logs path does not exist
+    """
+
+    test_ids = set()
+    try:
+        entries = [entry for entry in os.scandir(log_path) if entry.is_dir()]
+    except OSError:
+        return []
+
+    for entry in entries:
+        if len(entry.name) != SYS_SHARD_LEN or isTestIDFolder(entry.path, entry.name):
+            test_ids.add(entry.name)
+            continue
+        #Shard folders
+        for sub in os.scandir(entry.path):
+            if not sub.is_dir():
+                continue
+            test_ids.update(folder.name for folder in os.scandir(sub.path) if folder.is_dir())
+
+    return sorted(test_ids)
+
 #==============================================================================
 #================ FUNCTIONS to keep integrity in JSON Output ==================
 #==============================================================================
@@ -204,7 +443,7 @@ def createExit(test_id):
 
     """
 
-    exit_file = open('%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_CNT_FILE),'w')
+    exit_file = open('%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_CNT_FILE),'w')
     exit_file.write(SYS_CONC_INIT_VAL)
     exit_file.close()
 
@@ -222,7 +461,7 @@ def readValueExit(test_id):
     """
 
     try:
-        exit_file = open('%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_CNT_FILE),'r')
+        exit_file = open('%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_CNT_FILE),'r')
         line = exit_file.readline()
         exit_file.close()
         return line
@@ -242,8 +481,8 @@ def writeValueExit(test_id, op = False):
     @param: op - add or substract to value from file (flag True = -1, False = +1)
     """
 
-    lock_pathfile = '%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_LCK_FILE)
-    exit_pathfile = '%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_CNT_FILE)
+    lock_pathfile = '%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_LCK_FILE)
+    exit_pathfile = '%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_CNT_FILE)
     while (isLock(lock_pathfile)):
         print(SYS_LCK_WAIT)
         time.sleep(1)
@@ -274,7 +513,7 @@ def writeParallelMode(test_id):
     @param: test_id - Test ID string
     """
 
-    lock_pathfile = '%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_PARLCK_FILE)
+    lock_pathfile = '%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_PARLCK_FILE)
 
     #create lock
     lock_file = open(lock_pathfile,'w')
@@ -293,7 +532,7 @@ def isParallelMode(test_id):
     @return: True if lock file exists, false otherwise
     """
 
-    lock_pathfile = '%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_PARLCK_FILE)
+    lock_pathfile = '%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_PARLCK_FILE)
     return isLock(lock_pathfile)
 
 #==============================================================================
@@ -321,7 +560,7 @@ def removeExit(test_id):
     @param: test_id - Test ID string
     """
 
-    os.remove('%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_CNT_FILE))
+    os.remove('%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_CNT_FILE))
 
 #==============================================================================
 
@@ -333,4 +572,4 @@ def removeParallelMode(test_id):
     @param: test_id - Test ID string
     """
 
-    os.remove('%s/%s/%s' % (CFG.SW_LOGS_PATH,test_id, SYS_CONC_PARLCK_FILE))
+    os.remove('%s/%s' % (getTestIDPath(CFG.SW_LOGS_PATH, test_id), SYS_CONC_PARLCK_FILE))
@@ -31,6 +31,9 @@ import importlib
 import datetime
 import os
 import signal
+import asyncio
+import threading
+import traceback
 
 #==============================================================================
 #=================================== VARS =====================================
@@ -85,6 +88,8 @@ class TestCase(object):
     def __call__(self, args, tdef, test_ctrl, log):
         """
         Function to work as rules keeper after and before execution.
+        Process exits with test case return code (number of instances
+        failed in inprocess mode).
 
         type: sys.argv
         @param: args - argument list (method, mode, instance number)
@@ -97,6 +102,198 @@ class TestCase(object):
 
         """
 
+        if args[2] == CFG.SW_TC_INPROC:
+            rc = self.runInstances(args, tdef, test_ctrl, log)
+        else:
+            rc = self.run(args, tdef, test_ctrl, log)
+
+        #Exit with function Return code : RC Output
+        SYS.exitTC(rc)
+
+    #==========================================================================
+
+    def run(self, args, tdef, test_ctrl, log):
+        """
+        Run a test case instance without exit process.
+
+        type: list
+        @param: args - argument list (method, mode, instance number)
+
+        type: test_def
+        @param: test_def - test definition structure
+
+        type: TestController
+        @param: test_ctrl - test controller object
+
+        type: Logging
+        @param: log - log object
+
+        rtype: number
+        @return: test case return code
+        """
+
+        rc, attr = self.__enter(args, tdef, test_ctrl, log)
+        if rc is not None:
+            return rc
+
+        #Get start time
+        start_time = datetime.datetime.now()
+        #calling test case
+        rc = self.test_case(args)
+        if asyncio.iscoroutine(rc): #Coroutine test case
+            rc = asyncio.run(rc)
+
+        return self.__leave(args, test_ctrl, log, attr, start_time, rc)
+
+    #==========================================================================
+
+    async def runAsync(self, args, tdef, test_ctrl, log):
+        """
+        Run a coroutine test case instance as an asyncio task.
+
+        type: list
+        @param: args - argument list (method, mode, instance number)
+
+        type: test_def
+        @param: test_def - test definition structure
+
+        type: TestController
+        @param: test_ctrl - test controller object
+
+        type: Logging
+        @param: log - log object
+
+        rtype: number
+        @return: test case return code
+        """
+
+        rc, attr = self.__enter(args, tdef, test_ctrl, log)
+        if rc is not None:
+            return rc
+
+        #Get start time
+        start_time = datetime.datetime.now()
+        #calling test case
+        rc = await self.test_case(args)
+
+        return self.__leave(args, test_ctrl, log, attr, start_time, rc)
+
+    #==========================================================================
+
+    def runInstances(self, args, tdef, test_ctrl, log):
+        """
+        Run instances of an inprocess test case in this process: threads, or
+        asyncio tasks if test case is a coroutine. Each instance has its own
+        log file and JSON record as a test case process.
+
+        type: list
+        @param: args - argument list (method, mode, number of instances)
+
+        type: test_def
+        @param: test_def - test definition structure
+
+        type: TestController
+        @param: test_ctrl - test controller object
+
+        type: Logging
+        @param: log - log object
+
+        rtype: number
+        @return: number of instances failed
+        """
+
+        #Executor can launch next test case
+        SYS.notifyReady()
+
+        insts_args = []
+        for inst in SYS.getTestCaseInstances(int(args[3])):
+            inst_args = list(args[:7])
+            inst_args[3] = '%d' % inst
+            insts_args.append(inst_args)
+
+        if asyncio.iscoroutinefunction(self.test_case):
+            rcs = asyncio.run(self.__gatherInstances(insts_args, tdef, test_ctrl, log))
+        else:
+            rcs = [SYS.EXIT_ERROR] * len(insts_args)
+            threads = []
+            for inst, inst_args in enumerate(insts_args):
+                thread = threading.Thread(target=self.__runThread, args=(rcs, inst, inst_args, tdef, test_ctrl, log), daemon=True)
+                thread.start()
+                threads.append(thread)
+            for thread in threads:
+                thread.join()
+
+        #Protected instances finished after signal
+        if test_ctrl.getProtSignalEmit():
+            self.__writeSignalFooter(args[4], tdef['name'], 1, log)
+
+        return min(len([rc for rc in rcs if rc]), 255)
+
+    #==========================================================================
+
+    def __runThread(self, rcs, inst, args, tdef, test_ctrl, log):
+        """
+        Thread of a test case instance (inprocess mode)
+        """
+
+        try:
+            rcs[inst] = self.run(args, tdef, test_ctrl, self.__getInstanceLog(args, tdef, log))
+        except SystemExit as e: #Same exit code than a process exit
+            rcs[inst] = SYS.EXIT_NO_ERROR if e.code is None else e.code if isinstance(e.code, int) else SYS.EXIT_ERROR
+        except Exception:
+            traceback.print_exc()
+        test_ctrl.releaseInstance(args)
+
+    #==========================================================================
+
+    async def __gatherInstances(self, insts_args, tdef, test_ctrl, log):
+        """
+        Run asyncio tasks of test case instances (inprocess mode)
+
+        rtype: list
+        @return: return code of each instance
+        """
+
+        tasks = []
+        for args in insts_args:
+            tasks.append(asyncio.ensure_future(self.runAsync(args, tdef, test_ctrl, self.__getInstanceLog(args, tdef, log))))
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        rcs = []
+        for args, result in zip(insts_args, results):
+            if isinstance(result, BaseException):
+                traceback.print_exception(type(result), result, result.__traceback__)
+                result = SYS.EXIT_ERROR
+            test_ctrl.releaseInstance(args)
+            rcs.append(result)
+
+        return rcs
+
+    #==========================================================================
+
+    def __getInstanceLog(self, args, tdef, log):
+        """
+        Log object of a test case instance (same log file as a test case process)
+
+        rtype: Logging
+        @return: log object
+        """
+
+        inst_log = LOG.Logging(log.getLogPath())
+        inst_log.setTestLog(args[4], tdef['name'], args[1], args[3])
+
+        return inst_log
+
+    #==========================================================================
+
+    def __enter(self, args, tdef, test_ctrl, log):
+        """
+        Write test case header, check mode and instances and init test case.
+
+        rtype: list
+        @return: return code (None if test case can run) and test case attributes
+        """
+
         method = args[1]
         mode = args[2]
         num_instance = args[3]
@@ -136,35 +333,58 @@ class TestCase(object):
         log.logshow(CTRL_TC_DESCP % config_descp, LOG.INFO)
         log.logshow(CTRL_TC_INST % num_instance, LOG.INFO)
 
+        #Executor can launch next instance (inprocess notifies once)
+        if mode != CFG.SW_TC_INPROC:
+            SYS.notifyReady()
+
         #Protecting to override mode in functions than configured
         if config_mode != mode:
             log.show(CTRL_ERROR_MODE % mode, LOG.ERROR, LOG.WRONG)
             log.show(CTRL_SUPPORT_MODE % config_mode, LOG.INFO)
-            SYS.exitTC(SYS.EXIT_ERROR)
+            return SYS.EXIT_ERROR, attr
         if mode == CFG.SW_TC_CONC or mode == CFG.SW_TC_NORMAL:
             #Protecting to run more instances than configured
             rout = PROCLIB.getInstances(config_test_name, self.test_case.__name__)
             if rout > int(config_cinst):
                 log.logshow(CTRL_INST_NOTVALID % (config_test_name, self.test_case.__name__, config_cinst), LOG.ERROR, LOG.WRONG)
-                exit (SYS.EXIT_ERROR)
-        else:
+                return SYS.EXIT_ERROR, attr
+        elif mode != CFG.SW_TC_INPROC:
             log.show(CTRL_ERROR_MODE % mode, LOG.ERROR, LOG.WRONG)
-            SYS.exitTC(SYS.EXIT_ERROR)
+            return SYS.EXIT_ERROR, attr
 
         #Init test case properties
-        test_ctrl.initTestCase(args, log)
-        #Get start time
-        start_time = datetime.datetime.now()
+        if mode == CFG.SW_TC_INPROC:
+            test_ctrl.bindInstance(args, log)
+        else:
+            test_ctrl.initTestCase(args, log)
         #add user arguments to framework arguments
         if config_args:
             user_args = config_args.split(',')
             args.append(user_args)
-        #calling test case
-        rc = self.test_case(args)
+
+        return None, attr
+
+    #==========================================================================
+
+    def __leave(self, args, test_ctrl, log, attr, start_time, rc):
+        """
+        Write test case footer and JSON execution info.
+
+        rtype: number
+        @return: test case return code
+        """
+
+        num_instance = args[3]
+        test_id = args[4]
+        config_test_name = attr['testname']
+        config_args = attr['user_args']
+
         #Get end time
         end_time = datetime.datetime.now()
 
         #Write to log at end of each test case
+        exec_log = LOG.Logging(log.getLogPath())
+        exec_log.setTestLog(test_id)
         exec_log.log(CTRL_EXIT_TEST % config_test_name, LOG.INFO)
         exec_log.log(CTRL_TESTCASE % self.test_case.__name__ , LOG.INFO)
         exec_log.log(CTRL_TESTCASE_ARGS % config_args, LOG.INFO)
@@ -178,42 +398,56 @@ class TestCase(object):
         log.logshow(CTRL_RC % rc, LOG.INFO)
         log.logshow(CFG.SW_SEP_STR, LOG.INFO)
 
+        #Instance interrupted by signal has its JSON execution info already
+        if attr['mode'] == CFG.SW_TC_INPROC:
+            if not test_ctrl.releaseInstance(args):
+                return rc
+
         #Write JSON execution info
-        log.writeJSON(LOG.JSON_TESTC, [config_test_name ,self.test_case.__name__ ,str(start_time), str(end_time), config_mode,num_instance,rc,SYS.getExitMsg(rc), config_args, config_order])
+        log.writeJSON(LOG.JSON_TESTC, [config_test_name ,self.test_case.__name__ ,str(start_time), str(end_time), attr['mode'], num_instance, rc, SYS.getExitMsg(rc), config_args, attr['order'], SYS.getQueueWait()])
 
         #In case that sys signal was emitted, all processes (test cases) running with protected Mode
         # need to finish to write JSON footer info
-        flag_write_footer_json = False
-        #Check if signal set protected flag inside test case
-        if test_ctrl.getProtSignalEmit():
-            #End Json in case of protected test by kill signal
-            if SYS.isParallelMode(test_id): #Process in Parallel mode
-                #Per exited test case substract 1
-                SYS.writeValueExit(test_id, True)
-                exit_conc = SYS.readValueExit(test_id)
-                #check if list was processed or there are 1(-1 = 0) instances of test
-                log.show(CTRL_EXIT_PROC % (int(exit_conc), PROCLIB.getInstances(config_test_name) - 1), LOG.DEBUG)
-                if int(exit_conc) <= 0 or (PROCLIB.getInstances(config_test_name) - 1) <= 0:
-                    SYS.removeExit(test_id)
-                    SYS.removeParallelMode(test_id)
-                    flag_write_footer_json = True
-            else: #Process in Sequential mode
-                #Per exited test case add 1
-                SYS.writeValueExit(test_id)
-                exit_conc = SYS.readValueExit(test_id)
-                log.show(CTRL_EXIT_PROC % (int(exit_conc), PROCLIB.getInstances(config_test_name) - 1), LOG.DEBUG)
-                if int(exit_conc) >= int(config_cinst) or (PROCLIB.getInstances(config_test_name) - 1) <= 0:
-                    SYS.removeExit(test_id)
-                    flag_write_footer_json = True
-            #Ready to write JSON footer
-            if flag_write_footer_json:
-                log.writeJSON(LOG.JSON_END_DATE, [str(datetime.datetime.now())])
-                log.writeJSON(LOG.JSON_EXIT_ST, [SYS.EXIT_BY_SIGNAL])
-                log.writeJSON(LOG.JSON_EXIT_MSG, [SYS.getExitMsg(SYS.EXIT_BY_SIGNAL)])
-                log.writeJSON(LOG.JSON_CHKSUM, [log.getTestIDSHA256(test_id)])
+        if test_ctrl.getProtSignalEmit() and attr['mode'] != CFG.SW_TC_INPROC:
+            self.__writeSignalFooter(test_id, config_test_name, attr['cinst'], log)
 
-        #Exit with function Return code : RC Output
-        SYS.exitTC(rc)
+        return rc
+
+    #==========================================================================
+
+    def __writeSignalFooter(self, test_id, config_test_name, config_cinst, log):
+        """
+        Write JSON footer when last protected test case process finishes
+        after a sys signal.
+        """
+
+        flag_write_footer_json = False
+        if SYS.isParallelMode(test_id): #Process in Parallel mode
+            #Per exited test case substract 1
+            SYS.writeValueExit(test_id, True)
+            exit_conc = SYS.readValueExit(test_id)
+            #check if list was processed or there are 1(-1 = 0) instances of test
+            log.show(CTRL_EXIT_PROC % (int(exit_conc), PROCLIB.getInstances(config_test_name) - 1), LOG.DEBUG)
+            if int(exit_conc) <= 0 or (PROCLIB.getInstances(config_test_name) - 1) <= 0:
+                SYS.removeExit(test_id)
+                SYS.removeParallelMode(test_id)
+                flag_write_footer_json = True
+        else: #Process in Sequential mode
+            #Per exited test case add 1
+            SYS.writeValueExit(test_id)
+            exit_conc = SYS.readValueExit(test_id)
+            log.show(CTRL_EXIT_PROC % (int(exit_conc), PROCLIB.getInstances(config_test_name) - 1), LOG.DEBUG)
+            if int(exit_conc) >= int(config_cinst) or (PROCLIB.getInstances(config_test_name) - 1) <= 0:
+                SYS.removeExit(test_id)
+                flag_write_footer_json = True
+        #Ready to write JSON footer
+        if flag_write_footer_json:
+            log.writeJSON(LOG.JSON_END_DATE, [str(datetime.datetime.now())])
+            log.writeJSON(LOG.JSON_EXIT_ST, [SYS.EXIT_BY_SIGNAL])
+            log.writeJSON(LOG.JSON_EXIT_MSG, [SYS.getExitMsg(SYS.EXIT_BY_SIGNAL)])
+            log.writeJSON(LOG.JSON_CHKSUM, [log.getTestIDSHA256(test_id)])
+
+        return SYS.RC_NO_ERROR
 
 
 #==============================================================================
@@ -235,6 +469,8 @@ class TestController(object):
         self.no_instance = None
         self.log = None
         self.prot_signal_emit = False
+        #Instances running in this process (inprocess mode)
+        self.hosted = {}
         signal.signal(signal.SIGINT, self.stopTestBySignal)
         signal.signal(signal.SIGTERM, self.stopTestBySignal)
 
@@ -254,7 +490,12 @@ class TestController(object):
 
         attr = LIB.getMethodAttr(args[1], args[6], self.test_def)
         #Set Logging
-        log.setTestLog(args[4], attr['testname'], args[1], args[3])
+        if args[2] == CFG.SW_TC_INPROC:
+            #Instances have own log files, test log goes to running instance log
+            log.setTestLog(args[4])
+            log = self.log = globals_def['log'] = LOG.InstanceLogging(log)
+        else:
+            log.setTestLog(args[4], attr['testname'], args[1], args[3])
         #Test Main function
         LIB.main(args, self.test_def, self, log, globals_def)
 
@@ -284,6 +525,41 @@ class TestController(object):
 
     #==========================================================================
 
+    def bindInstance(self, args, log):
+        """
+        Init Test Case instance running in this process with other
+        instances (inprocess mode).
+
+        type: list
+        @param: args - arguments that called test case instance
+
+        type: Logging object
+        @param: log - instance logging object
+        """
+
+        #Controller log goes to this instance log in its thread or task
+        if isinstance(self.log, LOG.InstanceLogging):
+            self.log.bind(log)
+        self.hosted[args[3]] = [args, log, datetime.datetime.now()]
+        log.logshow(CTRL_START_TC_STR, LOG.INFO)
+
+    #==========================================================================
+
+    def releaseInstance(self, args):
+        """
+        Test Case instance running in this process finished (inprocess mode).
+
+        type: list
+        @param: args - arguments that called test case instance
+
+        rtype: boolean
+        @return: False if instance was already finished by signal
+        """
+
+        return self.hosted.pop(args[3], None) is not None
+
+    #==========================================================================
+
     def stopTestBySignal(self, signum, frame):
         """
         Stop execution in test case by signal trap
@@ -295,6 +571,10 @@ class TestController(object):
         @param: frame - stack traceback
         """
 
+        #Test case instances running in this process
+        if self.hosted:
+            return self.__stopInstances(signum)
+
         #If test case initialized
         if self.testrunning:
             tdef = LIB.getMethodAttr(self.testrunning, self.order, self.test_def)
@@ -310,7 +590,39 @@ class TestController(object):
         end_time = datetime.datetime.now()
         if self.log:
             self.log.logshow(CTRL_INT_TEST_STR, LOG.WARNING)
-            self.log.writeJSON(LOG.JSON_TESTC, [ tdef['testname'], self.testrunning, str(self.start_time), str(end_time), tdef['mode'], str(self.no_inst), str(SYS.EXIT_BY_SIGNAL), SYS.getExitMsg(SYS.EXIT_BY_SIGNAL), self.args,  self.order ] )
+            self.log.writeJSON(LOG.JSON_TESTC, [ tdef['testname'], self.testrunning, str(self.start_time), str(end_time), tdef['mode'], str(self.no_inst), str(SYS.EXIT_BY_SIGNAL), SYS.getExitMsg(SYS.EXIT_BY_SIGNAL), self.args,  self.order, SYS.getQueueWait() ] )
+
+        SYS.exitTC(SYS.EXIT_BY_SIGNAL)
+
+    #==========================================================================
+
+    def __stopInstances(self, signum):
+        """
+        Stop test case instances running in this process (inprocess mode).
+        Protected instances are waited to finish, others get their exit by
+        signal and process exits.
+
+        type: signal
+        @param: signum - sys signal
+        """
+
+        hosted = list(self.hosted.values())
+        tdef = LIB.getMethodAttr(hosted[0][0][1], hosted[0][0][6], self.test_def)
+        for args, log, start_time in hosted:
+            log.logshow(CTRL_SIGNAL_RCV_STR % (signum, tdef['testname'], args[1], args[3]), LOG.WARNING)
+        if tdef['protected'] == 1:
+            for args, log, start_time in hosted:
+                log.logshow(CTRL_TC_PROT_STR, LOG.WARNING)
+            #Signal emit flag for protected test case
+            self.prot_signal_emit = True
+            #Return to wait to finish
+            return
+
+        self.hosted = {}
+        end_time = datetime.datetime.now()
+        for args, log, start_time in hosted:
+            log.logshow(CTRL_INT_TEST_STR, LOG.WARNING)
+            log.writeJSON(LOG.JSON_TESTC, [ tdef['testname'], args[1], str(start_time), str(end_time), tdef['mode'], str(args[3]), str(SYS.EXIT_BY_SIGNAL), SYS.getExitMsg(SYS.EXIT_BY_SIGNAL), args[7] if len(args) > 7 else '', args[6], SYS.getQueueWait() ] )
 
         SYS.exitTC(SYS.EXIT_BY_SIGNAL)
 
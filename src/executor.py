@@ -22,6 +22,13 @@ from config import config as CFG
 from lib import sys_lib as SYS
 from lib import proc_lib as PROCLIB
 from lib import log_lib as LOG
+from lib import pool_lib as POOL
+from lib import forksrv_lib as FSRV
+from lib import logsrv_lib as LOGSRV
+from lib import cache_lib as CACHE
+from lib import history_lib as HIST
+from lib import resindex_lib as RIDX
+from lib import plan_lib as PLAN
 from src.usermodes import usermode as uMode
 
 #==============================================================================
@@ -33,6 +40,12 @@ import os
 import signal
 import time
 import datetime
+import select
+import selectors
+import heapq
+import sqlite3
+import atexit
+from collections import deque
 
 #==============================================================================
 #=================================== VARS =====================================
@@ -44,6 +57,7 @@ EXC_NO_UM_TEST = 'Test [%s] is not configured to run in current usermode [%s]'
 EXC_RUN_PROC = '[ %d ] -> { %d } - To run process for: %s'
 EXC_PROC_WAIT = '[ %d ] - Process List to wait: %s'
 EXC_PROC_EXIT = '[ %d ] - Process(es) Exit Code(s): %s'
+EXC_PROC_DONE = '[ %d ] - Process finished: %s'
 EXC_SIG_RCV = 'SIGNAL Received: %d'
 EXC_PROC_INT = 'Interrupting processes running...'
 EXC_PID_PROT = '! Protected PID %d - waiting to finish...'
@@ -51,6 +65,44 @@ EXC_PID_KILL = '* Killing PID: %s'
 EXC_TEST_ERROR = 'Execution finished!: TEST ID [ %s ] ends with error(s)'
 EXC_TEST_SUCESS = 'Execution finished!: TEST ID [ %s ] ends without error(s)'
 EXC_TEST_ID_ERROR = 'Custom ID Test folder exist [ %s ] try another.'
+EXC_LAUNCH_ERROR = 'Launch mode [ %s ] - Not supported'
+EXC_POOL_START = '[ %d ] - Pool started for [ %s ] with (%d) workers'
+EXC_FSRV_START = '[ %d ] - Fork server [ %d ] started for [ %s ]'
+EXC_LOGSRV_START = '[ %d ] - Log collector started [ %s ]'
+EXC_LOGSRV_STOP = '[ %d ] - Log collector wrote (%d) records from (%d) processes, (%d) lost'
+EXC_RIDX_ERROR = 'Results not added to results index [ %s ]: %s'
+EXC_NOT_READY = '[ %d ] - Process [ %s ] not ready after (%d) secs'
+EXC_DEP_UNKNOWN = 'Test case [ %s ] depends on unknown test case [ %s ]'
+EXC_DEP_CYCLE = 'Test cases dependencies have a cycle: %s'
+EXC_DEP_SKIP = 'Test case [ %s ] skipped, dependency [ %s ] not passed'
+EXC_GRAPH_START = '[ %d ] - Dependency scheduler started with jobs limit (%s)'
+EXC_JOB_TOKEN = b'.'
+EXC_TEST_FORK = '[ %d ] -> { %d } - Test [ %s ] running as independent test'
+EXC_TEST_EXIT = '[ %d ] - Independent test [ %s ] finished with code [ %d ]'
+EXC_ADMIT_WAIT = '[ %d ] - Instance queued, host busy: running (%d) load (%.2f) memory available (%s kB)'
+EXC_ADMIT_DONE = '[ %d ] - Instance admitted after (%.3f) secs'
+EXC_FAIL_LIMIT = 'Failures limit reached (%d): no more test cases will run'
+EXC_TC_SKIPPED = 'Test case [ %s ] instance [ %s ] skipped: %s'
+EXC_TC_TIMEOUT = 'Test case [ %s ] instance [ %s ] timeout (%s secs), killing process group %d'
+EXC_TC_TIMEOUT_PROT = 'Test case [ %s ] instance [ %s ] timeout (%s secs), protected: (%d) secs to finish'
+EXC_TC_CACHED = 'Test case [ %s ] not run: passed with same inputs in TEST ID [ %s ]'
+EXC_DRY_TEST = 'Test [ %s ] - predicted duration (%.1f) secs [ %s ]'
+EXC_DRY_TC = '    [ %3s ] %-24s instances (%s) duration (%s) secs start (%.1f) end (%.1f)'
+EXC_DRY_PROFILE = 'Profile [ %s ] - concurrent tests (%d)'
+EXC_DRY_MAKESPAN = 'Predicted makespan [ %s ]: (%.1f) secs [ %s ] - test cases without history (%d)'
+EXC_DRY_NOHIST = '?'
+
+#Skip reasons (JSON report)
+EXC_SKIP_DEP = 'dependency not passed'
+EXC_SKIP_FAILFAST = 'failures limit reached'
+EXC_SKIP_TEARDOWN = 'torn down, failures limit reached'
+
+#Test case states (dependency scheduler)
+EXC_TC_WAIT = 'waiting'
+EXC_TC_RUN = 'running'
+EXC_TC_PASS = 'passed'
+EXC_TC_FAIL = 'failed'
+EXC_TC_SKIP = 'skipped'
 
 
 #==============================================================================
@@ -62,20 +114,54 @@ class Executor(object):
     Class to manage execution of profile or test
     """
 
-    def __init__(self, usermode, log_path, log_custom_id=None):
+    def __init__(self, usermode, log_path, log_custom_id=None, options=None):
         """
         Constructor
         """
 
         self.usermode = usermode
         self.procs = []
+        self.rcs = []
         self.exit_codes = []
         self.test_id = None
+        self.launcher = None
+        self.collector = None
         if log_path:
             self.log_path = log_path
         else:
             self.log_path = CFG.SW_LOGS_PATH
         self.log_custom_id = log_custom_id
+        self.options = LIB.getExecOptions(options)
+        self.launch = self.options.get(CFG.SW_OPT_LAUNCH, CFG.SW_LAUNCH_POPEN)
+        self.pacing = float(self.options.get(CFG.SW_OPT_PACING, CFG.SW_LAUNCH_PACING))
+        self.ready_fd = None
+        self.ready_buf = b''
+        self.ready_pids = set()
+        self.exit_callbacks = []
+        self.jobs = int(self.options.get(CFG.SW_OPT_JOBS, 0)) or None
+        self.job_r = None
+        self.job_w = None
+        self.jobs_held = 0
+        self.graph = False
+        self.launch_times = {}
+        self.test_pids = {}
+        self.admit = int(self.options.get(CFG.SW_OPT_ADMIT, CFG.SW_ADMIT))
+        self.inflight = []
+        self.max_failures = 0
+        self.failures = 0
+        self.aborted = False
+        self.inst_info = {}
+        self.torn_down = set()
+        self.deadlines = {}
+        self.timed_out = set()
+        self.incremental = int(self.options.get(CFG.SW_OPT_INCREMENTAL, CFG.SW_INCREMENTAL))
+        self.device = self.options.get(CFG.SW_OPT_DEVICE, CFG.SW_DEVICE_ID)
+        self.cache = None
+        self.fingerprints = {}
+        self.tc_ran = set()
+        self.tc_failed = set()
+        self.longest = int(self.options.get(CFG.SW_OPT_LONGEST, CFG.SW_LONGEST_FIRST))
+        self.history = None
 
     #==========================================================================
 
@@ -107,10 +193,23 @@ class Executor(object):
 
         #Setting up Test ID
         self.__setupTest()
+        #Readiness handshake with test case instances
+        self.__setupReady()
+        #Log lines of all processes written by this one
+        self.__setupCollector()
+        #Failures to stop execution (fail-fast)
+        self.max_failures = self.__getMaxFailures()
 
         self.log.logshow(EXC_PID_HEAD % os.getpid(), LOG.DEBUG)
         self.log.writeJSON(LOG.JSON_START_DATE, [str(datetime.datetime.now())])
         self.log.writeJSON(LOG.JSON_MODE, [self.usermode])
+        #Rerun of failed test cases links to its Test ID
+        rerun_of = self.dft.get(LOG.JSON_RERUN)
+        if rerun_of:
+            self.log.writeJSON(LOG.JSON_RERUN, [rerun_of])
+        #Execution plan content hash
+        if self.dft.get(LOG.JSON_PLAN):
+            self.log.writeJSON(LOG.JSON_PLAN, [self.dft[LOG.JSON_PLAN]])
 
         if self.dft['type'] == CFG.SW_TD_PROFILE:
             self.startProfile()
@@ -119,6 +218,9 @@ class Executor(object):
             self.startTest()
 
         self.log.writeJSON(LOG.JSON_TEST_END)
+        self.log.writeJSON(LOG.JSON_RUSAGE)
+        if rerun_of:
+            self.log.writeJSON(LOG.JSON_MERGED, [LIB.getTestReport(self.log_path, rerun_of), rerun_of])
 
         self.log.writeJSON(LOG.JSON_END_DATE, [str(datetime.datetime.now())])
 
@@ -133,8 +235,20 @@ class Executor(object):
             self.log.writeJSON(LOG.JSON_EXIT_ST, [SYS.EXIT_NO_ERROR])
             self.log.writeJSON(LOG.JSON_EXIT_MSG, [SYS.EXIT_NO_ERROR_MSG])
         self.log.logshow(CFG.SW_SEP_STR, LOG.INFO)
+        self.__stopCollector()
         self.log.writeJSON(LOG.JSON_CHKSUM, [self.log.getTestIDSHA256(self.test_id)])
 
+        #Durations of this run for next ones (history not built yet takes
+        #them from logs path once it is built)
+        report = LIB.getTestReport(self.log_path, self.test_id) or {}
+        if self.history is None and os.path.exists(HIST.getHistoryFile()):
+            self.history = HIST.DurationHistory(self.log_path)
+        if self.history:
+            self.history.addReport(report, self.test_id)
+            self.history.save()
+        #Results of this run for queries across Test IDs
+        self.__indexResults(report)
+
         if rc:
             return SYS.RC_ERROR
 
@@ -154,7 +268,6 @@ class Executor(object):
 
         self.rcs = []
         signal_prots = []
-        proc_obj = None
 
         #Check if test can run in usermode
         if not LIB.isTestAbleToRun(self.dft, self.usermode) :
@@ -163,35 +276,54 @@ class Executor(object):
 
         self.log.writeJSON(LOG.JSON_TEST_NAME, [self.dft['name']] )
 
-        #Run test cases sorted by order
-        for k, v in sorted(self.dft['test_cases'].items()):
-
-            cinst = int(v['concurrency_inst'])
+        #Incremental run: test cases passed with same inputs don't run
+        if self.incremental:
+            self.__setupCache()
 
-            script = '%s/%s/%s.py' %(CFG.SW_TEST_PATH, self.dft['name'], self.dft['name'])
-            argmt1 = v['name']
-            argmt2 = v['mode']
-            argmt4 = self.test_id
-            argmt5 = self.log_path
-            argmt6 = '%d' % k
-
-            for conc_inst in range(cinst):
-                argmt3 = '%s' % (conc_inst+1)
-                cmd = [ script, argmt1, argmt2, argmt3, argmt4, argmt5, argmt6]
-                proc_obj = PROCLIB.execProcDetch(cmd, False)
-                self.log.logshow(EXC_RUN_PROC % (os.getpid(), proc_obj.pid, cmd), LOG.DEBUG)
-                self.procs.append(proc_obj)
-                signal_prots.append(v['protected'])
-                time.sleep(1)
+        #Launcher with test module pre-imported (pool or fork server)
+        self.__startLauncher()
 
-            #Wait for Sequential Mode
-            if not self.procmode and self.procs:
+        #Dependency graph: test cases run as soon as prerequisites passed
+        self.launch_times = {}
+        self.graph = self.__isGraph()
+        if self.graph:
+            self.__startGraph()
+        else:
+            #Run test cases sorted by order (parallel mode: longest first)
+            orders = sorted(self.dft['test_cases'])
+            if self.procmode and self.longest:
+                priority = self.__getPriorities(self.dft['test_cases'], dict((k, []) for k in orders))
+                orders.sort(key=lambda k: -priority[k])
+            for k in orders:
+                v = self.dft['test_cases'][k]
+
+                if self.__runCached(k, v):
+                    continue
+
+                for conc_inst in range(self.__getLaunches(v)):
+                    #Failures limit reached, no more instances run
+                    if self.aborted:
+                        for inst in self.__getHosted(v, conc_inst):
+                            self.__skipInstance(k, v, inst, EXC_SKIP_FAILFAST)
+                        continue
+                    self.procs.append(self.__launchInstance(k, v, conc_inst))
+                    signal_prots.append(v['protected'])
+
+                #Wait for Sequential Mode
+                if not self.procmode and self.procs:
+                    self.__waitExec(signal_prots)
+                    signal_prots = []
+
+            #Wait for Parallel Mode
+            if self.procmode and self.procs:
                 self.__waitExec(signal_prots)
-                signal_prots = []
 
-        #Wait for Parallel Mode
-        if self.procmode and self.procs:
-            self.__waitExec(signal_prots)
+        if self.launcher:
+            self.launcher.close()
+            self.launcher = None
+
+        if self.cache:
+            self.__saveCache()
 
         return SYS.RC_NO_ERROR
 
@@ -212,11 +344,79 @@ class Executor(object):
         self.log.writeJSON(LOG.JSON_PROFILE, [profile_def['name']])
         self.log.writeJSON(LOG.JSON_TEST_EXEC)
 
+        #Independent tests can run at same time (concurrent tests budget)
+        ctests = int(self.options.get(CFG.SW_OPT_CTESTS, 0) or profile_def.get('concurrent_tests', 1))
+        #Jobs limit shared by independent tests running at same time
+        if ctests > 1:
+            self.__setupJobs()
+
         for k, v in sorted(profile_def['tests'].items()):
             self.testdft = profile_def['tests'][k]
+            #Failures limit reached, remaining tests are skipped
+            if self.aborted:
+                self.setDefinition(self.testdft, self.procmode)
+                self.__skipTest()
+                continue
+            if ctests > 1 and v.get('independent'):
+                #Keep budget of tests running, same test runs once at a time
+                #(its results are in one list of report)
+                while len(self.test_pids) >= ctests or v['name'] in self.test_pids.values():
+                    self.__waitProfileTest()
+                self.__forkProfileTest(k)
+                continue
+            #Not independent test runs alone
+            while self.test_pids:
+                self.__waitProfileTest()
             self.setDefinition(self.testdft, self.procmode)
             rc = self.startTest()
 
+        while self.test_pids:
+            self.__waitProfileTest()
+
+        if self.job_r is not None:
+            os.close(self.job_r)
+            os.close(self.job_w)
+            self.job_r = self.job_w = None
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def dryRun(self):
+        """
+        Print predicted durations of test cases (durations of past runs) and
+        makespan of test or profile definition, without run them
+        """
+
+        self.history = HIST.DurationHistory(self.log_path)
+
+        if self.dft['type'] == CFG.SW_TD_PROFILE:
+            profile_def = self.dft
+            ctests = int(self.options.get(CFG.SW_OPT_CTESTS, 0) or profile_def.get('concurrent_tests', 1))
+            print(EXC_DRY_PROFILE % (profile_def['name'], ctests))
+            #Same policy than startProfile: independent tests share budget
+            now = 0.0
+            running = []
+            unknown = 0
+            for k, v in sorted(profile_def['tests'].items()):
+                self.setDefinition(v, self.procmode)
+                makespan, test_unknown = self.__dryRunTest()
+                unknown += test_unknown
+                if ctests > 1 and v.get('independent'):
+                    while len(running) >= ctests or v['name'] in [test for end, test in running]:
+                        now = heapq.heappop(running)[0]
+                    heapq.heappush(running, (now + makespan, v['name']))
+                    continue
+                now = max([now] + [end for end, test in running]) + makespan
+                running = []
+            makespan = max([now] + [end for end, test in running])
+            name = profile_def['name']
+        else:
+            makespan, unknown = self.__dryRunTest()
+            name = self.dft['name']
+
+        print(EXC_DRY_MAKESPAN % (name, makespan, datetime.timedelta(seconds=round(makespan)), unknown))
+
         return SYS.RC_NO_ERROR
 
     #==========================================================================
@@ -234,6 +434,10 @@ class Executor(object):
 
         flag_protected = 0
 
+        #Independent tests of profile stop their own test cases
+        for pid in self.test_pids:
+            PROCLIB.sendSignalPID(pid, signum)
+
         self.log.logshow(EXC_SIG_RCV % signum, LOG.WARNING)
         self.log.logshow(EXC_PROC_INT, LOG.WARNING)
         self.log.logshow('%s' % self.rcs, LOG.WARNING)
@@ -242,30 +446,47 @@ class Executor(object):
         SYS.createExit(self.test_id)
 
         #In case of parallel mode write a lock file as flag
-        if self.procmode:
+        if self.procmode or self.graph:
             SYS.writeParallelMode(self.test_id)
 
         #Starting to check process properties list
         for proc in self.rcs:
+            if not proc[0]:#Pool job not dispatched yet
+                continue
+            if proc[2] == PROCLIB.PROC_NOT_RUN:#Already finished
+                continue
             if proc[4]:#If test case protected flag is active
                 self.log.logshow(EXC_PID_PROT % proc[0], LOG.WARNING)
                 #Send SIGINT signal to process to exit in safety mode
                 PROCLIB.sendSignalPID(proc[0], signal.SIGINT)
                 #Parallel Mode
-                if self.procmode: #Increment exit counter
+                if self.procmode or self.graph: #Increment exit counter
                     SYS.writeValueExit(self.test_id)
                 flag_protected |= 2
             else: #If test case is not protected kill it
                 self.log.logshow(EXC_PID_KILL % proc[0], LOG.WARNING)
-                PROCLIB.sendSignalPID(proc[0], signal.SIGKILL)
+                #Instance has own process group: signal as from terminal
+                #and then kill the group
+                PROCLIB.sendSignalPID(proc[0], signum)
                 time.sleep(1)
+                PROCLIB.sendSignalGroup(proc[0], signal.SIGKILL)
                 flag_protected |= 1
 
+        #Wait independent tests exit by signal
+        for pid in list(self.test_pids):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+        #Log lines of test cases are written, protected ones write theirs
+        self.__stopCollector()
+
         #If stop action performed in not protected only or no processes to exit
         if flag_protected == 1 or not self.rcs:
             #Remove exit counter
             SYS.removeExit(self.test_id)
-            if self.procmode:#Remove parallel lock
+            if self.procmode or self.graph:#Remove parallel lock
                 SYS.removeParallelMode(self.test_id)
             #Write Json report file footer
             try:
@@ -273,6 +494,7 @@ class Executor(object):
                 self.log.writeJSON(LOG.JSON_EXIT_ST, [SYS.EXIT_BY_SIGNAL])
                 self.log.writeJSON(LOG.JSON_EXIT_MSG, [SYS.getExitMsg(SYS.EXIT_BY_SIGNAL)])
                 self.log.writeJSON(LOG.JSON_CHKSUM, [self.log.getTestIDSHA256(self.test_id)])
+                self.__indexResults(LIB.getTestReport(self.log_path, self.test_id) or {})
             except:
                 pass
 
@@ -280,6 +502,248 @@ class Executor(object):
 
     #==========================================================================
 
+    def addExitCallback(self, callback):
+        """
+        Add a function to call when a test case instance finishes
+
+        type: function
+        @param: callback - function receiving process properties
+                           [pid, no. instance, 'Status', Exit code, protected, rusage]
+        """
+
+        self.exit_callbacks.append(callback)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def abort(self, signum = None, frame = None):
+        """
+        Stop scheduling test cases (failures limit reached). Not protected
+        instances running are killed, protected ones are waited to finish.
+        It is also signal trap for independent tests of a profile.
+
+        type: signal
+        @param: signum - sys signal (optional)
+
+        type: stack
+        @param: frame - stack traceback (optional)
+        """
+
+        if self.aborted:
+            return SYS.RC_NO_ERROR
+        self.aborted = True
+        self.log.logshow(EXC_FAIL_LIMIT % self.failures, LOG.WARNING, LOG.WRN)
+
+        #Independent tests of profile stop too
+        for pid in self.test_pids:
+            PROCLIB.sendSignalPID(pid, signal.SIGUSR1)
+
+        #Instances queued in pool don't run
+        for proc_obj in self.procs:
+            if hasattr(proc_obj, 'cancel'):
+                proc_obj.cancel()
+
+        for proc in self.rcs:
+            if not proc[0] or proc[2] == PROCLIB.PROC_NOT_RUN:
+                continue
+            if proc[4]:#Protected test case finishes
+                self.log.logshow(EXC_PID_PROT % proc[0], LOG.WARNING)
+                continue
+            self.log.logshow(EXC_PID_KILL % proc[0], LOG.WARNING)
+            self.torn_down.add(id(proc))
+            PROCLIB.sendSignalGroup(proc[0], signal.SIGKILL)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __getMaxFailures(self):
+        """
+        Get failed instances to stop execution: options override definition
+        (max_failures or fail_fast)
+
+        rtype: number
+        @return: failures limit, 0 for no limit
+        """
+
+        if CFG.SW_OPT_MAXFAIL in self.options:
+            return int(self.options[CFG.SW_OPT_MAXFAIL])
+        if CFG.SW_OPT_FAILFAST in self.options:
+            return 1 if int(self.options[CFG.SW_OPT_FAILFAST]) else 0
+        if self.dft.get('max_failures'):
+            return int(self.dft['max_failures'])
+        if self.dft.get('fail_fast'):
+            return 1
+
+        return 0
+
+    #==========================================================================
+
+    def __countFailures(self, failures):
+        """
+        Count failed instances and abort execution if limit is reached
+
+        type: number
+        @param: failures - failed instances to add
+        """
+
+        self.failures += failures
+        if self.max_failures and self.failures >= self.max_failures:
+            self.abort()
+
+    #==========================================================================
+
+    def __skipInstance(self, order, tcase, conc_inst, reason, exit_code = SYS.EXIT_SKIPPED):
+        """
+        Record a test case instance not run (or torn down) in JSON report
+
+        type: number
+        @param: order - test case order
+
+        type: dictionary
+        @param: tcase - test case definition
+
+        type: number
+        @param: conc_inst - instance index (from 0)
+
+        type: str
+        @param: reason - skip reason
+
+        type: number
+        @param: exit_code - exit code to record (optional)
+        """
+
+        self.tc_failed.add(order)
+        self.log.logshow(EXC_TC_SKIPPED % (tcase['name'], LIB.getInstanceNumber(tcase, conc_inst), reason), LOG.WARNING, LOG.WRN)
+        self.log.writeJSON(LOG.JSON_TESTC_SKIP, [self.dft['name'], tcase['name'], tcase['mode'], '%d' % LIB.getInstanceNumber(tcase, conc_inst), exit_code, SYS.getExitMsg(exit_code), LIB.getInstanceArgs(tcase, conc_inst), order, reason])
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __setupCache(self):
+        """
+        Load result cache and get fingerprint of test cases inputs
+        (recorded in JSON report to rebuild cache)
+        """
+
+        self.cache = CACHE.ResultCache()
+        self.fingerprints = {}
+        self.tc_ran = set()
+        self.tc_failed = set()
+        for k, v in sorted(self.dft['test_cases'].items()):
+            self.fingerprints[k] = CACHE.getFingerprint(self.dft['name'], v, self.device)
+            self.log.writeJSON(LOG.JSON_FINGERPRINT, [self.dft['name'], k, self.fingerprints[k]])
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __runCached(self, order, tcase):
+        """
+        Record as passed a test case cached with same inputs
+
+        type: number
+        @param: order - test case order
+
+        type: dictionary
+        @param: tcase - test case definition
+
+        rtype: boolean
+        @return: True if test case was cached (it must not run)
+        """
+
+        if not self.cache or self.aborted:
+            return False
+
+        entry = self.cache.get(self.fingerprints[order])
+        if not entry:
+            return False
+
+        self.log.logshow(EXC_TC_CACHED % (tcase['name'], entry['test_id']), LOG.INFO, LOG.OK)
+        for conc_inst in range(int(tcase['concurrency_inst'])):
+            self.log.writeJSON(LOG.JSON_TESTC_CACHED, [self.dft['name'], tcase['name'], tcase['mode'], '%d' % LIB.getInstanceNumber(tcase, conc_inst), LIB.getInstanceArgs(tcase, conc_inst), order, entry['test_id']])
+        #Already in cache, nothing to add when test finishes
+        del self.fingerprints[order]
+
+        return True
+
+    #==========================================================================
+
+    def __saveCache(self):
+        """
+        Add test cases run and passed (all instances) to result cache
+        """
+
+        date = str(datetime.datetime.now())
+        for k, fingerprint in self.fingerprints.items():
+            if k in self.tc_ran and k not in self.tc_failed:
+                self.cache.add(fingerprint, self.test_id, self.dft['name'], self.dft['test_cases'][k]['name'], k, date)
+        self.cache.save()
+        self.cache = None
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __getLaunches(self, tcase):
+        """
+        Number of processes to launch for a test case
+
+        type: dictionary
+        @param: tcase - test case definition
+
+        rtype: number
+        @return: one for inprocess test cases, instances otherwise
+        """
+
+        if tcase['mode'] == CFG.SW_TC_INPROC:
+            return 1
+
+        return int(tcase['concurrency_inst'])
+
+    #==========================================================================
+
+    def __getHosted(self, tcase, conc_inst):
+        """
+        Instances run by a launched process
+
+        type: dictionary
+        @param: tcase - test case definition
+
+        type: number
+        @param: conc_inst - instance index of process (from 0)
+
+        rtype: list
+        @return: instance indexes (from 0)
+        """
+
+        if tcase['mode'] == CFG.SW_TC_INPROC:
+            return list(range(int(tcase['concurrency_inst'])))
+
+        return [conc_inst]
+
+    #==========================================================================
+
+    def __skipTest(self):
+        """
+        Record all test cases of test as skipped (failures limit reached)
+        """
+
+        if not LIB.isTestAbleToRun(self.dft, self.usermode):
+            return SYS.RC_NO_ERROR
+
+        self.log.writeJSON(LOG.JSON_TEST_NAME, [self.dft['name']])
+        for k, v in sorted(self.dft['test_cases'].items()):
+            for conc_inst in range(int(v['concurrency_inst'])):
+                self.__skipInstance(k, v, conc_inst, EXC_SKIP_FAILFAST)
+        self.exit_codes.append(SYS.RC_ERROR)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
     def __setupTest(self):
         """
         Set up Test with ID and output log path
@@ -288,9 +752,9 @@ class Executor(object):
         if not self.test_id:
             self.log = LOG.Logging(self.log_path)
             if self.log_custom_id and self.log_custom_id != '':
-                #check if custom name exist in path
-                custom_id_folder = '%s/%s' % (self.log_path, self.log_custom_id)
-                if os.path.exists(custom_id_folder):
+                #check if custom name exist in path (folder created if not)
+                custom_id_folder = SYS.getTestIDPath(self.log_path, self.log_custom_id)
+                if not self.log.reserveIDTest(self.log_custom_id):
                     print(EXC_TEST_ID_ERROR %  custom_id_folder)
                     SYS.exitTC(SYS.EXIT_ERROR)
                 self.test_id = self.log_custom_id
@@ -306,6 +770,719 @@ class Executor(object):
 
     #==========================================================================
 
+    def __setupReady(self):
+        """
+        Set up readiness pipe. Test case instances get write end by
+        environment (inherited by forked launchers and passed to Popen).
+        """
+
+        if self.ready_fd is None:
+            self.ready_fd, self.ready_w = os.pipe()
+            os.set_inheritable(self.ready_w, True)
+            os.environ[SYS.SYS_ENV_READY_FD] = '%d' % self.ready_w
+            self.ready_sel = selectors.DefaultSelector()
+            self.ready_sel.register(self.ready_fd, selectors.EVENT_READ)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __setupCollector(self):
+        """
+        Start log collector. Test case instances and launchers get its socket
+        by environment.
+        """
+
+        if not CFG.SW_LOG_BUFFER or not CFG.SW_LOG_COLLECTOR or self.collector:
+            return SYS.RC_NO_ERROR
+
+        self.collector = LOGSRV.LogCollector()
+        try:
+            self.collector.start()
+        except OSError:
+            self.collector = None
+            return SYS.RC_ERROR
+        #Socket removed even if executor ends by an error
+        atexit.register(self.collector.close)
+        os.environ[SYS.SYS_ENV_LOG_SOCK] = self.collector.sock_path
+        self.log.logshow(EXC_LOGSRV_START % (os.getpid(), self.collector.sock_path), LOG.DEBUG)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __stopCollector(self):
+        """
+        Stop log collector once lines sent to it were written. Next lines
+        are written by each process.
+        """
+
+        if not self.collector:
+            return SYS.RC_NO_ERROR
+
+        LOG.flushLogs()
+        os.environ.pop(SYS.SYS_ENV_LOG_SOCK, None)
+        records, senders, lost = self.collector.close()
+        self.collector = None
+        self.log.logshow(EXC_LOGSRV_STOP % (os.getpid(), records, senders, lost), LOG.DEBUG)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __indexResults(self, report):
+        """
+        Add results of this run to results index. Run result does not depend
+        on it: error is only shown (Test ID folder has its checksum already).
+
+        type: dictionary
+        @param: report - Test ID JSON report
+        """
+
+        if not CFG.SW_RESULTS_INDEX:
+            return SYS.RC_NO_ERROR
+
+        try:
+            index = RIDX.ResultsIndex()
+            index.addReport(self.log_path, self.test_id, report)
+            index.close()
+        except (OSError, sqlite3.Error) as e:
+            self.log.show(EXC_RIDX_ERROR % (CFG.SW_RESULTS_DB, e), LOG.WARNING)
+            return SYS.RC_ERROR
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __waitReady(self, proc_obj):
+        """
+        Wait test case instance notifies it started (or it exits/times out)
+
+        type: subprocess
+        @param: proc_obj - process object (or launcher handle)
+        """
+
+        #Pool job queued, worker not available yet
+        if not proc_obj.pid:
+            return SYS.RC_NO_ERROR
+
+        deadline = time.time() + CFG.SW_READY_TIMEOUT
+        while proc_obj.pid not in self.ready_pids:
+            if proc_obj.poll() is not None:
+                break
+            if time.time() > deadline:
+                self.log.logshow(EXC_NOT_READY % (os.getpid(), proc_obj.pid, CFG.SW_READY_TIMEOUT), LOG.WARNING, LOG.WRN)
+                break
+            if self.ready_sel.select(CFG.SW_READY_POLL_TIME):
+                self.__readReady()
+
+        self.ready_pids.discard(proc_obj.pid)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __readReady(self):
+        """
+        Read pids of instances started from readiness pipe (without block).
+        Pipe is drained while instances are waited too, so it never fills up.
+        """
+
+        while self.ready_fd is not None and self.ready_sel.select(0):
+            data = os.read(self.ready_fd, 4096)
+            if not data:
+                break
+            self.ready_buf += data
+            while b'\n' in self.ready_buf:
+                line, self.ready_buf = self.ready_buf.split(b'\n', 1)
+                self.ready_pids.add(int(line))
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __forkProfileTest(self, key):
+        """
+        Run a test of profile in a forked executor (same Test ID and JSON)
+
+        type: number
+        @param: key - test order in profile
+        """
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0: #Independent test process
+            rc = SYS.RC_ERROR
+            try:
+                self.test_pids = {}
+                #Log collector of parent writes log lines of this test
+                self.collector = None
+                #Failures left to limit, parent counts failures of this test
+                if self.max_failures:
+                    self.max_failures = max(self.max_failures - self.failures, 1)
+                self.failures = 0
+                self.exit_codes = []
+                signal.signal(signal.SIGUSR1, self.abort)
+                #Own readiness pipe, parent and other tests keep theirs
+                self.ready_sel.close()
+                os.close(self.ready_fd)
+                os.close(self.ready_w)
+                self.ready_fd = None
+                self.__setupReady()
+                self.setDefinition(self.testdft, self.procmode)
+                self.startTest()
+                #Exit code is number of failures (at least 1 for errors)
+                rc = min(self.failures, 255) or self.__checkExitCode()
+            except SystemExit as e:
+                rc = POOL.getExitCode(e.code)
+            finally:
+                #Jobs of instances killed with this test go back to budget
+                while self.jobs_held:
+                    self.__releaseJob()
+                LOG.flushLogs()
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(rc)
+
+        self.log.logshow(EXC_TEST_FORK % (os.getpid(), pid, self.testdft['name']), LOG.DEBUG)
+        self.test_pids[pid] = self.testdft['name']
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __waitProfileTest(self):
+        """
+        Wait an independent test of profile to finish and keep its exit code
+        """
+
+        #Only tests of profile are reaped (no other child of this process)
+        while True:
+            for pid in list(self.test_pids):
+                wpid, status = os.waitpid(pid, os.WNOHANG)
+                if not wpid:
+                    continue
+                rc = PROCLIB.getStatusCode(status)
+                self.log.logshow(EXC_TEST_EXIT % (os.getpid(), self.test_pids.pop(pid), rc), LOG.DEBUG)
+                self.exit_codes.append(SYS.RC_ERROR if rc else SYS.RC_NO_ERROR)
+                if rc > 0:
+                    self.__countFailures(rc)
+                elif rc < 0: #Killed
+                    self.__countFailures(1)
+                return SYS.RC_NO_ERROR
+            time.sleep(PROCLIB.PROC_POLL_TIME)
+
+    #==========================================================================
+
+    def __setupJobs(self):
+        """
+        Set up jobs budget shared by forked tests: a pipe with one byte per
+        job, an instance launches once it takes a byte and puts it back when
+        it finishes.
+        """
+
+        if not self.jobs or self.job_r is not None:
+            return SYS.RC_NO_ERROR
+
+        self.job_r, self.job_w = os.pipe()
+        #Read end never blocks (flag is shared by all forked tests)
+        os.set_blocking(self.job_r, False)
+        os.write(self.job_w, EXC_JOB_TOKEN * self.jobs)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __acquireJob(self, wait):
+        """
+        Take a job of shared budget to launch an instance
+
+        type: boolean
+        @param: wait - wait a job is released by other test (no instance of
+                       this test is running)
+
+        rtype: boolean
+        @return: True if instance can launch, False if budget is used by other
+                 instances (or failures limit was reached meanwhile)
+        """
+
+        if self.job_r is None:
+            return True
+
+        while True:
+            try:
+                if os.read(self.job_r, 1):
+                    self.jobs_held += 1
+                    return True
+            except BlockingIOError:
+                pass
+            if not wait or self.aborted:
+                return False
+            select.select([self.job_r], [], [], PROCLIB.PROC_POLL_TIME)
+
+    #==========================================================================
+
+    def __releaseJob(self):
+        """
+        Put back a job taken from shared budget
+        """
+
+        if self.job_r is None or not self.jobs_held:
+            return SYS.RC_NO_ERROR
+
+        self.jobs_held -= 1
+        os.write(self.job_w, EXC_JOB_TOKEN)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __launchInstance(self, order, tcase, conc_inst):
+        """
+        Launch a test case instance keeping test case ramp and pacing
+
+        type: number
+        @param: order - test case order
+
+        type: dictionary
+        @param: tcase - test case definition
+
+        type: number
+        @param: conc_inst - instance index (from 0)
+
+        rtype: subprocess
+        @return: process object (or launcher handle)
+        """
+
+        script = '%s/%s/%s.py' %(CFG.SW_TEST_PATH, self.dft['name'], self.dft['name'])
+        cmd = [ script, tcase['name'], tcase['mode'], '%s' % LIB.getInstanceNumber(tcase, conc_inst), self.test_id, self.log_path, '%d' % order]
+        #One process runs all instances, it gets number of instances
+        if tcase['mode'] == CFG.SW_TC_INPROC:
+            cmd[3] = '%s' % tcase['concurrency_inst']
+
+        #Wait host can absorb one more instance
+        queue_wait = self.__admitInstance()
+
+        #Keep ramp between launches (instances per second), no limit by default
+        if tcase.get('ramp'):
+            ramp_wait = self.launch_times.get(order, 0) + 1.0 / float(tcase['ramp']) - time.time()
+            if ramp_wait > 0:
+                time.sleep(ramp_wait)
+        self.launch_times[order] = time.time()
+
+        #Queue wait is recorded by test case apart from execution time
+        env = {SYS.SYS_ENV_QUEUE_WAIT : '%.6f' % queue_wait}
+        #Test case runs with arguments of this definition (e.g. rerun parameters)
+        if 'args' in tcase or 'inst_args' in tcase:
+            env[SYS.SYS_ENV_TC_ARGS] = '%s' % LIB.getInstanceArgs(tcase, conc_inst)
+        #Instance numbers of inprocess test case (e.g. rerun of failed instances)
+        if tcase['mode'] == CFG.SW_TC_INPROC and tcase.get('instances'):
+            env[SYS.SYS_ENV_TC_INSTANCES] = ','.join('%s' % inst for inst in tcase['instances'])
+        proc_obj = PROCLIB.execProcDetch(cmd, False, self.launcher, [self.ready_w], env, True)
+        self.tc_ran.add(order)
+        self.inflight.append(proc_obj)
+        self.inst_info[id(proc_obj)] = (order, tcase, conc_inst, datetime.datetime.now(), queue_wait)
+        self.log.logshow(EXC_RUN_PROC % (os.getpid(), proc_obj.pid or 0, cmd), LOG.DEBUG)
+        #Wait instance enters test case before launch next one
+        self.__waitReady(proc_obj)
+        #Fixed pacing (compatibility)
+        if self.pacing:
+            time.sleep(self.pacing)
+
+        return proc_obj
+
+    #==========================================================================
+
+    def __admitInstance(self):
+        """
+        Admission control: wait until running instances, load average and
+        memory available allow to launch one more instance
+
+        rtype: number
+        @return: seconds instance waited in queue
+        """
+
+        if not self.admit:
+            return 0
+
+        start_time = time.time()
+        queued = False
+        cpus = os.cpu_count() or 1
+        while True:
+            self.inflight = [proc_obj for proc_obj in self.inflight if proc_obj.poll() is None]
+            #First instance always runs to keep progress
+            if not self.inflight:
+                break
+            load = SYS.getLoadAvg()
+            mem = SYS.getMemAvailable()
+            #Load not caused by own instances
+            if (len(self.inflight) < cpus * CFG.SW_ADMIT_INST_PER_CPU and
+                load - len(self.inflight) < cpus * CFG.SW_ADMIT_LOAD_PER_CPU and
+                (mem is None or mem >= CFG.SW_ADMIT_MIN_MEM)):
+                break
+            if not queued:
+                self.log.logshow(EXC_ADMIT_WAIT % (os.getpid(), len(self.inflight), load, mem), LOG.DEBUG)
+                queued = True
+            time.sleep(CFG.SW_ADMIT_POLL_TIME)
+
+        queue_wait = time.time() - start_time
+        if queued:
+            self.log.logshow(EXC_ADMIT_DONE % (os.getpid(), queue_wait), LOG.DEBUG)
+
+        return queue_wait
+
+    #==========================================================================
+
+    def __getDurations(self, cases):
+        """
+        Predicted duration of test cases by durations of past runs. Test
+        cases without history take mean of the others in test.
+
+        type: dictionary
+        @param: cases - test cases by order
+
+        rtype: tuple
+        @return: seconds by order, orders without history
+        """
+
+        #Durations of past runs are read first time they are needed
+        if self.history is None:
+            self.history = HIST.DurationHistory(self.log_path)
+
+        durations = {}
+        unknown = []
+        for k, v in cases.items():
+            durations[k] = self.history.get(self.dft['name'], k, v['name'])
+            if durations[k] is None:
+                unknown.append(k)
+        known = [durations[k] for k in cases if k not in unknown]
+        for k in unknown:
+            durations[k] = sum(known) / len(known) if known else 0.0
+
+        return durations, unknown
+
+    #==========================================================================
+
+    def __getPriorities(self, cases, deps):
+        """
+        Priority of test cases to launch: predicted duration of longest
+        path from test case to end (its duration without dependencies).
+
+        type: dictionary
+        @param: cases - test cases by order
+
+        type: dictionary
+        @param: deps - test case order and list of its prerequisites
+
+        rtype: dictionary
+        @return: seconds by order
+        """
+
+        durations, unknown = self.__getDurations(cases)
+        dependents = dict((k, [dk for dk, prereqs in deps.items() if k in prereqs]) for k in cases)
+        priority = {}
+
+        def getPath(k):
+            if k not in priority:
+                priority[k] = durations[k] + max([getPath(dk) for dk in dependents[k]] or [0])
+            return priority[k]
+
+        for k in cases:
+            getPath(k)
+
+        return priority
+
+    #==========================================================================
+
+    def __simulate(self, cases, deps, jobs):
+        """
+        Simulate run of test cases with predicted durations, same launch
+        policy than executor: prerequisites, jobs limit, pacing and order.
+
+        type: dictionary
+        @param: cases - test cases by order
+
+        type: dictionary
+        @param: deps - test case order and list of its prerequisites
+
+        type: number
+        @param: jobs - max. instances running at same time (None no limit)
+
+        rtype: tuple
+        @return: makespan, start and end by order, predicted durations, orders without history
+        """
+
+        durations, unknown = self.__getDurations(cases)
+        priority = self.__getPriorities(cases, deps) if self.longest else dict.fromkeys(cases, 0)
+        pending = dict((k, set(deps[k])) for k in cases)
+        left = {}
+        times = {}
+        queue = []
+        running = []
+        started = set()
+        launched = 0
+        now = 0.0
+        launch_at = 0.0
+        while True:
+            #Test cases with prerequisites finished are ready
+            ready = [k for k in sorted(pending) if not pending[k]]
+            for k in ready:
+                del pending[k]
+                left[k] = self.__getLaunches(cases[k])
+                times[k] = [now, now]
+                queue.extend([k] * left[k])
+                if not left[k]:
+                    for prereqs in pending.values():
+                        prereqs.discard(k)
+            queue.sort(key=lambda k: -priority[k])
+            while queue and (not jobs or len(running) < jobs):
+                k = queue.pop(0)
+                start = max(now, launch_at)
+                launch_at = start + self.pacing
+                if k not in started:
+                    started.add(k)
+                    times[k][0] = start
+                heapq.heappush(running, (start + durations[k], launched, k))
+                launched += 1
+            if not running:
+                if ready:
+                    continue
+                break
+            now, _, k = heapq.heappop(running)
+            left[k] -= 1
+            if not left[k]:
+                times[k][1] = now
+                for prereqs in pending.values():
+                    prereqs.discard(k)
+
+        return now, times, durations, unknown
+
+    #==========================================================================
+
+    def __dryRunTest(self):
+        """
+        Print predicted schedule of test cases of test definition
+
+        rtype: tuple
+        @return: predicted makespan, number of test cases without history
+        """
+
+        if not LIB.isTestAbleToRun(self.dft, self.usermode):
+            print(EXC_NO_UM_TEST % (self.dft['name'], self.usermode))
+            return 0.0, 0
+
+        cases = dict((int(k), v) for k, v in self.dft['test_cases'].items())
+        if self.__isGraph():
+            deps = dict((k, [int(dep) for dep in v.get('depends_on', [])]) for k, v in cases.items())
+            jobs = self.jobs
+        elif self.procmode:
+            deps = dict((k, []) for k in cases)
+            jobs = None
+        else: #Sequential mode: test case waits previous one
+            orders = sorted(cases)
+            deps = dict((k, orders[:i][-1:]) for i, k in enumerate(orders))
+            jobs = None
+
+        makespan, times, durations, unknown = self.__simulate(cases, deps, jobs)
+        print(EXC_DRY_TEST % (self.dft['name'], makespan, datetime.timedelta(seconds=round(makespan))))
+        for k in sorted(times, key=lambda k: (times[k][0], k)):
+            duration = EXC_DRY_NOHIST if k in unknown else '%.1f' % durations[k]
+            print(EXC_DRY_TC % (k, cases[k]['name'], cases[k]['concurrency_inst'], duration, times[k][0], times[k][1]))
+
+        return makespan, len(unknown)
+
+    #==========================================================================
+
+    def __isGraph(self):
+        """
+        Test cases run by dependency scheduler: some test case has depends_on
+        or parallel mode is limited by jobs
+
+        rtype: boolean
+        @return: True if dependency scheduler is needed
+        """
+
+        for v in self.dft['test_cases'].values():
+            if v.get('depends_on'):
+                return True
+
+        return bool(self.procmode and self.jobs)
+
+    #==========================================================================
+
+    def __checkGraph(self, deps):
+        """
+        Check test cases dependencies exist and have no cycles
+
+        type: dictionary
+        @param: deps - test case order and list of its prerequisites
+
+        rtype: number
+        @return: 0 valid, 1 error
+        """
+
+        for k, prereqs in deps.items():
+            for dep in prereqs:
+                if dep not in deps:
+                    self.log.logshow(EXC_DEP_UNKNOWN % (k, dep), LOG.ERROR, LOG.WRONG)
+                    return SYS.RC_ERROR
+
+        #Remove test cases without pending prerequisites until no one left
+        pending = dict((k, set(prereqs)) for k, prereqs in deps.items())
+        while pending:
+            free = [k for k, prereqs in pending.items() if not prereqs]
+            if not free:
+                self.log.logshow(EXC_DEP_CYCLE % sorted(pending), LOG.ERROR, LOG.WRONG)
+                return SYS.RC_ERROR
+            for k in free:
+                del pending[k]
+            for prereqs in pending.values():
+                prereqs.difference_update(free)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __startGraph(self):
+        """
+        Run test cases as soon as their prerequisites (depends_on) passed,
+        with no more instances running at same time than jobs limit.
+        Test cases with a prerequisite not passed are skipped.
+        """
+
+        cases = dict((int(k), v) for k, v in self.dft['test_cases'].items())
+        deps = dict((k, [int(dep) for dep in v.get('depends_on', [])]) for k, v in cases.items())
+        if self.__checkGraph(deps):
+            self.exit_codes.append(SYS.RC_ERROR)
+            return SYS.RC_ERROR
+
+        self.log.logshow(EXC_GRAPH_START % (os.getpid(), self.jobs), LOG.DEBUG)
+
+        #Ready instances launch longest path first (durations of past runs)
+        priority = self.__getPriorities(cases, deps) if self.longest else dict.fromkeys(cases, 0)
+
+        state = dict.fromkeys(cases, EXC_TC_WAIT)
+        remain = {}
+        owner = {}
+        launches = deque()
+        running = 0
+        rc = SYS.RC_NO_ERROR
+        self.rcs = []
+        waiter = PROCLIB.ProcWaiter(self.__procExit)
+        if self.ready_fd is not None:
+            waiter.watch(self.ready_fd, self.__readReady)
+
+        while True:
+            #Set test cases ready to launch (or skipped) until no changes
+            changed = True
+            while changed:
+                changed = False
+                for k in sorted(cases):
+                    if state[k] != EXC_TC_WAIT:
+                        continue
+                    failed = [dep for dep in deps[k] if state[dep] in (EXC_TC_FAIL, EXC_TC_SKIP)]
+                    if failed or self.aborted:
+                        if failed:
+                            self.log.logshow(EXC_DEP_SKIP % (k, failed[0]), LOG.WARNING, LOG.WRN)
+                        for conc_inst in range(int(cases[k]['concurrency_inst'])):
+                            self.__skipInstance(k, cases[k], conc_inst, EXC_SKIP_DEP if failed else EXC_SKIP_FAILFAST)
+                        state[k] = EXC_TC_SKIP
+                        rc = SYS.RC_ERROR
+                        changed = True
+                    elif all(state[dep] == EXC_TC_PASS for dep in deps[k]) and self.__runCached(k, cases[k]):
+                        state[k] = EXC_TC_PASS
+                        changed = True
+                    elif all(state[dep] == EXC_TC_PASS for dep in deps[k]):
+                        remain[k] = self.__getLaunches(cases[k])
+                        state[k] = EXC_TC_RUN if remain[k] else EXC_TC_PASS
+                        launches.extend((k, conc_inst) for conc_inst in range(remain[k]))
+                        launches = deque(sorted(launches, key=lambda launch: -priority[launch[0]]))
+                        changed = True
+
+            #Failures limit reached, instances not launched are skipped
+            while launches and self.aborted:
+                k, conc_inst = launches.popleft()
+                for inst in self.__getHosted(cases[k], conc_inst):
+                    self.__skipInstance(k, cases[k], inst, EXC_SKIP_FAILFAST)
+                state[k] = EXC_TC_FAIL
+
+            #Launch instances up to jobs limit
+            while launches and (not self.jobs or running < self.jobs) and self.__acquireJob(not running):
+                k, conc_inst = launches.popleft()
+                proc_obj = self.__launchInstance(k, cases[k], conc_inst)
+                proc = [proc_obj.pid, LIB.getInstanceNumber(cases[k], conc_inst), PROCLIB.PROC_RUN, None, cases[k]['protected'], None]
+                self.__trackInstance(proc_obj, proc)
+                self.procs.append(proc_obj)
+                owner[id(proc)] = k
+                self.rcs.append(proc)
+                waiter.add(proc_obj, proc)
+                running += 1
+
+            if not running:
+                #Failures limit reached waiting a job, instances left are skipped
+                if launches:
+                    continue
+                break
+
+            #Update test case state as its instances finish
+            for proc in waiter.waitNext(self.__watchdog()):
+                running -= 1
+                self.__releaseJob()
+                k = owner[id(proc)]
+                remain[k] -= 1
+                if proc[3] != SYS.EXIT_NO_ERROR:
+                    state[k] = EXC_TC_FAIL
+                    rc = SYS.RC_ERROR
+                if not remain[k] and state[k] == EXC_TC_RUN:
+                    state[k] = EXC_TC_PASS
+
+        waiter.close()
+        self.procs = []
+        self.log.logshow(EXC_PROC_EXIT % (os.getpid(), self.rcs), LOG.DEBUG)
+        #keep test exit code for final status
+        self.exit_codes.append(rc)
+
+        return rc
+
+    #==========================================================================
+
+    def __startLauncher(self):
+        """
+        Start launcher for test cases according to launch mode: fork server or
+        pool of workers sized by instances able to run at same time
+        """
+
+        if self.launch == CFG.SW_LAUNCH_FORK:
+            self.launcher = FSRV.ForkServer(self.dft['name'])
+            if self.launcher.start():
+                self.launcher = None
+                return SYS.RC_ERROR
+            self.log.logshow(EXC_FSRV_START % (os.getpid(), self.launcher.pid, self.dft['name']), LOG.DEBUG)
+            return SYS.RC_NO_ERROR
+
+        if self.launch != CFG.SW_LAUNCH_POOL:
+            return SYS.RC_NO_ERROR
+
+        cinsts = [self.__getLaunches(v) for v in self.dft['test_cases'].values()]
+        if self.__isGraph():
+            needed = min(sum(cinsts), self.jobs or sum(cinsts))
+        elif self.procmode:
+            needed = sum(cinsts)
+        else:
+            needed = max(cinsts)
+        workers = int(self.options.get(CFG.SW_OPT_WORKERS, 0)) or CFG.SW_POOL_WORKERS or os.cpu_count() or 1
+
+        self.launcher = POOL.WorkerPool(self.dft['name'], min(workers, needed))
+        if self.launcher.start():
+            self.launcher = None
+            return SYS.RC_ERROR
+        self.log.logshow(EXC_POOL_START % (os.getpid(), self.dft['name'], self.launcher.num_workers), LOG.DEBUG)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
     def __checkExitCode(self, proc_list = None):
         """
         Check if there are exit code different from 0
@@ -341,13 +1518,154 @@ class Executor(object):
         #get process(es) init properties
         self.rcs = PROCLIB.listPids(self.procs, signal_prots)
         self.log.logshow(EXC_PROC_WAIT % (os.getpid(), self.rcs), LOG.DEBUG)
-        #put to wait processes list
-        self.rcs = PROCLIB.waitPids(self.procs, self.rcs)
+        #put to wait processes list, properties updated as each one exits
+        waiter = PROCLIB.ProcWaiter(self.__procExit)
+        if self.ready_fd is not None:
+            waiter.watch(self.ready_fd, self.__readReady)
+        for proc_obj, proc in zip(self.procs, self.rcs):
+            self.__trackInstance(proc_obj, proc)
+            waiter.add(proc_obj, proc)
+        #Watchdog kills instances with timeout reached
+        while waiter.pending():
+            waiter.waitNext(self.__watchdog())
+        waiter.close()
         self.log.logshow(EXC_PROC_EXIT % (os.getpid(), self.rcs), LOG.DEBUG)
         #keep process(es) exit code(s) for final status
         self.exit_codes.append(self.__checkExitCode(self.rcs))
         self.procs = []
 
+    #==========================================================================
+
+    def __trackInstance(self, proc_obj, proc):
+        """
+        Link process properties with its test case instance and set its
+        timeout (test case, test or framework default)
+
+        type: subprocess
+        @param: proc_obj - process object (or launcher handle)
+
+        type: list
+        @param: proc - process properties [pid, no. instance, 'Status',
+                       Exit code, protected, rusage]
+        """
+
+        info = self.inst_info.pop(id(proc_obj), None)
+        self.inst_info[id(proc)] = info
+        if not info:
+            return SYS.RC_NO_ERROR
+
+        timeout = info[1].get('timeout', self.dft.get('timeout', CFG.SW_TC_TIMEOUT))
+        if timeout:
+            #Timeout starts at launch, or when it runs if pool job is queued
+            limit = info[3].timestamp() + float(timeout) if proc[0] else None
+            #[process properties, timeout, deadline, protected grace started]
+            self.deadlines[id(proc)] = [proc, float(timeout), limit, False]
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __watchdog(self):
+        """
+        Kill process group of instances with timeout reached. Protected
+        instances get a grace time to finish before kill them.
+
+        rtype: number
+        @return: seconds to next deadline, None if no deadlines
+        """
+
+        now = time.time()
+        next_wait = None
+        for key, deadline in list(self.deadlines.items()):
+            proc, timeout, limit, grace = deadline
+            if not proc[0] or proc[2] == PROCLIB.PROC_NOT_RUN:
+                continue
+            #Queued pool job started to run
+            if limit is None:
+                limit = deadline[2] = now + timeout
+            if now >= limit:
+                info = self.inst_info.get(key)
+                name, inst = (info[1]['name'], LIB.getInstanceNumber(info[1], info[2])) if info else (proc[0], proc[1])
+                if proc[4] and not grace:
+                    self.log.logshow(EXC_TC_TIMEOUT_PROT % (name, inst, timeout, CFG.SW_TC_TIMEOUT_GRACE), LOG.WARNING, LOG.WRN)
+                    limit = deadline[2] = now + CFG.SW_TC_TIMEOUT_GRACE
+                    deadline[3] = True
+                else:
+                    self.log.logshow(EXC_TC_TIMEOUT % (name, inst, timeout, proc[0]), LOG.WARNING, LOG.WRN)
+                    self.timed_out.add(key)
+                    del self.deadlines[key]
+                    PROCLIB.sendSignalGroup(proc[0], signal.SIGKILL)
+                    continue
+            if next_wait is None or limit - now < next_wait:
+                next_wait = max(limit - now, 0)
+
+        return next_wait
+
+    #==========================================================================
+
+    def __recordTimeout(self, info):
+        """
+        Record in JSON report a test case instance killed by timeout
+
+        type: list
+        @param: info - instance info (order, test case, instance index,
+                       launch time, queue wait)
+        """
+
+        order, tcase, conc_inst, start_time, queue_wait = info
+        for inst in self.__getHosted(tcase, conc_inst):
+            self.log.writeJSON(LOG.JSON_TESTC, [self.dft['name'], tcase['name'], str(start_time), str(datetime.datetime.now()), tcase['mode'], '%d' % LIB.getInstanceNumber(tcase, inst), SYS.EXIT_TIMEOUT, SYS.getExitMsg(SYS.EXIT_TIMEOUT), LIB.getInstanceArgs(tcase, inst), order, queue_wait])
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __procExit(self, proc):
+        """
+        Test case instance finished
+
+        type: list
+        @param: proc - process properties [pid, no. instance, 'Status',
+                       Exit code, protected, rusage]
+        """
+
+        self.log.logshow(EXC_PROC_DONE % (os.getpid(), proc), LOG.DEBUG)
+
+        #Ready line of a finished process is stale (pool worker pids are reused)
+        self.__readReady()
+        self.ready_pids.discard(proc[0])
+
+        info = self.inst_info.pop(id(proc), None)
+        self.deadlines.pop(id(proc), None)
+        if info and proc[3] != SYS.EXIT_NO_ERROR:
+            self.tc_failed.add(info[0])
+        if id(proc) in self.timed_out:
+            self.timed_out.discard(id(proc))
+            proc[3] = SYS.EXIT_TIMEOUT
+            if info:
+                self.__recordTimeout(info)
+            self.__countFailures(1)
+        elif proc[0] is None and proc[3] == SYS.EXIT_SKIPPED and info: #Cancelled before it runs
+            for inst in self.__getHosted(info[1], info[2]):
+                self.__skipInstance(info[0], info[1], inst, EXC_SKIP_FAILFAST)
+        elif id(proc) in self.torn_down:
+            self.torn_down.discard(id(proc))
+            if info:
+                for inst in self.__getHosted(info[1], info[2]):
+                    self.__skipInstance(info[0], info[1], inst, EXC_SKIP_TEARDOWN, SYS.EXIT_BY_SIGNAL)
+        elif info and info[1]['mode'] == CFG.SW_TC_INPROC and proc[3] > 0:
+            #Exit code of inprocess test case is number of instances failed
+            self.__countFailures(proc[3])
+        elif proc[3] != SYS.EXIT_NO_ERROR:
+            self.__countFailures(1)
+
+        #Resource usage collected when instance was reaped
+        if info and proc[5]:
+            self.log.writeJSON(LOG.JSON_TESTC_RUSAGE, [self.dft['name'], info[1]['name'], '%d' % LIB.getInstanceNumber(info[1], info[2]), info[0], proc[5]])
+
+        for callback in self.exit_callbacks:
+            callback(proc)
+
 
 
 #==============================================================================
@@ -370,6 +1688,23 @@ def main(args):
             except:
                 log_path = None
                 log_custom_id = None
+            try:
+                options = args[6]
+            except:
+                options = None
+    elif args[1] == CFG.SW_PLAN_TD: #Execution plan (file, '-' stdin or hash)
+        try:
+            plan = args[2] if isinstance(args[2], dict) else PLAN.loadPlan(args[2])
+        except (ValueError, IndexError) as e:
+            print(e)
+            SYS.exitTC(SYS.EXIT_ERROR)
+        test_def = PLAN.getPlanDefinition(plan)
+        test_def[LOG.JSON_PLAN] = plan['hash']
+        user_mode = CFG.SW_UM_AUTOMATION
+        proc_mode = int(plan['run']['runmode'])
+        log_path = plan['run']['log_path'] or None
+        log_custom_id = plan['run']['test_id'] or None
+        options = plan['run']['options'] or None
     else: #If not, do normal execution of user modes
         if len(args) < 5 :
             CFG.SW_EXECUTOR_USAGE()
@@ -385,6 +1720,10 @@ def main(args):
         except:
             log_path = None
             log_custom_id = None
+        try:
+            options = args[7]
+        except:
+            options = None
 
         #TODO: User Modes (gui, interactive, web)
         #Get definiton from UserMode Class based in user mode selected
@@ -394,13 +1733,19 @@ def main(args):
     if not test_def:
         SYS.exitTC(SYS.EXIT_ERROR)
 
-    exect = Executor(user_mode, log_path, log_custom_id)
+    exect = Executor(user_mode, log_path, log_custom_id, options)
+    if exect.launch not in (CFG.SW_LAUNCH_POPEN, CFG.SW_LAUNCH_POOL, CFG.SW_LAUNCH_FORK):
+        print(EXC_LAUNCH_ERROR % exect.launch)
+        SYS.exitTC(SYS.EXIT_ERROR)
     # set signal traps
     signal.signal(signal.SIGINT, exect.stop)
     signal.signal(signal.SIGTERM, exect.stop)
     #Set definition
     rc = exect.setDefinition(test_def, proc_mode)
-    if not rc:
+    if not rc and exect.options.get(CFG.SW_OPT_DRYRUN):
+        #Predicted schedule only
+        rc = exect.dryRun()
+    elif not rc:
         # Exec test definition
         rc = exect.start()
 
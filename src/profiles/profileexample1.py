@@ -16,8 +16,9 @@ profile_def = {
     'type' : 'profile',
     'name' : 'profileexample1',
     'descp': 'Profile to test bla bla 1',
+    'concurrent_tests' : 1,
     'tests' : {
-        1 : { 'name' : 'testexample1', 'descp' : 'Test to cover bla bla 1'},
-        2 : { 'name' : 'testexample2', 'descp' : 'Test to cover bla bla 2'}
+        1 : { 'name' : 'testexample1', 'descp' : 'Test to cover bla bla 1', 'independent' : 1},
+        2 : { 'name' : 'testexample2', 'descp' : 'Test to cover bla bla 2', 'independent' : 1}
         }
     }
@@ -77,6 +77,9 @@ class GuiUserMode(object):
                 if test:
                     testdef['tests'][profile_key]['usermodes']=test['usermodes']
                     testdef['tests'][profile_key]['test_cases']=test['test_cases']
+                    for policy in CFG.SW_TD_TEST_POLICIES:
+                        if policy in test:
+                            testdef['tests'][profile_key].setdefault(policy, test[policy])
                 else:
                     print(GUI_PROF_INCOMPLETE)
                     SYS.exitTC(SYS.EXIT_ERROR)
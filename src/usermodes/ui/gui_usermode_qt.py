@@ -16,6 +16,7 @@ UI defition and template for GUI UserMode.
 #==============================================================================
 
 from lib import common_lib as LIB
+from lib import plan_lib as PLAN
 from config import config as CFG
 from tools.tcpcom import ethp2p_client
 
@@ -235,9 +236,10 @@ class TestDefinitionUI(QtWidgets.QMainWindow, Ui_MainWindow):
                     for testcase_key, testcase_value in self.testdef['tests'][test_key]['test_cases'].items():
                         del testcase_value['descp']
 
-            cmd = 'RunDefinition|%s|%s|%s|%s' % (testdef, run_mode, test_id, log_folder)
+            #Execution plan sent to device (kept in plans cache by its hash)
+            plan_file = PLAN.dumpPlan(PLAN.makePlan(testdef, run_mode, test_id, log_folder))
             #Call tcp client
-            argms = ['gui_usermode', '--command=%s' % cmd, '--verbose=1']
+            argms = ['gui_usermode', '--plan=%s' % plan_file, '--verbose=1']
             eth_p2p_client = getattr(ethp2p_client, 'main')
             eth_p2p_client(argms)
             sys.exit(0)
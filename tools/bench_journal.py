@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : bench_journal.py
+#description     : Command to stress JSON report writers: concurrent instances
+#                  write test case records to the same Test ID, records lost
+#                  are checked and throughput is measured.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to stress JSON report writers: concurrent instances write test case
+records to the same Test ID, records lost are checked and throughput is
+measured.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import time
+import json
+import getopt
+import datetime
+import tempfile
+import shutil
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class BenchJournal(object):
+    """
+    Class to write test case records from concurrent instances (processes)
+    to the same Test ID JSON report
+    """
+
+    def __init__(self, records):
+        """
+        Constructor
+
+        type: number
+        @param: records - test case records written by each instance
+        """
+
+        self.records = int(records)
+        self.log_path = tempfile.mkdtemp()
+
+    #==========================================================================
+
+    def run(self, instances):
+        """
+        Fork instances, release them at same time and wait them. Report is
+        built from journal after that.
+
+        type: number
+        @param: instances - number of concurrent instances
+
+        rtype: tuple
+        @return: records expected, records in report, seconds writing,
+                 seconds building report
+        """
+
+        test_id = 'bench_%d' % instances
+        log = LOG.Logging(self.log_path)
+        log.setTestLog(test_id)
+        log.initJSON()
+        log.writeJSON(LOG.JSON_TEST_EXEC)
+        log.writeJSON(LOG.JSON_TEST_NAME, [TOOLCFG.BENCH_JOURNAL_TEST])
+
+        #Instances wait end of file in pipe to start
+        sys.stdout.flush()
+        sys.stderr.flush()
+        start_r, start_w = os.pipe()
+        pids = []
+        for inst in range(instances):
+            pid = os.fork()
+            if pid == 0:
+                os.close(start_w)
+                os.read(start_r, 1)
+                rc = SYS.EXIT_NO_ERROR
+                try:
+                    self.__write(log, inst+1)
+                except Exception:
+                    rc = SYS.EXIT_ERROR
+                os._exit(rc)
+            pids.append(pid)
+        os.close(start_r)
+
+        start = time.perf_counter()
+        os.close(start_w)
+        for pid in pids:
+            os.waitpid(pid, 0)
+        write_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        log.finalizeJSON()
+        build_secs = time.perf_counter() - start
+
+        return instances * self.records, self.__check(test_id, instances), write_secs, build_secs
+
+    #==========================================================================
+
+    def clean(self):
+        """
+        Remove benchmark logs
+        """
+
+        shutil.rmtree(self.log_path, ignore_errors=True)
+
+    #==========================================================================
+
+    def __write(self, log, inst):
+        """
+        Write test case records of an instance
+        """
+
+        for order in range(1, self.records+1):
+            date = '%s' % datetime.datetime.now()
+            log.writeJSON(LOG.JSON_TESTC, [TOOLCFG.BENCH_JOURNAL_TEST, TOOLCFG.BENCH_JOURNAL_TC, date, date, 'Automation', inst,
+                                           SYS.EXIT_NO_ERROR, SYS.getExitMsg(SYS.EXIT_NO_ERROR), '', order])
+
+    #==========================================================================
+
+    def __check(self, test_id, instances):
+        """
+        Get records in JSON report written by all instances (each one once)
+
+        rtype: number
+        @return: records found, -1 if some record is repeated or unknown
+        """
+
+        with open(LOG.JSON_REPORT_FILE % (SYS.getTestIDPath(self.log_path, test_id), test_id), 'r') as f:
+            report = json.load(f)
+        testcs = report.get(LOG.JSON_TEST_EXEC, {}).get(TOOLCFG.BENCH_JOURNAL_TEST, [])
+        found = set((int(testc['concurrency_inst']), int(testc['order_exec'])) for testc in testcs)
+        expected = set((inst, order) for inst in range(1, instances+1) for order in range(1, self.records+1))
+        if len(found) != len(testcs) or not found <= expected:
+            return -1
+
+        return len(found)
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hir', ['help', 'instances=', 'records='])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_BENCHJOURNAL_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    instances = TOOLCFG.BENCH_JOURNAL_INSTANCES
+    records = TOOLCFG.BENCH_JOURNAL_RECORDS
+    for option, value in opts:
+        if option in ('--instances'):
+            instances = value
+        elif option in ('--records'):
+            records = value
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_BENCHJOURNAL_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    rc = SYS.EXIT_NO_ERROR
+    bench = BenchJournal(records)
+    print(TOOLCFG.BENCH_JOURNAL_HEAD)
+    for num in instances.split(','):
+        expected, found, write_secs, build_secs = bench.run(int(num))
+        print(TOOLCFG.BENCH_JOURNAL_ROW % (int(num), expected, found, expected - found if found >= 0 else expected,
+                                           write_secs, expected / write_secs, build_secs))
+        if found != expected:
+            rc = SYS.EXIT_ERROR
+    bench.clean()
+
+    print(TOOLCFG.BENCH_JOURNAL_OK if rc == SYS.EXIT_NO_ERROR else TOOLCFG.BENCH_JOURNAL_LOST)
+    SYS.exitTC(rc)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : bench_launch.py
+#description     : Command to benchmark test case launch latency (spawn to
+#                  first test line) for Popen and fork server launch modes.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to benchmark test case launch latency (spawn to first test line)
+for Popen and fork server launch modes.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import common_lib as LIB
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import proc_lib as PROCLIB
+from lib import log_lib as LOG
+from lib import forksrv_lib as FSRV
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import getopt
+import datetime
+import tempfile
+import shutil
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class BenchLaunch(object):
+    """
+    Class to measure spawn to first test line latency of test case instances
+    """
+
+    def __init__(self, test_name, testcase_order):
+        """
+        Constructor
+
+        type: string
+        @param: test_name - test name
+
+        type: number
+        @param: testcase_order - order of test case to launch
+        """
+
+        self.test_name = test_name
+        self.order = int(testcase_order)
+        self.log_path = tempfile.mkdtemp()
+
+    #==========================================================================
+
+    def run(self, launch, instances):
+        """
+        Launch instances of test case and get latencies.
+
+        type: string
+        @param: launch - launch mode [ popen | forkserver ]
+
+        type: number
+        @param: instances - number of instances to launch
+
+        rtype: list
+        @return: latencies in seconds (min, avg, max)
+        """
+
+        tdef = LIB.getDefinition(CFG.SW_TD_TEST, self.test_name)
+        tcase = tdef['test_cases'][self.order]
+        test_id = 'bench_%s_%d' % (launch, instances)
+
+        #Test ID folder with JSON ready for test case records
+        log = LOG.Logging(self.log_path)
+        log.setTestLog(test_id)
+        log.initJSON()
+        log.writeJSON(LOG.JSON_TEST_EXEC)
+        log.writeJSON(LOG.JSON_TEST_NAME, [self.test_name])
+
+        #Test case output is not part of measure
+        sys.stdout.flush()
+        sys.stderr.flush()
+        stdout_fd = os.dup(1)
+        stderr_fd = os.dup(2)
+        null_fd = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(null_fd, 1)
+        os.dup2(null_fd, 2)
+
+        launcher = None
+        if launch == CFG.SW_LAUNCH_FORK:
+            launcher = FSRV.ForkServer(self.test_name)
+            launcher.start()
+
+        procs = []
+        spawn_times = []
+        script = '%s/%s/%s.py' %(CFG.SW_TEST_PATH, self.test_name, self.test_name)
+        for inst in range(instances):
+            cmd = [script, tcase['name'], tcase['mode'], '%d' % (inst+1), test_id, self.log_path, '%d' % self.order]
+            spawn_times.append(datetime.datetime.now())
+            procs.append(PROCLIB.execProcDetch(cmd, False, launcher))
+
+        pids = PROCLIB.listPids(procs, [tcase['protected']] * instances)
+        PROCLIB.waitPids(procs, pids)
+        if launcher:
+            launcher.close()
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(stdout_fd, 1)
+        os.dup2(stderr_fd, 2)
+        os.close(stdout_fd)
+        os.close(stderr_fd)
+        os.close(null_fd)
+
+        latencies = []
+        for inst in range(instances):
+            log_file = '%s/%s_%s_%d.log' % (SYS.getTestIDPath(self.log_path, test_id), self.test_name, tcase['name'], inst+1)
+            first_line = self.__getFirstLineTime(log_file)
+            if first_line:
+                latencies.append((first_line - spawn_times[inst]).total_seconds())
+
+        if not latencies:
+            return None
+
+        return min(latencies), sum(latencies) / len(latencies), max(latencies)
+
+    #==========================================================================
+
+    def clean(self):
+        """
+        Remove benchmark logs
+        """
+
+        shutil.rmtree(self.log_path, ignore_errors=True)
+
+    #==========================================================================
+
+    def __getFirstLineTime(self, log_file):
+        """
+        Get time stamp of first line in a log file
+
+        rtype: datetime
+        @return: time stamp, None if there is no line
+        """
+
+        try:
+            with open(log_file, 'r') as f:
+                line = f.readline()
+            return datetime.datetime.strptime(line.split(' ]')[0].strip('[ '), '%Y-%m-%d %H:%M:%S.%f')
+        except (OSError, ValueError):
+            return None
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hnoi', ['help', 'name=', 'order=', 'instances='])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_BENCHLAUNCH_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    name = TOOLCFG.BENCH_DEF_TEST
+    order = TOOLCFG.BENCH_DEF_ORDER
+    instances = TOOLCFG.BENCH_DEF_INSTANCES
+    for option, value in opts:
+        if option in ('--name'):
+            name = value
+        elif option in ('--order'):
+            order = value
+        elif option in ('--instances'):
+            instances = value
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_BENCHLAUNCH_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    bench = BenchLaunch(name, order)
+    print(TOOLCFG.BENCH_LAUNCH_HEAD)
+    for num in instances.split(','):
+        for launch in (CFG.SW_LAUNCH_POPEN, CFG.SW_LAUNCH_FORK):
+            result = bench.run(launch, int(num))
+            if result:
+                print(TOOLCFG.BENCH_LAUNCH_ROW % ((launch, int(num)) + result))
+            else:
+                print(TOOLCFG.BENCH_LAUNCH_NORES % (launch, int(num)))
+    bench.clean()
+
+    SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
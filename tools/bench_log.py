@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : bench_log.py
+#description     : Command to benchmark log lines written per second by
+#                  direct (open, append, close per line) and background
+#                  log writers.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to benchmark log lines written per second by direct (open, append,
+close per line) and background log writers.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import sys
+import time
+import getopt
+import tempfile
+import shutil
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class BenchLog(object):
+    """
+    Class to write log lines to test case and Test ID log files, as a test
+    case instance does
+    """
+
+    def __init__(self, lines):
+        """
+        Constructor
+
+        type: number
+        @param: lines - lines written to each log file
+        """
+
+        self.lines = int(lines)
+        self.log_path = tempfile.mkdtemp()
+
+    #==========================================================================
+
+    def run(self, buffered):
+        """
+        Write lines and wait them to be in log files.
+
+        type: number
+        @param: buffered - 1 for background writer, 0 for direct writes
+
+        rtype: tuple
+        @return: lines written, lines in log files, seconds
+        """
+
+        test_id = 'bench_%d' % buffered
+        test_log = LOG.Logging(self.log_path)
+        test_log.setTestLog(test_id)
+        testc_log = LOG.Logging(self.log_path)
+        testc_log.setTestLog(test_id, TOOLCFG.BENCH_LOG_TEST, TOOLCFG.BENCH_LOG_TC, 1)
+
+        CFG.SW_LOG_BUFFER = buffered
+        start = time.perf_counter()
+        for line in range(self.lines):
+            testc_log.log(TOOLCFG.BENCH_LOG_LINE % line)
+            test_log.log(TOOLCFG.BENCH_LOG_LINE % line, LOG.INFO, LOG.OK)
+        LOG.flushLogs()
+        secs = time.perf_counter() - start
+
+        found = 0
+        for log in (test_log, testc_log):
+            with open(log.test_log_file, 'r') as f:
+                found += len(f.readlines())
+
+        return self.lines * 2, found, secs
+
+    #==========================================================================
+
+    def clean(self):
+        """
+        Remove benchmark logs
+        """
+
+        shutil.rmtree(self.log_path, ignore_errors=True)
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hl', ['help', 'lines='])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_BENCHLOG_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    lines = TOOLCFG.BENCH_LOG_LINES
+    for option, value in opts:
+        if option in ('--lines'):
+            lines = value
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_BENCHLOG_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    rc = SYS.EXIT_NO_ERROR
+    bench = BenchLog(lines)
+    print(TOOLCFG.BENCH_LOG_HEAD)
+    for name, buffered in ((TOOLCFG.BENCH_LOG_DIRECT, 0), (TOOLCFG.BENCH_LOG_BUFFERED, 1)):
+        expected, found, secs = bench.run(buffered)
+        print(TOOLCFG.BENCH_LOG_ROW % (name, expected, found, secs, expected / secs))
+        if found != expected:
+            rc = SYS.EXIT_ERROR
+    bench.clean()
+
+    SYS.exitTC(rc)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
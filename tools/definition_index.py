@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : definition_index.py
+#description     : Command to show, clear or rebuild compiled index of test
+#                  and profile definitions.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to show, clear or rebuild compiled index of test and profile
+definitions.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from lib import sys_lib as SYS
+from lib import defindex_lib as DEFIDX
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import sys
+import getopt
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hscr', ['help', 'show', 'clear', 'rebuild'])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_DEFINDEX_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    action = '--show'
+    for option, value in opts:
+        if option in ('--show', '--clear', '--rebuild'):
+            action = option
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_DEFINDEX_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    index = DEFIDX.DefinitionIndex()
+    if action == '--clear':
+        index.clear()
+        print(TOOLCFG.DINDEX_MSG_2 % index.index_file)
+    elif action == '--rebuild':
+        entries = index.rebuild()
+        print(TOOLCFG.DINDEX_MSG_3 % (index.index_file, entries))
+    else:
+        print(TOOLCFG.DINDEX_MSG_1 % (index.index_file, len(index.entries)))
+        print(TOOLCFG.DINDEX_HEAD)
+        for key, entry in sorted(index.entries.items()):
+            type_def, name = key.split(':', 1)
+            print(TOOLCFG.DINDEX_ROW % (type_def, name, TOOLCFG.DINDEX_IMPORT if entry['def'] is None else TOOLCFG.DINDEX_INDEXED))
+
+    SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -100,19 +100,25 @@ def main(args):
     """
 
     try:
-        opts, argmts = getopt.getopt(args[1:], 'htb', ['help', 'testfolder=', 'backupfolder='])
+        opts, argmts = getopt.getopt(args[1:], 'htibl', ['help', 'testfolder=', 'testid=', 'backupfolder=', 'logdir='])
     except getopt.GetoptError as err:
         print(err)
         TOOLIB.MENU_GENBACK_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
     test_dir = ''
+    test_id = ''
     backup_dir = ''
+    logdir = CFG.SW_LOGS_PATH
     for option, value in opts:
         if option in ('--testfolder'):
             test_dir = value
+        elif option in ('--testid'):
+            test_id = value
         elif option in ('--backupfolder'):
             backup_dir = value
+        elif option in ('--logdir'):
+            logdir = value
         elif option in ('-h', '--help'):
             TOOLIB.MENU_GENBACK_USAGE()
             SYS.exitTC(SYS.EXIT_NO_ERROR)
@@ -120,6 +126,10 @@ def main(args):
             print(TOOLCFG.RDEF_MSG_1)
             SYS.exitTC(SYS.EXIT_ERROR)
 
+    #Test ID folder resolved in logs path (flat or sharded layout)
+    if test_id:
+        test_dir = SYS.getTestIDPath(logdir, test_id)
+
     if not test_dir or not backup_dir:
         print(TOOLCFG.GENB_MSG_2)
         TOOLIB.MENU_GENBACK_USAGE()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : migrate_logs.py
+#description     : Command to convert Test ID folders of a logs path in place
+#                  between flat and sharded layouts.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to convert Test ID folders of a logs path in place between flat and
+sharded layouts.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from lib import hash_lib as HASH
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import os
+import sys
+import json
+import getopt
+
+#==============================================================================
+#================================ CLASSES =====================================
+#==============================================================================
+
+class MigrateLogs(object):
+    """
+    Class to move Test ID folders of a logs path to flat or sharded layout
+    """
+
+    def __init__(self, log_path, sharded = True):
+        """
+        Constructor
+
+        type: string
+        @param: log_path - logs path
+
+        type: boolean
+        @param: sharded - layout to convert to (optional, sharded by default)
+        """
+
+        self.log_path = os.path.normpath(log_path)
+        self.sharded = sharded
+
+    #==========================================================================
+
+    def migrate(self):
+        """
+        Move Test ID folders not in layout. Folders are renamed (files are
+        not copied), so no run may write to logs path meanwhile.
+
+        rtype: tuple
+        @return: Test IDs moved and Test IDs skipped
+        """
+
+        moved = 0
+        skipped = 0
+        for test_id in SYS.listTestIDs(self.log_path):
+            src = SYS.getTestIDPath(self.log_path, test_id, not self.sharded)
+            dst = SYS.getTestIDPath(self.log_path, test_id, self.sharded)
+            if not os.path.isdir(src) or src == dst:
+                continue
+            #Folder in both layouts (a shard folder can hold its own Test ID)
+            if os.path.exists(dst) and not src.startswith('%s/' % dst):
+                print(TOOLCFG.MIGRATE_MSG_2 % (test_id, dst))
+                skipped += 1
+                continue
+
+            self.__keepChecksum(test_id, src)
+            if not self.__move(test_id, src, dst):
+                print(TOOLCFG.MIGRATE_MSG_2 % (test_id, dst))
+                skipped += 1
+                continue
+            print(TOOLCFG.MIGRATE_MSG_1 % (test_id, src, dst))
+            moved += 1
+
+        return moved, skipped
+
+    #==========================================================================
+
+    def __keepChecksum(self, test_id, test_folder):
+        """
+        Write manifest of a Test ID without it, so it is still validated once
+        moved (checksum sums paths of its folder). Manifest is written only
+        if folder matches its checksum.
+        """
+
+        excludes = LOG.getReportFiles(test_id)
+        if os.path.exists(LOG.JSON_MANIFEST_FILE % (test_folder, test_id)):
+            return SYS.RC_NO_ERROR
+
+        try:
+            with open(LOG.JSON_REPORT_FILE % (test_folder, test_id), 'r') as f:
+                checksum = json.load(f)[LOG.JSON_SHA256]
+        except (OSError, ValueError, KeyError, TypeError):
+            return SYS.RC_ERROR
+
+        manifest = HASH.getFolderManifest(test_folder, excludes)
+        sha = HASH.getManifestSHA256(manifest)
+        if sha != checksum:
+            return SYS.RC_ERROR
+        HASH.writeManifest(LOG.JSON_MANIFEST_FILE % (test_folder, test_id), test_folder, manifest, sha)
+        print(TOOLCFG.MIGRATE_MSG_5 % test_id)
+
+        return SYS.RC_NO_ERROR
+
+    #==========================================================================
+
+    def __move(self, test_id, src, dst):
+        """
+        Move a Test ID folder through a temporary name in logs path (one
+        folder can be the parent of the other) and remove shard folders left
+        empty.
+
+        rtype: boolean
+        @return: True if folder was moved
+        """
+
+        tmp = TOOLCFG.MIGRATE_TMP_DIR % (self.log_path, test_id)
+        os.rename(src, tmp)
+        self.__removeShards(src)
+        try:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            os.rename(tmp, dst)
+        except OSError:
+            os.makedirs(os.path.dirname(src), exist_ok=True)
+            os.rename(tmp, src)
+            return False
+
+        return True
+
+    #==========================================================================
+
+    def __removeShards(self, path):
+        """
+        Remove empty shard folders of a path (up to logs path)
+        """
+
+        parent = os.path.dirname(path)
+        while parent != self.log_path and parent.startswith('%s/' % self.log_path):
+            try:
+                os.rmdir(parent)
+            except OSError: #Not empty
+                break
+            parent = os.path.dirname(parent)
+
+        return SYS.RC_NO_ERROR
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hlf', ['help', 'logdir=', 'flat'])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_MIGRATELOGS_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    logdir = CFG.SW_LOGS_PATH
+    sharded = True
+    for option, value in opts:
+        if option in ('--logdir'):
+            logdir = value
+        elif option in ('--flat'):
+            sharded = False
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_MIGRATELOGS_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    if not os.path.isdir(logdir):
+        print(TOOLCFG.MIGRATE_NOPATH % logdir)
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    layout = TOOLCFG.MIGRATE_SHARDED if sharded else TOOLCFG.MIGRATE_FLAT
+    moved, skipped = MigrateLogs(logdir, sharded).migrate()
+    print(TOOLCFG.MIGRATE_MSG_3 % (layout, logdir, moved, skipped))
+    if bool(CFG.SW_LOGS_SHARDED) != sharded:
+        print(TOOLCFG.MIGRATE_MSG_4 % (int(sharded), layout))
+
+    SYS.exitTC(SYS.EXIT_ERROR if skipped else SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : result_cache.py
+#description     : Command to show, clear or rebuild result cache of
+#                  incremental runs.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to show, clear or rebuild result cache of incremental runs.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import cache_lib as CACHE
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import sys
+import getopt
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hscrl', ['help', 'show', 'clear', 'rebuild', 'logdir='])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_RESULTCACHE_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    action = '--show'
+    logdir = CFG.SW_LOGS_PATH
+    for option, value in opts:
+        if option in ('--show', '--clear', '--rebuild'):
+            action = option
+        elif option in ('--logdir'):
+            logdir = value
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_RESULTCACHE_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    cache = CACHE.ResultCache()
+    if action == '--clear':
+        cache.clear()
+        print(TOOLCFG.RCACHE_MSG_2 % cache.cache_file)
+    elif action == '--rebuild':
+        entries = cache.rebuild(logdir)
+        print(TOOLCFG.RCACHE_MSG_3 % (cache.cache_file, logdir, entries))
+    else:
+        print(TOOLCFG.RCACHE_MSG_1 % (cache.cache_file, len(cache.entries)))
+        print(TOOLCFG.RCACHE_HEAD)
+        for fingerprint, entry in sorted(cache.entries.items(), key=lambda item: (item[1]['test'], int(item[1]['order']))):
+            print(TOOLCFG.RCACHE_ROW % (fingerprint[:16], entry['test_id'], entry['test'], entry['order'], entry['method']))
+
+    SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : results_index.py
+#description     : Command to rebuild and query results index of all Test
+#                  IDs: duration trend of a test case, flaky test cases and
+#                  slowest test cases.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to rebuild and query results index of all Test IDs: duration trend
+of a test case, flaky test cases and slowest test cases.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import resindex_lib as RIDX
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import sys
+import time
+import getopt
+import sqlite3
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'hsrltfn', ['help', 'show', 'rebuild', 'logdir=', 'trend=', 'test=',
+                                                            'flaky', 'slowest=', 'last='])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_RESULTSINDEX_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    action = '--show'
+    logdir = CFG.SW_LOGS_PATH
+    method = None
+    test_name = None
+    number = 0
+    last = TOOLCFG.RINDEX_LAST
+    try:
+        for option, value in opts:
+            if option in ('--show', '--rebuild', '--flaky'):
+                action = option
+            elif option in ('--trend'):
+                action = option
+                method = value
+            elif option in ('--slowest'):
+                action = option
+                number = int(value)
+            elif option in ('--test'):
+                test_name = value
+            elif option in ('--last'):
+                last = int(value)
+            elif option in ('--logdir'):
+                logdir = value
+            elif option in ('-h', '--help'):
+                TOOLIB.MENU_RESULTSINDEX_USAGE()
+                SYS.exitTC(SYS.EXIT_NO_ERROR)
+            else:
+                print(TOOLCFG.RDEF_MSG_1)
+                SYS.exitTC(SYS.EXIT_ERROR)
+    except ValueError as err:
+        print(err)
+        TOOLIB.MENU_RESULTSINDEX_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    try:
+        index = RIDX.ResultsIndex()
+    except (OSError, sqlite3.Error) as err:
+        print(TOOLCFG.RINDEX_ERROR % (CFG.SW_RESULTS_DB, err))
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    start = time.perf_counter()
+    if action == '--rebuild':
+        runs, skipped = index.rebuild(logdir)
+        for test_id, err in skipped:
+            print(TOOLCFG.RINDEX_SKIP % (test_id, err))
+        print(TOOLCFG.RINDEX_MSG_2 % (index.index_file, logdir, runs, len(skipped)))
+    elif action == '--trend':
+        rows = index.getTrend(method, test_name, last)
+        print(TOOLCFG.RINDEX_MSG_3 % (method, len(rows), last))
+        print(TOOLCFG.RINDEX_TREND_HEAD)
+        for test_id, start_date, test, order, duration, exit_status, instances, failed in rows:
+            print(TOOLCFG.RINDEX_TREND_ROW % (test_id, start_date or '', test, order, TOOLCFG.RINDEX_SECS % duration if duration is not None else '-', exit_status, instances, failed))
+        durations = [row[4] for row in rows if row[4] is not None]
+        if durations:
+            print(TOOLCFG.RINDEX_TREND_SUM % (sum(durations) / len(durations), min(durations), max(durations)))
+    elif action == '--flaky':
+        rows = index.getFlaky(last)
+        print(TOOLCFG.RINDEX_MSG_4 % (len(rows), last))
+        print(TOOLCFG.RINDEX_FLAKY_HEAD)
+        for test, order, method, runs, failures, flips, last_failed in rows:
+            print(TOOLCFG.RINDEX_FLAKY_ROW % (test, order, method, runs, failures, flips, last_failed))
+    elif action == '--slowest':
+        rows = index.getSlowest(number, last)
+        print(TOOLCFG.RINDEX_MSG_5 % (len(rows), last))
+        print(TOOLCFG.RINDEX_SLOW_HEAD)
+        for test, order, method, runs, mean, longest in rows:
+            print(TOOLCFG.RINDEX_SLOW_ROW % (test, order, method, runs, mean, longest))
+    else:
+        print(TOOLCFG.RINDEX_MSG_1 % index.index_file)
+        for table, rows in index.getCounts():
+            print(TOOLCFG.RINDEX_COUNT_ROW % (table, rows))
+    print(TOOLCFG.RINDEX_TIME % ((time.perf_counter() - start) * 1000))
+    index.close()
+
+    SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -17,6 +17,7 @@ Command to start running a test based on custom definition
 
 from config import config as CFG
 from lib import sys_lib as SYS
+from lib import plan_lib as PLAN
 from tools.toolslib import tools_lib as TOOLIB
 from tools.toolsconfig import tools_config as TOOLCFG
 from src import executor
@@ -27,6 +28,7 @@ from src import executor
 
 import getopt
 import sys
+import ast
 
 #==============================================================================
 #================================ FUNCTIONS ===================================
@@ -50,19 +52,34 @@ def main(args):
     """
 
     try:
-        opts, argmts = getopt.getopt(args[1:], 'hdrlt', ['help', 'def=', 'runmode=', 'logdir=', 'testid='])
+        opts, argmts = getopt.getopt(args[1:], 'hdrlt', ['help', 'def=', 'plan=', 'save-plan=', 'runmode=', 'logdir=', 'testid='])
     except getopt.GetoptError as err:
         print(err)
         TOOLIB.MENU_RUNDEF_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
     testdef = {}
-    runmode = TOOLCFG.RDEF_NORMAL_ALIAS
+    plan = None
+    save_plan = ''
+    runmode = ''
     logdir = ''
     logid = ''
     for option, value in opts:
         if option in ('--def'):
-            testdef = eval(value)
+            #Definition as literal (compatibility, execution plans are preferred)
+            try:
+                testdef = ast.literal_eval(value)
+            except (ValueError, SyntaxError) as e:
+                print(TOOLCFG.RCUSTOMDEF_MSG_3 % e)
+                SYS.exitTC(SYS.EXIT_ERROR)
+        elif option in ('--plan'):
+            try:
+                plan = PLAN.loadPlan(value)
+            except ValueError as e:
+                print(e)
+                SYS.exitTC(SYS.EXIT_ERROR)
+        elif option in ('--save-plan'):
+            save_plan = value
         elif option in ('--runmode'):
             runmode = value
         elif option in ('--logdir'):
@@ -75,9 +92,9 @@ def main(args):
         else:
             assert False, TOOLCFG.RDEF_MSG_1
 
-    if not testdef:
-        print(TOOLCFG.RTEST_MSG_1)
-        TOOLIB.MENU_RUNTEST_USAGE()
+    if not testdef and not plan:
+        print(TOOLCFG.RCUSTOMDEF_MSG_1)
+        TOOLIB.MENU_RUNDEF_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
     if runmode == TOOLCFG.RDEF_NORMAL_ALIAS:
@@ -85,8 +102,21 @@ def main(args):
     elif runmode == TOOLCFG.RDEF_PARL_ALIAS:
         runmode = '1'
 
+    #Run values set in command line are changed in plan
+    if plan:
+        run = plan['run']
+        if runmode or logdir or logid:
+            plan = PLAN.makePlan(PLAN.getPlanDefinition(plan), runmode or run['runmode'], logid or run['test_id'], logdir or run['log_path'], run['options'])
+    else:
+        plan = PLAN.makePlan(testdef, runmode or '0', logid, logdir)
+
+    #Write plan without run it
+    if save_plan:
+        print(TOOLCFG.RCUSTOMDEF_MSG_4 % (PLAN.dumpPlan(plan, save_plan), plan['hash']))
+        SYS.exitTC(SYS.EXIT_NO_ERROR)
+
     #Call executor
-    args = [args[0], CFG.SW_CUSTOM_TD, testdef, runmode, logdir, logid]
+    args = [args[0], CFG.SW_PLAN_TD, plan]
     executor_main = getattr(executor, 'main')
     executor_main(args)
 
@@ -15,6 +15,7 @@ Command to start running a profile
 #============================= FWK IMPORTS ====================================
 #==============================================================================
 
+from lib import common_lib as LIB
 from config import config as CFG
 from lib import sys_lib as SYS
 from tools.toolslib import tools_lib as TOOLIB
@@ -50,7 +51,7 @@ def main(args):
     """
 
     try:
-        opts, argmts = getopt.getopt(args[1:], 'hnurlt', ['help', 'name=', 'usermode=', 'runmode=', 'logdir=', 'testid='])
+        opts, argmts = getopt.getopt(args[1:], 'hnurlt', ['help', 'name=', 'usermode=', 'runmode=', 'logdir=', 'testid=', 'launch=', 'workers=', 'pacing=', 'jobs=', 'admit', 'fail-fast', 'max-failures=', 'incremental', 'device-id=', 'rerun-failed=', 'dry-run', 'ctests='])
     except getopt.GetoptError as err:
         print(err)
         TOOLIB.MENU_RUNPROFILE_USAGE()
@@ -61,6 +62,8 @@ def main(args):
     runmode = TOOLCFG.RDEF_NORMAL_ALIAS
     logdir = ''
     logid = ''
+    rerun = ''
+    options = []
     for option, value in opts:
         if option in ('--name'):
             name = value
@@ -72,6 +75,30 @@ def main(args):
             logdir = value
         elif option in ('--testid'):
             logid = value
+        elif option in ('--launch'):
+            options.append('%s=%s' % (CFG.SW_OPT_LAUNCH, value.lower()))
+        elif option in ('--workers'):
+            options.append('%s=%s' % (CFG.SW_OPT_WORKERS, value))
+        elif option in ('--pacing'):
+            options.append('%s=%s' % (CFG.SW_OPT_PACING, value))
+        elif option in ('--jobs'):
+            options.append('%s=%s' % (CFG.SW_OPT_JOBS, value))
+        elif option in ('--admit'):
+            options.append(CFG.SW_OPT_ADMIT)
+        elif option in ('--fail-fast'):
+            options.append(CFG.SW_OPT_FAILFAST)
+        elif option in ('--max-failures'):
+            options.append('%s=%s' % (CFG.SW_OPT_MAXFAIL, value))
+        elif option in ('--incremental'):
+            options.append(CFG.SW_OPT_INCREMENTAL)
+        elif option in ('--device-id'):
+            options.append('%s=%s' % (CFG.SW_OPT_DEVICE, value))
+        elif option in ('--rerun-failed'):
+            rerun = value
+        elif option in ('--dry-run'):
+            options.append(CFG.SW_OPT_DRYRUN)
+        elif option in ('--ctests'):
+            options.append('%s=%s' % (CFG.SW_OPT_CTESTS, value))
         elif option in ('-h', '--help'):
             TOOLIB.MENU_RUNPROFILE_USAGE()
             SYS.exitTC(SYS.EXIT_NO_ERROR)
@@ -79,7 +106,7 @@ def main(args):
             print(TOOLCFG.RDEF_MSG_1)
             SYS.exitTC(SYS.EXIT_ERROR)
 
-    if not name:
+    if not name and not rerun:
         print(TOOLCFG.RTEST_MSG_1)
         TOOLIB.MENU_RUNPROFILE_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
@@ -96,7 +123,16 @@ def main(args):
         runmode = '1'
 
     #Call executor
-    args = [args[0], CFG.SW_TD_PROFILE, name, usermode, runmode, logdir, logid]
+    if rerun:
+        #Failed test cases of Test ID as custom definition
+        rerun_def = LIB.getRerunDefinition(logdir or CFG.SW_LOGS_PATH, rerun)
+        if rerun_def is None:
+            SYS.exitTC(SYS.EXIT_ERROR)
+        if not rerun_def:
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        args = [args[0], CFG.SW_CUSTOM_TD, rerun_def, runmode, logdir, logid, ','.join(options)]
+    else:
+        args = [args[0], CFG.SW_TD_PROFILE, name, usermode, runmode, logdir, logid, ','.join(options)]
     executor_main = getattr(executor, 'main')
     executor_main(args)
 
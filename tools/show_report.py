@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+#==============================================================================
+#title           : show_report.py
+#description     : Command to show JSON report of a Test ID, partial report
+#                  from its journal while it is running.
+#author          : agent (agent@local)
+#date            : October 2026
+#python_version  : 3 or later
+#license         : GPL v2.0
+#==============================================================================
+"""
+Command to show JSON report of a Test ID, partial report from its journal
+while it is running.
+"""
+
+#==============================================================================
+#============================= FWK IMPORTS ====================================
+#==============================================================================
+
+from config import config as CFG
+from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from tools.toolslib import tools_lib as TOOLIB
+from tools.toolsconfig import tools_config as TOOLCFG
+
+#==============================================================================
+#============================= OTHER IMPORTS ==================================
+#==============================================================================
+
+import sys
+import json
+import getopt
+
+#==============================================================================
+#================================ MAIN ========================================
+#==============================================================================
+
+def main(args):
+    """
+    Main function
+    """
+
+    try:
+        opts, argmts = getopt.getopt(args[1:], 'htlj', ['help', 'testid=', 'logdir=', 'json'])
+    except getopt.GetoptError as err:
+        print(err)
+        TOOLIB.MENU_SHOWREPORT_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    test_id = None
+    logdir = CFG.SW_LOGS_PATH
+    as_json = False
+    for option, value in opts:
+        if option in ('--testid'):
+            test_id = value
+        elif option in ('--logdir'):
+            logdir = value
+        elif option in ('--json'):
+            as_json = True
+        elif option in ('-h', '--help'):
+            TOOLIB.MENU_SHOWREPORT_USAGE()
+            SYS.exitTC(SYS.EXIT_NO_ERROR)
+        else:
+            print(TOOLCFG.RDEF_MSG_1)
+            SYS.exitTC(SYS.EXIT_ERROR)
+
+    if not test_id:
+        print(TOOLCFG.SREPORT_MSG_3)
+        TOOLIB.MENU_SHOWREPORT_USAGE()
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    report = LOG.readJSON(logdir, test_id)
+    if report is None:
+        print(TOOLCFG.SREPORT_MSG_2 % (test_id, logdir))
+        SYS.exitTC(SYS.EXIT_ERROR)
+
+    if as_json:
+        print(json.dumps(report, indent=2))
+        SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+    #Checksum is last element written by a run
+    state = TOOLCFG.SREPORT_FINISHED if LOG.JSON_SHA256 in report else TOOLCFG.SREPORT_RUNNING
+    print(TOOLCFG.SREPORT_MSG_1 % (test_id, state))
+    print(TOOLCFG.SREPORT_HEAD)
+    for test_name, testcs in report.get(LOG.JSON_TEST_EXEC, {}).items():
+        orders = {}
+        unordered = {}
+        for testc in testcs:
+            #Reports of older versions do not keep order of test cases
+            if testc.get('order_exec') is None:
+                unordered.setdefault(testc.get('method') or '', []).append(testc)
+            else:
+                orders.setdefault(int(testc['order_exec']), []).append(testc)
+        rows = [(order, results) for order, results in sorted(orders.items())]
+        rows += [(TOOLCFG.SREPORT_UNORDERED, results) for method, results in sorted(unordered.items())]
+        for order, results in rows:
+            passed = len([testc for testc in results if str(testc.get('exit_status')) == str(SYS.EXIT_NO_ERROR)])
+            print(TOOLCFG.SREPORT_ROW % (test_name, order, results[0].get('method') or '', len(results), passed, len(results) - passed))
+
+    SYS.exitTC(SYS.EXIT_NO_ERROR)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
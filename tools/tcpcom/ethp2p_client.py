@@ -18,6 +18,7 @@ execute tests and send responses as status and final output
 
 from config import config as CFG
 from lib import sys_lib as SYS
+from lib import plan_lib as PLAN
 from tools.toolslib import tools_lib as TOOLIB
 from tools.toolsconfig import tools_config as TOOLCFG
 
@@ -118,12 +119,15 @@ class ETHP2PClient(object):
 
     #==========================================================================
 
-    def sendCommand (self, cmd) :
+    def sendCommand (self, cmd, payload = b'') :
         """
         send command to server.
 
         type: string
         @param: cmd - string pattern with command to run
+
+        type: bytes
+        @param: payload - data sent after command (optional)
         """
 
         response_output = ''
@@ -132,7 +136,7 @@ class ETHP2PClient(object):
             self.client.connect((self.server_ip, self.server_port))
             data = ''
             message = cmd
-            self.client.send(message.encode())
+            self.client.sendall(message.encode() + payload)
             print (TOOLCFG.TCP_CLI_MSG_2 % message)
             #receive data and Wait for and End Command message from server
             while data != TOOLCFG.TCP_CLISRV_MSG_5 and not re.match(r'<EndCommand>+', data):
@@ -166,6 +170,25 @@ class ETHP2PClient(object):
 
     #==========================================================================
 
+    def sendPlan (self, plan_file) :
+        """
+        send execution plan to server to run it.
+
+        type: string
+        @param: plan_file - execution plan JSON file
+        """
+
+        try:
+            PLAN.loadPlan(plan_file)
+            with open(plan_file, 'rb') as f:
+                data = f.read()
+        except ValueError as e:
+            return SYS.EXIT_ERROR, TOOLCFG.TCP_CLI_MSG_12 % (plan_file, e)
+
+        return self.sendCommand('RunPlan:%d' % len(data), b'\n' + data)
+
+    #==========================================================================
+
     def sendFile (self, source_file, file_dest) :
         """
         send file to server.
@@ -306,13 +329,14 @@ def main(args):
     """
 
     try:
-        opts, argmts = getopt.getopt(args[1:], 'hcfv', ['help', 'command=', 'file_from=', 'file_to=', 'verbose='])
+        opts, argmts = getopt.getopt(args[1:], 'hcfv', ['help', 'command=', 'plan=', 'file_from=', 'file_to=', 'verbose='])
     except getopt.GetoptError as err:
         print(err)
         TOOLIB.MENU_ETHP2PCLIENT_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
     command = ''
+    plan_file = ''
     source_file = ''
     dest_file = ''
     verbose = 0
@@ -320,6 +344,8 @@ def main(args):
     for option, value in opts:
         if option in ('--command'):
             command = value
+        elif option in ('--plan'):
+            plan_file = value
         elif option in ('--file_from'):
             source_file = value
         elif option in ('--file_to'):
@@ -333,7 +359,7 @@ def main(args):
             print(TOOLCFG.RDEF_MSG_1)
             SYS.exitTC(SYS.EXIT_ERROR)
 
-    if not command and not source_file:
+    if not command and not plan_file and not source_file:
         print(TOOLCFG.TCP_CLI_MSG_7)
         TOOLIB.MENU_ETHP2PCLIENT_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
@@ -356,6 +382,8 @@ def main(args):
 
     if command:
         rc, rout = client.sendCommand (command)
+    elif plan_file:
+        rc, rout = client.sendPlan (plan_file)
     else:
         rc, rout = client.sendFile (source_file, dest_file)
 
@@ -208,8 +208,11 @@ class ETHP2PServer(object):
 
                 else: #Commands available
 
+                    #Command to run execution plan streamed after command (not decoded)
+                    if re.match(rb'RunPlan:+', client_input):
+                        self.__runPlan(client_input)
                     #Command to run shell command
-                    if re.match(r'ShellCommand:+', client_input.decode()):
+                    elif re.match(r'ShellCommand:+', client_input.decode()):
                         self.__shellCmd(client_input)
                     #Command to run profile
                     elif re.match(r'RunProfile:+', client_input.decode()):
@@ -341,6 +344,37 @@ class ETHP2PServer(object):
 
     #==========================================================================
 
+    def __runPlan (self, client_input) :
+        """
+        receive execution plan (RunPlan:size followed by plan JSON), execute it
+        streaming plan by standard input and send output to client connected.
+        """
+
+        header, _, plan = client_input.partition(b'\n')
+        planCmd = header.decode().split(':')
+        if len(planCmd) > 1 and planCmd[1].isdigit():
+            size = int(planCmd[1])
+            while len(plan) < size:
+                data = self.client.recv(65536)
+                if not data:
+                    break
+                plan += data
+            plan_script = '%s/run_definition.py' % CFG.SW_TOOLS_PATH
+            cmd = [plan_script, '--plan=-']
+            self.client.send(TOOLCFG.RCUSTOMDEF_MSG_2.encode())
+            p = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=1)
+            p.stdin.write(plan[:size])
+            p.stdin.close()
+            for line in iter(p.stdout.readline, b''):
+                self.client.send(line)
+            p.stdout.close()
+            p.wait()
+        else:
+            resp = TOOLCFG.TCP_SRV_MSG_15
+            self.client.send(resp.encode())
+
+    #==========================================================================
+
     def __sendFile (self, client_input) :
         """
         put server in Image receive mode.
@@ -41,8 +41,10 @@ RTEST_MSG_1 = 'Test Name required'
 RTEST_MSG_2 = 'Running Test...'
 
 #Run Definition Strings
-RCUSTOMDEF_MSG_1 = 'Test Name required'
+RCUSTOMDEF_MSG_1 = 'Custom Definition or Execution Plan required'
 RCUSTOMDEF_MSG_2 = 'Running Custom Definition...'
+RCUSTOMDEF_MSG_3 = 'Custom Definition not valid: %s'
+RCUSTOMDEF_MSG_4 = 'Execution Plan written [ %s ] - hash [ %s ]'
 
 #Create Profile Strings
 PROF_MSG_1 = '[%s] created'
@@ -81,6 +83,93 @@ VALTEST_NOVALID = 'Test %s was manipulated, It\'s not valid - Current Hash [%s]
 VALTEST_VALID = 'Test %s is Valid - Current Hash [%s] - Has to check [%s] [ \x1b[1;32mOK\x1b[0m ]'
 VALTEST_ERROR = 'Error: No key with hash data'
 VALTEST_MSG_1 = 'Test folder path needed'
+VALTEST_NOMANIFEST = 'Test %s manifest was manipulated, It\'s not valid - Has to check [%s] [ \x1b[1;31mX\x1b[0m ]'
+VALTEST_NOVALID_FILES = 'Test %s was manipulated, It\'s not valid - Has to check [%s] [ \x1b[1;31mX\x1b[0m ]'
+VALTEST_TAMPERED = '    Tampered file : %s'
+VALTEST_MISSING = '    Missing file : %s'
+VALTEST_UNEXPECTED = '    File not in manifest : %s'
+VALTEST_BULK = 'Test IDs validated in [ %s ] (%d): valid (%d) not valid (%d)'
+
+#Benchmark Strings
+BENCH_DEF_TEST = 'testexample1'
+BENCH_DEF_ORDER = '1'
+BENCH_DEF_INSTANCES = '1,10,100'
+BENCH_LAUNCH_HEAD = '{:<12}{:>10}{:>12}{:>12}{:>12}'.format('Launch', 'Instances', 'Min (s)', 'Avg (s)', 'Max (s)')
+BENCH_LAUNCH_ROW = '%-12s%10d%12.4f%12.4f%12.4f'
+BENCH_LAUNCH_NORES = '%-12s%10d  No results'
+BENCH_JOURNAL_TEST = 'benchjournal'
+BENCH_JOURNAL_TC = 'record'
+BENCH_JOURNAL_INSTANCES = '200'
+BENCH_JOURNAL_RECORDS = '10'
+BENCH_JOURNAL_HEAD = '{:>10}{:>10}{:>10}{:>8}{:>12}{:>14}{:>12}'.format('Instances', 'Expected', 'Written', 'Lost', 'Write (s)', 'Records/s', 'Build (s)')
+BENCH_JOURNAL_ROW = '%10d%10d%10d%8d%12.4f%14.1f%12.4f'
+BENCH_JOURNAL_OK = 'No test case records lost'
+BENCH_JOURNAL_LOST = 'Error: test case records lost or repeated'
+BENCH_LOG_TEST = 'benchlog'
+BENCH_LOG_TC = 'lines'
+BENCH_LOG_LINE = 'Benchmark log line %d'
+BENCH_LOG_LINES = '20000'
+BENCH_LOG_DIRECT = 'direct'
+BENCH_LOG_BUFFERED = 'background'
+BENCH_LOG_HEAD = '{:<12}{:>10}{:>10}{:>12}{:>14}'.format('Writer', 'Lines', 'Written', 'Time (s)', 'Lines/s')
+BENCH_LOG_ROW = '%-12s%10d%10d%12.4f%14.1f'
+
+#Result Cache Strings
+RCACHE_HEAD = '{:<18}{:<10}{:<20}{:>6}  {:<28}'.format('Fingerprint', 'Test ID', 'Test', 'Order', 'Test case')
+RCACHE_ROW = '%-18s%-10s%-20s%6s  %-28s'
+RCACHE_MSG_1 = 'Result cache [ %s ] has (%d) test cases'
+RCACHE_MSG_2 = 'Result cache [ %s ] cleared'
+RCACHE_MSG_3 = 'Result cache [ %s ] rebuilt from [ %s ] with (%d) test cases'
+
+#Definition Index Strings
+DINDEX_HEAD = '{:<10}{:<30}{:<10}'.format('Type', 'Name', 'Source')
+DINDEX_ROW = '%-10s%-30s%-10s'
+DINDEX_INDEXED = 'indexed'
+DINDEX_IMPORT = 'import'
+DINDEX_MSG_1 = 'Definition index [ %s ] has (%d) definitions'
+DINDEX_MSG_2 = 'Definition index [ %s ] cleared'
+DINDEX_MSG_3 = 'Definition index [ %s ] rebuilt with (%d) definitions'
+
+#Results Index Strings
+RINDEX_LAST = 500
+RINDEX_ERROR = 'Error: results index [ %s ] not available: %s'
+RINDEX_MSG_1 = 'Results index [ %s ]'
+RINDEX_MSG_2 = 'Results index [ %s ] rebuilt from [ %s ] with (%d) runs, (%d) skipped'
+RINDEX_MSG_3 = 'Test case [ %s ] in (%d) runs of last (%d)'
+RINDEX_MSG_4 = 'Flaky test cases (%d) in last (%d) runs'
+RINDEX_MSG_5 = 'Slowest test cases (%d) in last (%d) runs'
+RINDEX_SKIP = 'Test ID [ %s ] not indexed: %s'
+RINDEX_TIME = 'Query time (%.1f) ms'
+RINDEX_SECS = '%.3f'
+RINDEX_COUNT_ROW = '    %-12s%10d'
+RINDEX_TREND_HEAD = '{:<10}{:<28}{:<20}{:>6}{:>12}{:>6}{:>11}{:>8}'.format('Test ID', 'Start', 'Test', 'Order', 'Secs', 'Exit', 'Instances', 'Failed')
+RINDEX_TREND_ROW = '%-10s%-28s%-20s%6s%12s%6s%11s%8s'
+RINDEX_TREND_SUM = 'Duration (s): mean (%.3f) min (%.3f) max (%.3f)'
+RINDEX_FLAKY_HEAD = '{:<20}{:>6}  {:<28}{:>6}{:>10}{:>7}  {:<12}'.format('Test', 'Order', 'Test case', 'Runs', 'Failures', 'Flips', 'Last failed')
+RINDEX_FLAKY_ROW = '%-20s%6s  %-28s%6d%10d%7d  %-12s'
+RINDEX_SLOW_HEAD = '{:<20}{:>6}  {:<28}{:>6}{:>12}{:>12}'.format('Test', 'Order', 'Test case', 'Runs', 'Mean (s)', 'Max (s)')
+RINDEX_SLOW_ROW = '%-20s%6s  %-28s%6d%12.3f%12.3f'
+
+#Show Report Strings
+SREPORT_HEAD = '{:<20}{:>6}  {:<28}{:>10}{:>8}{:>8}'.format('Test', 'Order', 'Test case', 'Instances', 'Passed', 'Failed')
+SREPORT_ROW = '%-20s%6s  %-28s%10d%8d%8d'
+SREPORT_MSG_1 = 'Test ID [ %s ] report (%s)'
+SREPORT_MSG_2 = 'Error: Test ID [ %s ] report not found in [ %s ]'
+SREPORT_MSG_3 = 'Test ID needed'
+SREPORT_RUNNING = 'running'
+SREPORT_FINISHED = 'finished'
+SREPORT_UNORDERED = '-'
+
+#Migrate Logs Strings
+MIGRATE_TMP_DIR = '%s/.%s.migrate'
+MIGRATE_SHARDED = 'sharded'
+MIGRATE_FLAT = 'flat'
+MIGRATE_NOPATH = 'Log path [ %s ] doesn\'t exist'
+MIGRATE_MSG_1 = 'Test ID [ %s ] moved: %s -> %s'
+MIGRATE_MSG_2 = 'Test ID [ %s ] not moved, folder exists: %s'
+MIGRATE_MSG_3 = 'Test IDs migrated to %s layout in [ %s ]: moved (%d) skipped (%d)'
+MIGRATE_MSG_4 = 'Set SW_LOGS_SHARDED = %d in config to create new Test IDs in %s layout'
+MIGRATE_MSG_5 = 'Test ID [ %s ] manifest written before move (checksum sums folder path)'
 
 #Shell TCP Strings
 TCP_CLI_SHELL_PROMPT = '(Device:%s) > '
@@ -116,6 +205,7 @@ TCP_CLI_MSG_8 = 'Client can\'t run. Server is running in this machine/device'
 TCP_CLI_MSG_9 = 'File trying to send doesn\'t exist'
 TCP_CLI_MSG_10 = 'Sending File (%d%%) - [%s]...'
 TCP_CLI_MSG_11 = 'Done File Sending'
+TCP_CLI_MSG_12 = 'Execution plan [ %s ] not valid: %s'
 
 
 #TCP  ETH P2P Server Strings
@@ -134,3 +224,4 @@ TCP_SRV_MSG_11 = 'Error [%s] : %s'
 TCP_SRV_MSG_12 = 'Server error: %s'
 TCP_SRV_MSG_13 = 'Restarting...'
 TCP_SRV_MSG_14 = 'Server can\'t run. A Server is running in this machine/device already'
+TCP_SRV_MSG_15 = 'RunPlan command malformed'
@@ -103,18 +103,32 @@ def MENU_RUNTEST_USAGE():
     print ('\nUsage: \n \
             \n run_test.py: \n \
             \n \
-            run_test.py --name=name --usermode=usermode --runmode=runmode --logdir=logpath --testid=custom_id\n \
+            run_test.py --name=name --usermode=usermode --runmode=runmode --logdir=logpath --testid=custom_id --launch=launchmode --workers=N --pacing=secs --jobs=N --admit --fail-fast --max-failures=N --incremental --device-id=id --rerun-failed=test_id --dry-run\n \
             \n \
                         name : name of test (required)\n \
                         usermode : user mode [ Automation | Shell | GUI ] (optional, Automation by default)\n \
-                        runmode : run mode [ Normal | Parallel ] (optional, Normal by default)\n \
+                        runmode : run mode [ Normal | Parallel ] (optional, Normal by default, Parallel launches longest test cases first by past runs)\n \
                         logdir : log path (optional, by default output/logs/...)\n\
                          testid : custom ID (optional, by default numeric auto-generated ID)\n\
+                        launch : launch mode [ Popen | Pool | ForkServer ] (optional, Popen by default)\n \
+                        workers : number of pool workers (optional, Pool launch mode, by default one per CPU)\n \
+                        pacing : fixed seconds between instances launch (optional, 0 by default, 1 as previous versions)\n \
+                        jobs : max. test case instances running at same time (optional, Parallel mode or test cases with depends_on)\n \
+                        admit : launch instances only if host can absorb them (CPUs, load average, memory) (optional)\n \
+                        fail-fast : stop at first failed test case instance (optional, definition fail_fast by default)\n \
+                        max-failures : stop after N failed test case instances (optional, definition max_failures by default)\n \
+                        incremental : test cases passed with same inputs (test files, args, device) are recorded from result cache without run (optional)\n \
+                        device-id : device identity string part of test case inputs (optional, incremental runs)\n \
+                        rerun-failed : run again only failed test cases of a Test ID with same parameters, as new Test ID (optional, name not required)\n \
+                        dry-run : print predicted durations of test cases and makespan (durations of past runs) without run them (optional)\n \
             \n \
             Example: \n \
             \n \
                 run test in Automation and Normal mode: \n \
                     run_test.py --name=testexample1 --usermode=Automation --runmode=Normal\n \
+            \n \
+                rerun failed test cases of Test ID 000012: \n \
+                    run_test.py --rerun-failed=000012\n \
             \n \
             Note:  Test definition will run and output logs will be stored in logdir path if it was set or stored into output/logs as Test ID folder with test results inside\n \
             ')
@@ -128,10 +142,12 @@ def MENU_RUNDEF_USAGE():
     print ('\nUsage: \n \
             \n run_definition.py: \n \
             \n \
-            run_test.py --def=name --runmode=runmode --logdir=logpath --testid=custom_id\n \
+            run_definition.py --plan=source --def=collection --save-plan=file --runmode=runmode --logdir=logpath --testid=custom_id\n \
             \n \
-                        def : string with collection (required)\n \
-                        runmode : run mode [ Normal | Parallel ] (optional, Normal by default)\n \
+                        plan : execution plan JSON file, - (standard input) or content hash of a plan in output/cache/plans (plan or def required)\n \
+                        def : string with collection (compatibility, plan or def required)\n \
+                        save-plan : write execution plan to file (- standard output) without run it (optional)\n \
+                        runmode : run mode [ Normal | Parallel ] (optional, Normal or plan run mode by default)\n \
                         logdir : log path (optional, by default output/logs/...)\n\
                          testid : custom ID (optional, by default numeric auto-generated ID)\n\
             \n \
@@ -139,6 +155,10 @@ def MENU_RUNDEF_USAGE():
             \n \
                 run custom test definition in Automation and Normal mode: \n \
                     run_definition.py --def="{\'type\': \'test\', \'name\': \'testexample1\', \'usermodes\': {\'automation\': 1, \'interactive\': 1, \'gui\': 1}, \'test_cases\': {1: {\'name\': \'firstmethod\', \'descp\': \'Method to test bla bla 1\', \'mode\': \'normal\', \'concurrency_inst\': 1, \'protected\': 0}, 2: {\'name\': \'secondmethod\', \'descp\': \'Method to test bla bla 2\', \'mode\': \'normal\', \'concurrency_inst\': 1, \'protected\': 0}}}" --runmode=Normal \n \
+            \n \
+                run execution plan from file and from standard input: \n \
+                    run_definition.py --plan=myplan.json\n \
+                    cat myplan.json | run_definition.py --plan=- --runmode=Parallel\n \
             \n \
             Note:  Test definition will run and output logs will be stored in logdir path if it was set or stored into output/logs as Test ID folder with test results inside\n \
             ')
@@ -152,18 +172,33 @@ def MENU_RUNPROFILE_USAGE():
     print ('\nUsage: \n \
             \n run_profile.py: \n \
             \n \
-            run_profile.py --name=name --usermode=usermode --runmode=runmode --logdir=logpath  --testid=custom_id\n \
+            run_profile.py --name=name --usermode=usermode --runmode=runmode --logdir=logpath  --testid=custom_id --launch=launchmode --workers=N --pacing=secs --jobs=N --ctests=N --admit --fail-fast --max-failures=N --incremental --device-id=id --rerun-failed=test_id --dry-run\n \
             \n \
                         name : name of test (required)\n \
                         usermode : user mode [ Automation | Shell | GUI ] (optional, Automation by default)\n \
-                        runmode : run mode [ Normal | Parallel ] (optional, Normal by default)\n \
+                        runmode : run mode [ Normal | Parallel ] (optional, Normal by default, Parallel launches longest test cases first by past runs)\n \
                         logdir : (optional, by default output/logs/...)\n\
                          testid : custom ID (optional, by default numeric auto-generated ID)\n\
+                        launch : launch mode [ Popen | Pool | ForkServer ] (optional, Popen by default)\n \
+                        workers : number of pool workers (optional, Pool launch mode, by default one per CPU)\n \
+                        pacing : fixed seconds between instances launch (optional, 0 by default, 1 as previous versions)\n \
+                        jobs : max. test case instances running at same time (optional, Parallel mode or test cases with depends_on)\n \
+                        ctests : max. independent tests running at same time (optional, profile concurrent_tests by default)\n \
+                        admit : launch instances only if host can absorb them (CPUs, load average, memory) (optional)\n \
+                        fail-fast : stop at first failed test case instance (optional, definition fail_fast by default)\n \
+                        max-failures : stop after N failed test case instances (optional, definition max_failures by default)\n \
+                        incremental : test cases passed with same inputs (test files, args, device) are recorded from result cache without run (optional)\n \
+                        device-id : device identity string part of test case inputs (optional, incremental runs)\n \
+                        rerun-failed : run again only failed test cases of a Test ID with same parameters, as new Test ID (optional, name not required)\n \
+                        dry-run : print predicted durations of test cases and makespan (durations of past runs) without run them (optional)\n \
             \n \
             Example: \n \
             \n \
                 run profile in Automation and Normal mode: \n \
                     run_profile.py --name=profileexample1 --usermode=Automation --runmode=Normal\n \
+            \n \
+                rerun failed test cases of Test ID 000012: \n \
+                    run_profile.py --rerun-failed=000012\n \
             \n \
             Note:  Profile definition will run and output logs will be stored in logdir path if it was set or stored into output/logs as Test ID folder with test results inside\n \
             ')
@@ -177,15 +212,18 @@ def MENU_GENBACK_USAGE():
     print ('\nUsage: \n \
             \n generate_backup.py: \n \
             \n \
-            generate_backup.py --testfolder=testid_folder --backupfolder=backup_folder\n \
+            generate_backup.py --testfolder=testid_folder --testid=id --logdir=logpath --backupfolder=backup_folder\n \
             \n \
                         testfolder : string with folder path\n \
+                        testid : Test ID resolved in log path, flat or sharded (instead of testfolder)\n \
+                        logdir : log path of testid option (optional, by default output/logs/...)\n \
                         backupfolder : string path to create backup\n \
             \n \
             Example: \n \
             \n \
                 Generate Backup for Test ID 000001: \n \
                     generate_backup.py --testfolder=/path/to/test/folder/000001 --backupfolder=/backup/path\n \
+                    generate_backup.py --testid=000001 --backupfolder=/backup/path\n \
             \n \
             ')
 
@@ -198,14 +236,197 @@ def MENU_VALTEST_USAGE():
     print ('\nUsage: \n \
             \n validate_test.py: \n \
             \n \
-            validate_test.py --testfolder=testid_folder\n \
+            validate_test.py --testfolder=testid_folder --testid=id --all --logdir=logpath --failfast\n \
             \n \
                         testfolder : string with folder path\n \
+                        testid : Test ID resolved in log path, flat or sharded (instead of testfolder)\n \
+                        all : validate all Test IDs in log path concurrently (instead of testfolder)\n \
+                        logdir : log path of testid and all options (optional, by default output/logs/...)\n \
+                        failfast : stop on first file not valid (optional)\n \
             \n \
             Example: \n \
             \n \
                 Validate results from Test ID 000001: \n \
                     validate_test.py --testfolder=/path/to/testid/000001\n \
+                    validate_test.py --testid=000001\n \
+            \n \
+                Validate all Test IDs: \n \
+                    validate_test.py --all\n \
+            ')
+
+#Benchmark Launch Usage instructions
+def MENU_BENCHLAUNCH_USAGE():
+    """
+    Benchmark Launch Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n bench_launch.py: \n \
+            \n \
+            bench_launch.py --name=name --order=order --instances=N,N\n \
+            \n \
+                        name : name of test (optional, testexample1 by default)\n \
+                        order : order of test case to launch (optional, 1 by default)\n \
+                        instances : list of instances to launch (optional, 1,10,100 by default)\n \
+            \n \
+            Example: \n \
+            \n \
+                Compare spawn to first test line latency of Popen and ForkServer launch modes: \n \
+                    bench_launch.py --name=testexample1 --order=1 --instances=1,10,100\n \
+            ')
+
+#Benchmark Journal Usage instructions
+def MENU_BENCHJOURNAL_USAGE():
+    """
+    Benchmark Journal Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n bench_journal.py: \n \
+            \n \
+            bench_journal.py --instances=N,N --records=N\n \
+            \n \
+                        instances : list of concurrent instances writing same Test ID (optional, 200 by default)\n \
+                        records : test case records written by each instance (optional, 10 by default)\n \
+            \n \
+            Example: \n \
+            \n \
+                Check no test case record is lost with 200 concurrent instances: \n \
+                    bench_journal.py --instances=200 --records=10\n \
+            ')
+
+#Benchmark Log Usage instructions
+def MENU_BENCHLOG_USAGE():
+    """
+    Benchmark Log Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n bench_log.py: \n \
+            \n \
+            bench_log.py --lines=N\n \
+            \n \
+                        lines : lines written to test case and Test ID log files (optional, 20000 by default)\n \
+            \n \
+            Example: \n \
+            \n \
+                Compare lines per second of direct and background log writers: \n \
+                    bench_log.py --lines=20000\n \
+            ')
+
+#Result Cache Usage instructions
+def MENU_RESULTCACHE_USAGE():
+    """
+    Result Cache Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n result_cache.py: \n \
+            \n \
+            result_cache.py --show --clear --rebuild --logdir=logpath\n \
+            \n \
+                        show : list test cases in result cache (default action)\n \
+                        clear : invalidate all test cases in result cache\n \
+                        rebuild : rebuild result cache from Test ID JSON reports of incremental runs\n \
+                        logdir : log path to rebuild from (optional, by default output/logs/...)\n \
+            \n \
+            Example: \n \
+            \n \
+                Invalidate cache after a device firmware update: \n \
+                    result_cache.py --clear\n \
+            ')
+
+#Definition Index Usage instructions
+def MENU_DEFINDEX_USAGE():
+    """
+    Definition Index Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n definition_index.py: \n \
+            \n \
+            definition_index.py --show --clear --rebuild\n \
+            \n \
+                        show : list definitions in index, indexed or imported (default action)\n \
+                        clear : invalidate all definitions in index\n \
+                        rebuild : parse again all tests and profiles\n \
+            \n \
+            Example: \n \
+            \n \
+                Parse again definitions after a framework update: \n \
+                    definition_index.py --rebuild\n \
+            ')
+
+#Results Index Usage instructions
+def MENU_RESULTSINDEX_USAGE():
+    """
+    Results Index Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n results_index.py: \n \
+            \n \
+            results_index.py --show --rebuild --logdir=logpath --trend=test_case --test=test --flaky --slowest=N --last=N\n \
+            \n \
+                        show : number of runs, tests, test cases and instances in results index (default action)\n \
+                        rebuild : index again Test ID JSON reports of log path\n \
+                        logdir : log path to rebuild from (optional, by default output/logs/...)\n \
+                        trend : duration and result of a test case run by run\n \
+                        test : test name of trend test case (optional, all tests by default)\n \
+                        flaky : test cases passed in some runs and failed in others\n \
+                        slowest : N slowest test cases by mean duration\n \
+                        last : last runs taken by queries (optional, by default 500)\n \
+            \n \
+            Example: \n \
+            \n \
+                Durations of secondmethod over last 500 runs: \n \
+                    results_index.py --trend=secondmethod\n \
+            \n \
+                Backfill index from existing Test IDs: \n \
+                    results_index.py --rebuild\n \
+            ')
+
+#Show Report Usage instructions
+def MENU_SHOWREPORT_USAGE():
+    """
+    Show Report Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n show_report.py: \n \
+            \n \
+            show_report.py --testid=ID --logdir=logpath --json\n \
+            \n \
+                        testid : Test ID to show (running or finished)\n \
+                        logdir : log path of Test ID (optional, by default output/logs/...)\n \
+                        json : print JSON report instead of results by test case (optional)\n \
+            \n \
+            Example: \n \
+            \n \
+                Show results so far of a Test ID still running: \n \
+                    show_report.py --testid=000012\n \
+            ')
+
+#Migrate Logs Usage instructions
+def MENU_MIGRATELOGS_USAGE():
+    """
+    Migrate Logs Script usage
+    """
+
+    print ('\nUsage: \n \
+            \n migrate_logs.py: \n \
+            \n \
+            migrate_logs.py --logdir=logpath --flat\n \
+            \n \
+                        logdir : log path to convert in place (optional, by default output/logs/...)\n \
+                        flat : convert to flat layout instead of sharded (optional)\n \
+            \n \
+            Example: \n \
+            \n \
+                Move Test IDs to sharded layout (logs/00/01/000123): \n \
+                    migrate_logs.py\n \
+            \n \
+            Note: no run may write to log path meanwhile, set SW_LOGS_SHARDED in config after it.\n \
             ')
 
 #Menu TCP ETH P2P server Usage
@@ -236,9 +457,10 @@ def MENU_ETHP2PCLIENT_USAGE():
     print ('\nUsage: \n \
             \n ethp2p_client.py: \n \
             \n \
-            ethp2p_client.py --command=\'command_str\' --verbose=value\n \
+            ethp2p_client.py --command=\'command_str\' --plan=file --verbose=value\n \
             \n \
                         command : cmd message in Server protocol\n \
+                        plan : execution plan JSON file to run in Server (RunPlan command)\n \
                         verbose : watch verbose mode [ 0 | 1 ]. 0: verbose at the end of execution, 1: in time\n \
             \n \
             Example: \n \
@@ -267,5 +489,9 @@ MENU_TCPSERVER_USAGE = '\n\
               RunProfile: run profile name definition\n \
             \n \
                   example: RunProfile:profileexample1\n \
+            \n \
+              RunPlan: run execution plan of size bytes sent after command line\n \
+            \n \
+                  example: RunPlan:2048 (ethp2p_client.py --plan=myplan.json)\n \
             \n \
             '
@@ -18,6 +18,8 @@ Command to validate a ID Test Folder results.
 from lib import common_lib as LIB
 from config import config as CFG
 from lib import sys_lib as SYS
+from lib import log_lib as LOG
+from lib import hash_lib as HASH
 from tools.toolslib import tools_lib as TOOLIB
 from tools.toolsconfig import tools_config as TOOLCFG
 
@@ -30,6 +32,7 @@ import sys
 import re
 import getopt
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 #==============================================================================
 #================================ FUNCTIONS ===================================
@@ -46,49 +49,81 @@ class ValidateTest(object):
     Class to validate sha 256 hash from test id folder
     """
 
-    def __init__(self, test_folder_path):
+    def __init__(self, test_folder_path, failfast = False, workers = None):
         """
         Constructor
 
         type: string
         @param: test_folder_path - full path of test id folder to backup
+
+        type: boolean
+        @param: failfast - stop on first file not valid (optional)
+
+        type: number
+        @param: workers - hashing threads (optional, CFG.SW_HASH_WORKERS by default)
         """
 
         self.test_folder = test_folder_path
+        self.failfast = failfast
+        self.workers = workers
 
     #==========================================================================
 
     def validate(self):
         """
-        Validate results from a Test ID folder
+        Validate results from a Test ID folder: each file against manifest
+        written with checksum, or folder checksum if there is no manifest.
         """
 
-        test_paths = self.test_folder.split('/')
-        test_id = test_paths[len(test_paths)-1]
+        test_id = os.path.basename(os.path.normpath(self.test_folder))
         pathfile = '%s/%s.json' % (self.test_folder, test_id)
         if not os.path.exists(self.test_folder):
             return SYS.EXIT_ERROR, TOOLCFG.VALTEST_NOFILE % self.test_folder
 
-        #Get current checksum
+        #Get checksum in json log
         try:
-            cmd = 'find %s -type f ! -name "%s.json" -exec shasum -a 256 {} \; | shasum -a 256' % (self.test_folder, test_id)
-            rout = SYS.execPlainCommand(cmd)
-
-            #Get checksum in json log
-            json_file = open(pathfile,'r')
-        except FileNotFoundError:
-            print (TOOLCFG.VALTEST_NOFILE % pathfile)
-            SYS.exitTC(SYS.EXIT_ERROR)
-
-        test_results = json.load(json_file)
-        try:
-            if rout == test_results['sha256sum']:
-                return SYS.EXIT_NO_ERROR, TOOLCFG.VALTEST_VALID % (test_id, rout, test_results['sha256sum'])
-            else:
-                return SYS.EXIT_ERROR, TOOLCFG.VALTEST_NOVALID % (test_id, rout, test_results['sha256sum'])
+            with open(pathfile,'r') as json_file:
+                test_results = json.load(json_file)
+            checksum = test_results['sha256sum']
+        except (OSError, ValueError):
+            return SYS.EXIT_ERROR, TOOLCFG.VALTEST_NOFILE % pathfile
         except KeyError:
             return SYS.EXIT_ERROR, TOOLCFG.VALTEST_ERROR
 
+        excludes = LOG.getReportFiles(test_id)
+        try:
+            with open('%s/%s' % (self.test_folder, excludes[2]), 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+
+        #Test ID without manifest, get current checksum
+        if not manifest:
+            rout = HASH.getFolderSHA256(self.test_folder, excludes, None, self.workers)
+            if rout == checksum:
+                return SYS.EXIT_NO_ERROR, TOOLCFG.VALTEST_VALID % (test_id, rout, checksum)
+            return SYS.EXIT_ERROR, TOOLCFG.VALTEST_NOVALID % (test_id, rout, checksum)
+
+        #Manifest is the one of checksum
+        try:
+            files = [(os.path.join(manifest['folder'], entry['path']), entry['size'], entry['sha256']) for entry in manifest['files']]
+            valid = manifest['sha256sum'] == checksum and HASH.getManifestSHA256(files) == checksum
+        except (KeyError, TypeError):
+            valid = False
+        if not valid:
+            return SYS.EXIT_ERROR, TOOLCFG.VALTEST_NOMANIFEST % (test_id, checksum)
+
+        tampered, missing, unexpected = HASH.checkManifest(self.test_folder, manifest, excludes, self.failfast, self.workers)
+        if not tampered and not missing and not unexpected:
+            return SYS.EXIT_NO_ERROR, TOOLCFG.VALTEST_VALID % (test_id, checksum, checksum)
+
+        rout = [TOOLCFG.VALTEST_NOVALID_FILES % (test_id, checksum)]
+        rout.extend(TOOLCFG.VALTEST_TAMPERED % path for path in tampered)
+        rout.extend(TOOLCFG.VALTEST_MISSING % path for path in missing)
+        rout.extend(TOOLCFG.VALTEST_UNEXPECTED % path for path in unexpected)
+
+        return SYS.EXIT_ERROR, '\n'.join(rout)
+
 #==============================================================================
 #================================ MAIN ========================================
 #==============================================================================
@@ -99,16 +134,28 @@ def main(args):
     """
 
     try:
-        opts, argmts = getopt.getopt(args[1:], 'ht', ['help', 'testfolder='])
+        opts, argmts = getopt.getopt(args[1:], 'htiafl', ['help', 'testfolder=', 'testid=', 'all', 'failfast', 'logdir='])
     except getopt.GetoptError as err:
         print(err)
         TOOLIB.MENU_VALTEST_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
     test_id_folder = ''
+    test_id = ''
+    bulk = False
+    failfast = False
+    logdir = CFG.SW_LOGS_PATH
     for option, value in opts:
         if option in ('--testfolder'):
             test_id_folder = value
+        elif option in ('--testid'):
+            test_id = value
+        elif option in ('--all'):
+            bulk = True
+        elif option in ('--failfast'):
+            failfast = True
+        elif option in ('--logdir'):
+            logdir = value
         elif option in ('-h', '--help'):
             TOOLIB.MENU_VALTEST_USAGE()
             SYS.exitTC(SYS.EXIT_NO_ERROR)
@@ -116,12 +163,34 @@ def main(args):
             print(TOOLCFG.RDEF_MSG_1)
             SYS.exitTC(SYS.EXIT_ERROR)
 
+    if bulk:
+        #Test IDs validated concurrently, files of each one in its thread
+        if not os.path.isdir(logdir):
+            print(TOOLCFG.VALTEST_NOFILE % logdir)
+            SYS.exitTC(SYS.EXIT_ERROR)
+        folders = [SYS.getTestIDPath(logdir, test_id) for test_id in SYS.listTestIDs(logdir)]
+        folders = [folder for folder in folders if os.path.isfile(LOG.JSON_REPORT_FILE % (folder, os.path.basename(folder)))]
+        rc = SYS.EXIT_NO_ERROR
+        invalid = 0
+        with ThreadPoolExecutor(max_workers=CFG.SW_HASH_WORKERS or None) as pool:
+            for vrc, rout in pool.map(lambda folder: ValidateTest(folder, failfast, 1).validate(), folders):
+                print(rout)
+                if vrc:
+                    rc = SYS.EXIT_ERROR
+                    invalid += 1
+        print(TOOLCFG.VALTEST_BULK % (logdir, len(folders), len(folders) - invalid, invalid))
+        SYS.exitTC(rc)
+
+    #Test ID folder resolved in logs path (flat or sharded layout)
+    if test_id:
+        test_id_folder = SYS.getTestIDPath(logdir, test_id)
+
     if not test_id_folder:
         print(TOOLCFG.VALTEST_MSG_1)
         TOOLIB.MENU_VALTEST_USAGE()
         SYS.exitTC(SYS.EXIT_ERROR)
 
-    vtest = ValidateTest(test_id_folder)
+    vtest = ValidateTest(test_id_folder, failfast)
     rc, rout = vtest.validate()
     print(rout)
     SYS.exitTC(rc)